@@ -0,0 +1 @@
+"""Benchmarks for Reflex Chakra components."""
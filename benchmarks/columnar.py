@@ -0,0 +1,104 @@
+"""Payload size and encode time of row-major and column-major table data.
+
+State deltas are serialized with reflex's `json_dumps`, so this measures the cost of
+sending the same table as `rows` (a list of row lists) and as `columns` (a dict of
+column name to values).
+
+Usage:
+
+```
+python -m benchmarks.columnar
+python -m benchmarks.columnar --rows 100000 --columns 20 --output columnar.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from reflex.utils.format import json_dumps
+
+
+def _time(fn, repeat: int) -> float:
+    """Time a function, keeping the best of several runs.
+
+    Args:
+        fn: The function to time.
+        repeat: The number of runs.
+
+    Returns:
+        The best wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(n_rows: int, n_columns: int, repeat: int = 3) -> dict:
+    """Compare both layouts for a table of mixed ints, floats and strings.
+
+    Args:
+        n_rows: The number of rows.
+        n_columns: The number of columns.
+        repeat: The number of runs per measurement.
+
+    Returns:
+        The size in bytes and encode time in seconds of each layout.
+    """
+    kinds = [
+        lambda i: i,
+        lambda i: i / 7,
+        lambda i: f"value {i}",
+    ]
+    columns = {
+        f"column_{c}": [kinds[c % len(kinds)](i) for i in range(n_rows)]
+        for c in range(n_columns)
+    }
+    rows = [list(row) for row in zip(*columns.values(), strict=True)]
+
+    results: dict = {"rows": n_rows, "columns": n_columns}
+    for layout, data in (("row_major", rows), ("column_major", columns)):
+        results[layout] = {
+            "bytes": len(json_dumps(data).encode()),
+            "encode": _time(lambda data=data: json_dumps(data), repeat),
+        }
+    results["bytes_saved"] = 1 - (
+        results["column_major"]["bytes"] / results["row_major"]["bytes"]
+    )
+    results["encode_saved"] = 1 - (
+        results["column_major"]["encode"] / results["row_major"]["encode"]
+    )
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.columns, args.repeat)
+    for layout in ("row_major", "column_major"):
+        print(  # noqa: T201
+            f"{layout:<13} {results[layout]['bytes']:>12,} bytes  "
+            f"{results[layout]['encode'] * 1000:9.1f}ms"
+        )
+    print(  # noqa: T201
+        f"column-major saves {results['bytes_saved']:.1%} of the payload "
+        f"and {results['encode_saved']:.1%} of the encode time"
+    )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Compile-time benchmarks for every exported reflex_chakra factory.
+
+Each factory is timed for `create()`, `render()`, `_get_all_imports()` and
+`_get_all_hooks()` at several tree sizes, and the results are written as JSON so
+they can be compared across commits.
+
+Usage:
+
+```
+python -m benchmarks.compile_time --output before.json
+python -m benchmarks.compile_time --output after.json --compare before.json
+python -m benchmarks.compile_time --sizes 10 1000 --only table accordion
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import reflex_chakra as rc
+from reflex_chakra import components
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SIZES = (10, 1_000, 50_000)
+
+# Phases timed for every tree, in order.
+PHASES = ("create", "render", "imports", "hooks")
+
+
+def _factory_kwargs() -> dict[str, Callable[[], dict[str, Any]]]:
+    """Get the kwargs required by factories that cannot be created bare.
+
+    Returns:
+        A mapping of factory name to a function building its kwargs.
+    """
+    return {
+        "card": lambda: {"body": "body"},
+        "form_control": lambda: {"input": rc.input()},
+        "icon": lambda: {"tag": "add"},
+        "radio": lambda: {"value": "value"},
+        "tag": lambda: {"label": "label"},
+        "tfoot": lambda: {"footers": ["a", "b", "c"]},
+        "thead": lambda: {"headers": ["a", "b", "c"]},
+    }
+
+
+def _builders() -> dict[str, tuple[int, Callable[[int], Any]]]:
+    """Get the builder-style creators that expand items into subtrees.
+
+    Returns:
+        A mapping of scenario name to the nodes produced per item and a function
+        creating the tree for a given number of items.
+    """
+    return {
+        # Tr + 3 Td per row.
+        "table(rows=...)": (
+            4,
+            lambda n: rc.table(
+                headers=["a", "b", "c"],
+                rows=[[i, f"row {i}", i * 2] for i in range(n)],
+            ),
+        ),
+        # AccordionItem, AccordionButton, AccordionIcon and AccordionPanel per item.
+        "accordion(items=...)": (
+            4,
+            lambda n: rc.accordion(
+                items=[(f"label {i}", f"panel {i}") for i in range(n)]
+            ),
+        ),
+        # MenuItem per item.
+        "menu(items=...)": (
+            1,
+            lambda n: rc.menu(
+                button=rc.menu_button("open"),
+                items=[f"item {i}" for i in range(n)],
+            ),
+        ),
+        # Step, StepIndicator, layout Box and StepSeparator per item.
+        "stepper(items=...)": (
+            4,
+            lambda n: rc.stepper(
+                items=[
+                    (rc.step_status(), rc.box(f"step {i}"), rc.step_separator())
+                    for i in range(n)
+                ]
+            ),
+        ),
+        # BreadcrumbItem and BreadcrumbLink per item.
+        "breadcrumb(items=...)": (
+            2,
+            lambda n: rc.breadcrumb(items=[(f"crumb {i}", f"/{i}") for i in range(n)]),
+        ),
+    }
+
+
+def _factories() -> dict[str, Callable[..., Any]]:
+    """Get every `X.create` alias exported by reflex_chakra.components.
+
+    Returns:
+        A mapping of the exported name to the factory.
+    """
+    # the components are loaded lazily, so resolve every exported name.
+    exported = {name: getattr(components, name) for name in sorted(components.__all__)}
+    return {
+        name: value
+        for name, value in exported.items()
+        if name[0].islower()
+        and getattr(value, "__name__", None) == "create"
+        and name != "component"
+    }
+
+
+def _flat(
+    factory: Callable[..., Any], make_kwargs: Callable[[], dict[str, Any]], n: int
+) -> Any:
+    """Create a Box holding `n` components from the same factory.
+
+    Args:
+        factory: The factory to call.
+        make_kwargs: A function building the kwargs for each call.
+        n: The number of components to create.
+
+    Returns:
+        The Box component.
+    """
+    return rc.box(*[factory(**make_kwargs()) for _ in range(n)])
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Time a function, keeping the best of several runs.
+
+    Args:
+        fn: The function to time.
+        repeat: The number of runs.
+
+    Returns:
+        The best wall time in seconds and the result of the last run.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _measure(build: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time every phase for the tree produced by `build`.
+
+    Args:
+        build: A function creating the root component of the tree.
+        repeat: The number of runs per phase.
+
+    Returns:
+        The best time in seconds for each phase.
+    """
+    create_time, root = _time(build, repeat)
+    timings = {"create": create_time}
+    timings["render"], _ = _time(root.render, repeat)
+    timings["imports"], _ = _time(root._get_all_imports, repeat)
+    timings["hooks"], _ = _time(root._get_all_hooks, repeat)
+    return timings
+
+
+def run(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    only: list[str] | None = None,
+    repeat: int = 3,
+) -> list[dict[str, Any]]:
+    """Run the benchmarks.
+
+    Plain factories are created `size - 1` times under a Box, builders are given
+    enough items to produce about `size` nodes.
+
+    Args:
+        sizes: The approximate number of nodes per tree.
+        only: Only run the factories or builders whose name contains one of these.
+        repeat: The number of runs per phase.
+
+    Returns:
+        One result per factory and size.
+    """
+    kwargs = _factory_kwargs()
+    scenarios: dict[str, tuple[int, Callable[[int], Any]]] = {
+        name: (1, functools.partial(_flat, factory, kwargs.get(name, dict)))
+        for name, factory in _factories().items()
+    }
+    scenarios.update(_builders())
+
+    results = []
+    for name, (nodes_per_item, build) in scenarios.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        for size in sizes:
+            items = max(1, (size - 1) // nodes_per_item)
+            result: dict[str, Any] = {"factory": name, "size": size}
+            try:
+                result.update(_measure(functools.partial(build, items), repeat))
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+            results.append(result)
+            _print_result(result)
+    return results
+
+
+def _print_result(result: dict[str, Any], baseline: dict[str, Any] | None = None):
+    """Print a single result line.
+
+    Args:
+        result: The result to print.
+        baseline: The matching result from a previous run, if any.
+    """
+    line = f"{result['factory']:<36} {result['size']:>7}"
+    if "error" in result:
+        print(f"{line}  {result['error']}")  # noqa: T201
+        return
+    for phase in PHASES:
+        cell = f"{phase}={result[phase] * 1000:9.2f}ms"
+        if baseline and baseline.get(phase):
+            cell += f" ({result[phase] / baseline[phase]:5.2f}x)"
+        line += f"  {cell}"
+    print(line)  # noqa: T201
+
+
+def compare(results: list[dict[str, Any]], baseline_path: Path):
+    """Print the results relative to a previous run.
+
+    Args:
+        results: The results of this run.
+        baseline_path: The JSON file written by a previous run.
+    """
+    baseline = {
+        (result["factory"], result["size"]): result
+        for result in json.loads(baseline_path.read_text())["results"]
+    }
+    print(f"\nCompared to {baseline_path}:")  # noqa: T201
+    for result in results:
+        _print_result(result, baseline.get((result["factory"], result["size"])))
+
+
+def _git_commit() -> str | None:
+    """Get the commit being benchmarked.
+
+    Returns:
+        The commit hash, or None outside of a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", help="Filter factories by name.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    parser.add_argument("--compare", type=Path, help="A previous JSON output.")
+    args = parser.parse_args()
+
+    output = args.output.resolve()
+    baseline = args.compare.resolve() if args.compare else None
+
+    # Creating chakra components copies assets into the working directory.
+    with tempfile.TemporaryDirectory() as cwd:
+        os.chdir(cwd)
+        results = run(tuple(args.sizes), args.only, args.repeat)
+
+    output.write_text(
+        json.dumps(
+            {
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "sizes": args.sizes,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    if baseline:
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Per-page report of the @chakra-ui/icons icons an app bundles.
+
+Run it from the directory of a Reflex app. For every page it lists the icons the
+page imports, which are the only icon modules the page needs from the library. With
+a production build (`reflex export --frontend-only --no-zip`), it also lists each
+JS chunk of the build that contains icons, with its size and the icons it contains,
+so the chunks can be checked against the pages' icons.
+
+Usage:
+
+```
+cd my_app
+python -m benchmarks.icon_bundle
+python -m benchmarks.icon_bundle --build-dir .web/build/client --output icons.json
+```
+
+(with the repository root on `PYTHONPATH`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import re
+from pathlib import Path
+
+from reflex.components.component import Component
+from reflex.utils import prerequisites
+
+from reflex_chakra.components.media.icon import ICON_LIST, ICON_TAGS, get_icon_names
+
+# the icons set their display name to their export name, e.g. "AddIcon".
+ICON_DISPLAY_NAME = re.compile(
+    r"[\"'`](" + "|".join(sorted(ICON_TAGS.values())) + r")[\"'`]"
+)
+
+
+def page_icons() -> dict[str, list[str]]:
+    """Get the icons imported by each page of the app in the working directory.
+
+    Returns:
+        The icon names of each route.
+    """
+    app = prerequisites.get_and_validate_app().app
+    pages = {}
+    for route, page in sorted(app._unevaluated_pages.items()):
+        component = page.component
+        if not isinstance(component, Component):
+            component = component()
+        if isinstance(component, Component):
+            pages[route] = get_icon_names(component)
+    return pages
+
+
+def chunk_icons(build_dir: Path) -> dict[str, dict]:
+    """Find the icons contained in each JS chunk of a production build.
+
+    Args:
+        build_dir: The directory of the built client.
+
+    Returns:
+        The size, gzipped size and icon names of each chunk containing icons.
+    """
+    names = {tag: name for name, tag in ICON_TAGS.items()}
+    chunks = {}
+    for path in sorted(build_dir.rglob("*.js")):
+        content = path.read_bytes()
+        icons = sorted(
+            {names[match] for match in ICON_DISPLAY_NAME.findall(content.decode())}
+        )
+        if icons:
+            chunks[str(path.relative_to(build_dir))] = {
+                "bytes": len(content),
+                "gzip_bytes": len(gzip.compress(content)),
+                "icons": icons,
+            }
+    return chunks
+
+
+def main():
+    """Print the report from the command line."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--build-dir", type=Path, default=Path(".web/build/client"))
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    report: dict = {"pages": page_icons()}
+    for route, icons in report["pages"].items():
+        print(  # noqa: T201
+            f"{route:<30} {len(icons):>3}/{len(ICON_LIST)} icons  {', '.join(icons)}"
+        )
+    if args.build_dir.is_dir():
+        report["chunks"] = chunk_icons(args.build_dir)
+        for chunk, info in report["chunks"].items():
+            print(  # noqa: T201
+                f"{chunk:<50} {info['bytes']:>9,} B  {info['gzip_bytes']:>8,} B gzip  "
+                f"{len(info['icons']):>3} icons"
+            )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Import time of reflex_chakra for an app using a handful of components.
+
+Each scenario runs in a fresh interpreter after `import reflex`, so only the cost
+added by reflex_chakra is counted. `lazy` accesses a few components the way an app
+does, `eager` imports every component, which is what `import reflex_chakra` used to
+do. The time is measured around the import rather than summed from
+`python -X importtime`, which does not log modules loaded with
+`importlib.import_module` (as lazy attributes are); run
+`python -X importtime -c "import reflex_chakra as rc; rc.box"` for the per-module
+breakdown of what it does log.
+
+Usage:
+
+```
+python -m benchmarks.import_time
+python -m benchmarks.import_time --repeat 10 --output import_time.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SCENARIOS = {
+    "lazy": "import reflex_chakra as rc; rc.box, rc.vstack, rc.button, rc.text, rc.heading",
+    "eager": "from reflex_chakra import *",
+}
+
+
+def _measure(code: str) -> dict:
+    """Import reflex, then time the code, in a fresh interpreter.
+
+    Args:
+        code: The code importing reflex_chakra.
+
+    Returns:
+        The number of modules imported by the code and its wall time in ms.
+    """
+    script = f"""
+import json, sys, time
+import reflex
+before = set(sys.modules)
+start = time.perf_counter()
+{code}
+print(json.dumps({{"modules": len(set(sys.modules) - before), "ms": (time.perf_counter() - start) * 1000}}))
+"""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def run(repeat: int = 5) -> dict:
+    """Measure every scenario, keeping the median of several runs.
+
+    Args:
+        repeat: The number of runs per scenario.
+
+    Returns:
+        The number of imported modules and the import time of each scenario.
+    """
+    results = {}
+    for scenario, code in SCENARIOS.items():
+        runs = [_measure(code) for _ in range(repeat)]
+        results[scenario] = {
+            "modules": runs[0]["modules"],
+            "ms": statistics.median(run["ms"] for run in runs),
+        }
+    results["saved"] = 1 - results["lazy"]["ms"] / results["eager"]["ms"]
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    for scenario in SCENARIOS:
+        print(  # noqa: T201
+            f"{scenario:<6} {results[scenario]['modules']:>4} modules  "
+            f"{results[scenario]['ms']:8.1f}ms"
+        )
+    print(f"lazy imports save {results['saved']:.1%} of the import time")  # noqa: T201
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
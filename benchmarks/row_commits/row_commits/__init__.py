@@ -0,0 +1 @@
+"""Benchmark app counting React commits of table row updates."""
@@ -0,0 +1,74 @@
+"""Count the React commits and render time of a one cell update in a 5k row table.
+
+Run with `reflex run` from this directory, open `/plain` and `/memoized`, click
+"Update one cell" a few times, then read `window.__commits` in the browser console.
+Each entry is one commit of the table subtree with its phase and `actualDuration`,
+the time React spent rendering the parts of the table that were not memoized.
+"""
+
+import reflex as rx
+
+import reflex_chakra as rc
+
+ROWS = 5_000
+COLUMNS = 5
+
+# record every commit of the table subtree in the browser.
+ON_RENDER = rx.Var(
+    "(id, phase, actualDuration) => "
+    "(window.__commits ??= []).push({ id, phase, actualDuration })"
+)
+
+
+class Profiler(rx.Component):
+    """React's Profiler, calling onRender after each commit of its children."""
+
+    library = "react"
+
+    tag = "Profiler"
+
+
+class RowsState(rx.State):
+    """A table with one frequently updated cell."""
+
+    rows: rx.Field[list[list]] = rx.field(
+        default_factory=lambda: [
+            [row, *(f"{row}:{column}" for column in range(1, COLUMNS))]
+            for row in range(ROWS)
+        ]
+    )
+
+    @rx.event
+    def update_cell(self):
+        """Update the second cell of the first row."""
+        self.rows[0][1] = f"{self.rows[0][1]}+"
+
+
+def table_page(memoize_rows: bool) -> rx.Component:
+    """Render the profiled table.
+
+    Args:
+        memoize_rows: Whether the rows are memoized.
+
+    Returns:
+        The page.
+    """
+    return rc.vstack(
+        rc.button("Update one cell", on_click=RowsState.update_cell),
+        Profiler.create(
+            rc.table(
+                rows=RowsState.rows,
+                memoize_rows=memoize_rows,
+                row_key=0 if memoize_rows else None,
+            ),
+            custom_attrs={
+                "id": "memoized" if memoize_rows else "plain",
+                "onRender": ON_RENDER,
+            },
+        ),
+    )
+
+
+app = rx.App()
+app.add_page(table_page(memoize_rows=False), route="/plain")
+app.add_page(table_page(memoize_rows=True), route="/memoized")
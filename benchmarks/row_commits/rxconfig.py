@@ -0,0 +1,5 @@
+"""Config of the row commits benchmark app."""  # noqa: INP001
+
+import reflex as rx
+
+config = rx.Config(app_name="row_commits")
@@ -0,0 +1,136 @@
+"""Events per second sent by a controlled text field while typing a paragraph.
+
+A paragraph is typed with keystroke intervals drawn around a typing speed, with
+longer pauses between words and sentences. Each scenario counts the on_change
+events the field sends to the backend: one per keystroke without debouncing, or one
+per pause longer than the debounce timeout, plus the flush when the field loses
+focus at the end. This follows the trailing debounce of react-debounce-input used by
+Input, TextArea and Editable, so it can be run without a browser.
+
+Usage:
+
+```
+python -m benchmarks.typing_events
+python -m benchmarks.typing_events --wpm 40 90 --timeouts 100 300 500 --output typing.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+from pathlib import Path
+
+PARAGRAPH = (
+    "The quarterly report is ready for review. Revenue grew in every region, "
+    "although shipping delays slowed the second month. Please check the totals in "
+    "the summary table, then leave your comments below so we can publish it on "
+    "Friday. Thanks to everyone who helped collect the numbers."
+)
+
+DEFAULT_WPM = (40, 70, 100)
+DEFAULT_TIMEOUTS = (100, 300, 500)
+
+
+def keystroke_times(text: str, wpm: int, seed: int = 0) -> list[float]:
+    """Simulate the time of each keystroke while typing a text.
+
+    Args:
+        text: The typed text.
+        wpm: The typing speed in words (of 5 characters) per minute.
+        seed: The seed of the random intervals.
+
+    Returns:
+        The time of each keystroke in milliseconds.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    interval = 60_000 / (wpm * 5)
+    times, now = [], 0.0
+    for char in text:
+        # spaces and sentence ends come with a pause to think about the next word.
+        pause = 4 if char in ".,;" else 1.8 if char == " " else 1
+        now += rng.lognormvariate(0, 0.35) * interval * pause
+        times.append(now)
+    return times
+
+
+def count_events(times: list[float], debounce_timeout: int | None) -> int:
+    """Count the on_change events sent for keystrokes, flushing on blur at the end.
+
+    Args:
+        times: The time of each keystroke in milliseconds.
+        debounce_timeout: The debounce timeout in milliseconds, or None to send every keystroke.
+
+    Returns:
+        The number of events.
+    """
+    if debounce_timeout is None:
+        return len(times)
+    # a pending value is sent whenever the next keystroke comes after the timeout.
+    sent = sum(
+        1
+        for before, after in itertools.pairwise(times)
+        if after - before >= debounce_timeout
+    )
+    return sent + 1
+
+
+def run(
+    wpms: tuple[int, ...] = DEFAULT_WPM,
+    timeouts: tuple[int, ...] = DEFAULT_TIMEOUTS,
+    text: str = PARAGRAPH,
+) -> list[dict]:
+    """Count the events of every scenario.
+
+    Args:
+        wpms: The typing speeds in words per minute.
+        timeouts: The debounce timeouts in milliseconds.
+        text: The typed text.
+
+    Returns:
+        The events and events per second of each typing speed and timeout.
+    """
+    results = []
+    for wpm in wpms:
+        times = keystroke_times(text, wpm)
+        seconds = times[-1] / 1000
+        for timeout in (None, *timeouts):
+            events = count_events(times, timeout)
+            results.append(
+                {
+                    "wpm": wpm,
+                    "debounce_timeout": timeout,
+                    "keystrokes": len(times),
+                    "seconds": seconds,
+                    "events": events,
+                    "events_per_second": events / seconds,
+                }
+            )
+    return results
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=(__doc__ or "").splitlines()[0])
+    parser.add_argument("--wpm", type=int, nargs="+", default=DEFAULT_WPM)
+    parser.add_argument("--timeouts", type=int, nargs="+", default=DEFAULT_TIMEOUTS)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = run(tuple(args.wpm), tuple(args.timeouts))
+    for result in results:
+        timeout = result["debounce_timeout"]
+        print(  # noqa: T201
+            f"{result['wpm']:>4} wpm  "
+            f"{'no debounce' if timeout is None else f'{timeout}ms debounce':<15} "
+            f"{result['events']:>4} events in {result['seconds']:5.1f}s  "
+            f"{result['events_per_second']:5.2f} events/s"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,18 @@
 """Chakra UI bindings for Reflex."""
 
-from .components import *
+from . import components
+
+_SUBMODULES: set[str] = {"components", "constants"}
+
+# re-export every component lazily, the same way the components package does.
+_SUBMOD_ATTRS: dict = {
+    "components": sorted(components._SUBMODULES),  # pyright: ignore[reportAttributeAccessIssue]
+    **{
+        f"components.{module}": attrs
+        for module, attrs in components._SUBMOD_ATTRS.items()  # pyright: ignore[reportAttributeAccessIssue]
+    },
+}
+
+__getattr__, __dir__, __all__ = components._attach(  # pyright: ignore[reportAttributeAccessIssue]
+    __name__, _SUBMODULES, _SUBMOD_ATTRS
+)
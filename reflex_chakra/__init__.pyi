@@ -0,0 +1,897 @@
+"""Stub file for reflex_chakra/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import components, constants
+from .components import (
+    datadisplay,
+    disclosure,
+    feedback,
+    forms,
+    layout,
+    media,
+    navigation,
+    overlay,
+    typography,
+)
+from .components.base import (
+    ChakraColorModeProvider,
+    ChakraComponent,
+    ChakraProvider,
+    ColorModeProviderAssetSync,
+    LiteralAlertDialogSize,
+    LiteralAlertVariant,
+    LiteralAvatarSize,
+    LiteralButtonSize,
+    LiteralButtonVariant,
+    LiteralCardVariant,
+    LiteralChakraDirection,
+    LiteralColorScheme,
+    LiteralDividerVariant,
+    LiteralDrawerSize,
+    LiteralHeadingSize,
+    LiteralImageLoading,
+    LiteralInputNumberMode,
+    LiteralInputVariant,
+    LiteralLanguage,
+    LiteralLazyBehavior,
+    LiteralMenuOption,
+    LiteralMenuStrategy,
+    LiteralPopOverTrigger,
+    LiteralSpinnerPlacement,
+    LiteralSpinnerSize,
+    LiteralStackDirection,
+    LiteralStatus,
+    LiteralTabsVariant,
+    LiteralTagAlign,
+    LiteralTagColorScheme,
+    LiteralTagSize,
+    LiteralTheme,
+    LiteralVariant,
+    chakra_color_mode_provider,
+    chakra_provider,
+    color_mode_provider_asset,
+    component,
+)
+from .components.datadisplay.badge import Badge, badge
+from .components.datadisplay.code import Code, code
+from .components.datadisplay.divider import Divider, divider
+from .components.datadisplay.feed import InfiniteFeed, infinite_feed
+from .components.datadisplay.keyboard_key import Kbd, kbd
+from .components.datadisplay.list import (
+    List,
+    ListItem,
+    OrderedList,
+    UnorderedList,
+    list_item,
+    ordered_list,
+    unordered_list,
+)
+from .components.datadisplay.list import _list as list
+from .components.datadisplay.paginated_table import PaginatedTable, paginated_table
+from .components.datadisplay.stat import (
+    Stat,
+    StatArrow,
+    StatGroup,
+    StatHelpText,
+    StatLabel,
+    StatNumber,
+    stat,
+    stat_arrow,
+    stat_group,
+    stat_help_text,
+    stat_label,
+    stat_number,
+)
+from .components.datadisplay.table import (
+    Table,
+    TableCaption,
+    TableContainer,
+    Tbody,
+    Td,
+    Tfoot,
+    Th,
+    Thead,
+    Tr,
+    table,
+    table_caption,
+    table_container,
+    tbody,
+    td,
+    tfoot,
+    th,
+    thead,
+    tr,
+)
+from .components.datadisplay.table_rows import (
+    append_table_rows,
+    delete_table_rows,
+    insert_table_rows,
+    update_table_cell,
+)
+from .components.datadisplay.tag import (
+    Tag,
+    TagCloseButton,
+    TagLabel,
+    TagLeftIcon,
+    TagRightIcon,
+    tag,
+    tag_close_button,
+    tag_label,
+    tag_left_icon,
+    tag_right_icon,
+)
+from .components.deferred import DeferredContent, deferred_content
+from .components.disclosure.accordion import (
+    Accordion,
+    AccordionButton,
+    AccordionIcon,
+    AccordionItem,
+    AccordionPanel,
+    LazyAccordionPanel,
+    accordion,
+    accordion_button,
+    accordion_icon,
+    accordion_item,
+    accordion_panel,
+    lazy_accordion_panel,
+)
+from .components.disclosure.tabs import (
+    DeferredTabPanel,
+    Tab,
+    TabList,
+    TabPanel,
+    TabPanels,
+    Tabs,
+    deferred_tab_panel,
+    tab,
+    tab_list,
+    tab_panel,
+    tab_panels,
+    tabs,
+)
+from .components.disclosure.transition import (
+    Collapse,
+    Fade,
+    ScaleFade,
+    Slide,
+    SlideFade,
+    collapse,
+    fade,
+    scale_fade,
+    slide,
+    slide_fade,
+)
+from .components.disclosure.visuallyhidden import VisuallyHidden, visually_hidden
+from .components.feedback.alert import (
+    Alert,
+    AlertDescription,
+    AlertIcon,
+    AlertTitle,
+    alert,
+    alert_description,
+    alert_icon,
+    alert_title,
+)
+from .components.feedback.circularprogress import (
+    CircularProgress,
+    CircularProgressLabel,
+    circular_progress,
+    circular_progress_label,
+)
+from .components.feedback.progress import Progress, progress
+from .components.feedback.skeleton import (
+    Skeleton,
+    SkeletonCircle,
+    SkeletonText,
+    skeleton,
+    skeleton_circle,
+    skeleton_text,
+)
+from .components.feedback.spinner import Spinner, spinner
+from .components.forms.autocomplete import Autocomplete, autocomplete
+from .components.forms.button import Button, ButtonGroup, button, button_group
+from .components.forms.checkbox import Checkbox, CheckboxGroup, checkbox, checkbox_group
+from .components.forms.colormodeswitch import (
+    ColorModeButton,
+    ColorModeScript,
+    ColorModeSwitch,
+    color_mode_button,
+    color_mode_switch,
+)
+from .components.forms.date_picker import DatePicker, date_picker
+from .components.forms.date_time_picker import DateTimePicker, date_time_picker
+from .components.forms.editable import (
+    Editable,
+    EditableInput,
+    EditablePreview,
+    EditableTextarea,
+    editable,
+    editable_input,
+    editable_preview,
+    editable_textarea,
+)
+from .components.forms.email import Email, email
+from .components.forms.form import (
+    Form,
+    FormControl,
+    FormErrorMessage,
+    FormHelperText,
+    FormLabel,
+    form,
+    form_control,
+    form_error_message,
+    form_helper_text,
+    form_label,
+)
+from .components.forms.iconbutton import IconButton, icon_button
+from .components.forms.input import (
+    Input,
+    InputGroup,
+    InputLeftAddon,
+    InputLeftElement,
+    InputRightAddon,
+    InputRightElement,
+    input,
+    input_group,
+    input_left_addon,
+    input_left_element,
+    input_right_addon,
+    input_right_element,
+)
+from .components.forms.numberinput import (
+    NumberDecrementStepper,
+    NumberIncrementStepper,
+    NumberInput,
+    NumberInputField,
+    NumberInputStepper,
+    number_decrement_stepper,
+    number_increment_stepper,
+    number_input,
+    number_input_field,
+    number_input_stepper,
+)
+from .components.forms.password import Password, password
+from .components.forms.pininput import (
+    PinInput,
+    PinInputField,
+    pin_input,
+    pin_input_field,
+)
+from .components.forms.radio import Radio, RadioGroup, radio, radio_group
+from .components.forms.rangeslider import (
+    RangeSlider,
+    RangeSliderFilledTrack,
+    RangeSliderThumb,
+    RangeSliderTrack,
+    range_slider,
+    range_slider_filled_track,
+    range_slider_thumb,
+    range_slider_track,
+)
+from .components.forms.select import Option, Select, option, select
+from .components.forms.slider import (
+    Slider,
+    SliderFilledTrack,
+    SliderMark,
+    SliderThumb,
+    SliderTrack,
+    slider,
+    slider_filled_track,
+    slider_mark,
+    slider_thumb,
+    slider_track,
+)
+from .components.forms.switch import Switch, switch
+from .components.forms.textarea import TextArea, text_area
+from .components.forms.time_picker import TimePicker, time_picker
+from .components.forms.validation import ValidationRule
+from .components.forms.virtual_select import VirtualSelect, virtual_select
+from .components.layout.aspect_ratio import AspectRatio, aspect_ratio
+from .components.layout.box import Box, box
+from .components.layout.card import (
+    Card,
+    CardBody,
+    CardFooter,
+    CardHeader,
+    card,
+    card_body,
+    card_footer,
+    card_header,
+)
+from .components.layout.center import Center, Circle, Square, center, circle, square
+from .components.layout.container import Container, container
+from .components.layout.flex import Flex, flex
+from .components.layout.grid import (
+    Grid,
+    GridItem,
+    ResponsiveGrid,
+    grid,
+    grid_item,
+    responsive_grid,
+)
+from .components.layout.spacer import Spacer, spacer
+from .components.layout.stack import Hstack, Stack, Vstack, hstack, stack, vstack
+from .components.layout.wrap import Wrap, WrapItem, wrap, wrap_item
+from .components.media.avatar import (
+    Avatar,
+    AvatarBadge,
+    AvatarGroup,
+    avatar,
+    avatar_badge,
+    avatar_group,
+)
+from .components.media.icon import Icon, icon
+from .components.media.image import Image, image
+from .components.navigation.breadcrumb import (
+    Breadcrumb,
+    BreadcrumbItem,
+    BreadcrumbLink,
+    BreadcrumbSeparator,
+    breadcrumb,
+    breadcrumb_item,
+    breadcrumb_link,
+    breadcrumb_separator,
+)
+from .components.navigation.link import Link, link
+from .components.navigation.linkoverlay import (
+    LinkBox,
+    LinkOverlay,
+    link_box,
+    link_overlay,
+)
+from .components.navigation.stepper import (
+    Step,
+    StepDescription,
+    StepIcon,
+    StepIndicator,
+    StepNumber,
+    Stepper,
+    StepSeparator,
+    StepStatus,
+    StepTitle,
+    step,
+    step_description,
+    step_icon,
+    step_indicator,
+    step_number,
+    step_separator,
+    step_status,
+    step_title,
+    stepper,
+)
+from .components.overlay.alertdialog import (
+    AlertDialog,
+    AlertDialogBody,
+    AlertDialogContent,
+    AlertDialogFooter,
+    AlertDialogHeader,
+    AlertDialogOverlay,
+    alert_dialog,
+    alert_dialog_body,
+    alert_dialog_content,
+    alert_dialog_footer,
+    alert_dialog_header,
+    alert_dialog_overlay,
+)
+from .components.overlay.drawer import (
+    Drawer,
+    DrawerBody,
+    DrawerCloseButton,
+    DrawerContent,
+    DrawerFooter,
+    DrawerHeader,
+    DrawerOverlay,
+    drawer,
+    drawer_body,
+    drawer_close_button,
+    drawer_content,
+    drawer_footer,
+    drawer_header,
+    drawer_overlay,
+)
+from .components.overlay.menu import (
+    Menu,
+    MenuButton,
+    MenuDivider,
+    MenuGroup,
+    MenuItem,
+    MenuItemOption,
+    MenuList,
+    MenuOptionGroup,
+    menu,
+    menu_button,
+    menu_divider,
+    menu_group,
+    menu_item,
+    menu_item_option,
+    menu_list,
+    menu_option_group,
+)
+from .components.overlay.modal import (
+    Modal,
+    ModalBody,
+    ModalCloseButton,
+    ModalContent,
+    ModalFooter,
+    ModalHeader,
+    ModalOverlay,
+    modal,
+    modal_body,
+    modal_close_button,
+    modal_content,
+    modal_footer,
+    modal_header,
+    modal_overlay,
+)
+from .components.overlay.popover import (
+    Popover,
+    PopoverAnchor,
+    PopoverArrow,
+    PopoverBody,
+    PopoverCloseButton,
+    PopoverContent,
+    PopoverFooter,
+    PopoverHeader,
+    PopoverTrigger,
+    popover,
+    popover_anchor,
+    popover_arrow,
+    popover_body,
+    popover_close_button,
+    popover_content,
+    popover_footer,
+    popover_header,
+    popover_trigger,
+)
+from .components.overlay.tooltip import Tooltip, tooltip
+from .components.typography.heading import Heading, heading
+from .components.typography.highlight import Highlight, highlight
+from .components.typography.span import Span, span
+from .components.typography.text import Text, text
+
+__all__ = [
+    "Accordion",
+    "AccordionButton",
+    "AccordionIcon",
+    "AccordionItem",
+    "AccordionPanel",
+    "Alert",
+    "AlertDescription",
+    "AlertDialog",
+    "AlertDialogBody",
+    "AlertDialogContent",
+    "AlertDialogFooter",
+    "AlertDialogHeader",
+    "AlertDialogOverlay",
+    "AlertIcon",
+    "AlertTitle",
+    "AspectRatio",
+    "Autocomplete",
+    "Avatar",
+    "AvatarBadge",
+    "AvatarGroup",
+    "Badge",
+    "Box",
+    "Breadcrumb",
+    "BreadcrumbItem",
+    "BreadcrumbLink",
+    "BreadcrumbSeparator",
+    "Button",
+    "ButtonGroup",
+    "Card",
+    "CardBody",
+    "CardFooter",
+    "CardHeader",
+    "Center",
+    "ChakraColorModeProvider",
+    "ChakraComponent",
+    "ChakraProvider",
+    "Checkbox",
+    "CheckboxGroup",
+    "Circle",
+    "CircularProgress",
+    "CircularProgressLabel",
+    "Code",
+    "Collapse",
+    "ColorModeButton",
+    "ColorModeProviderAssetSync",
+    "ColorModeScript",
+    "ColorModeSwitch",
+    "Container",
+    "DatePicker",
+    "DateTimePicker",
+    "DeferredContent",
+    "DeferredTabPanel",
+    "Divider",
+    "Drawer",
+    "DrawerBody",
+    "DrawerCloseButton",
+    "DrawerContent",
+    "DrawerFooter",
+    "DrawerHeader",
+    "DrawerOverlay",
+    "Editable",
+    "EditableInput",
+    "EditablePreview",
+    "EditableTextarea",
+    "Email",
+    "Fade",
+    "Flex",
+    "Form",
+    "FormControl",
+    "FormErrorMessage",
+    "FormHelperText",
+    "FormLabel",
+    "Grid",
+    "GridItem",
+    "Heading",
+    "Highlight",
+    "Hstack",
+    "Icon",
+    "IconButton",
+    "Image",
+    "InfiniteFeed",
+    "Input",
+    "InputGroup",
+    "InputLeftAddon",
+    "InputLeftElement",
+    "InputRightAddon",
+    "InputRightElement",
+    "Kbd",
+    "LazyAccordionPanel",
+    "Link",
+    "LinkBox",
+    "LinkOverlay",
+    "List",
+    "ListItem",
+    "LiteralAlertDialogSize",
+    "LiteralAlertVariant",
+    "LiteralAvatarSize",
+    "LiteralButtonSize",
+    "LiteralButtonVariant",
+    "LiteralCardVariant",
+    "LiteralChakraDirection",
+    "LiteralColorScheme",
+    "LiteralDividerVariant",
+    "LiteralDrawerSize",
+    "LiteralHeadingSize",
+    "LiteralImageLoading",
+    "LiteralInputNumberMode",
+    "LiteralInputVariant",
+    "LiteralLanguage",
+    "LiteralLazyBehavior",
+    "LiteralMenuOption",
+    "LiteralMenuStrategy",
+    "LiteralPopOverTrigger",
+    "LiteralSpinnerPlacement",
+    "LiteralSpinnerSize",
+    "LiteralStackDirection",
+    "LiteralStatus",
+    "LiteralTabsVariant",
+    "LiteralTagAlign",
+    "LiteralTagColorScheme",
+    "LiteralTagSize",
+    "LiteralTheme",
+    "LiteralVariant",
+    "Menu",
+    "MenuButton",
+    "MenuDivider",
+    "MenuGroup",
+    "MenuItem",
+    "MenuItemOption",
+    "MenuList",
+    "MenuOptionGroup",
+    "Modal",
+    "ModalBody",
+    "ModalCloseButton",
+    "ModalContent",
+    "ModalFooter",
+    "ModalHeader",
+    "ModalOverlay",
+    "NumberDecrementStepper",
+    "NumberIncrementStepper",
+    "NumberInput",
+    "NumberInputField",
+    "NumberInputStepper",
+    "Option",
+    "OrderedList",
+    "PaginatedTable",
+    "Password",
+    "PinInput",
+    "PinInputField",
+    "Popover",
+    "PopoverAnchor",
+    "PopoverArrow",
+    "PopoverBody",
+    "PopoverCloseButton",
+    "PopoverContent",
+    "PopoverFooter",
+    "PopoverHeader",
+    "PopoverTrigger",
+    "Progress",
+    "Radio",
+    "RadioGroup",
+    "RangeSlider",
+    "RangeSliderFilledTrack",
+    "RangeSliderThumb",
+    "RangeSliderTrack",
+    "ResponsiveGrid",
+    "ScaleFade",
+    "Select",
+    "Skeleton",
+    "SkeletonCircle",
+    "SkeletonText",
+    "Slide",
+    "SlideFade",
+    "Slider",
+    "SliderFilledTrack",
+    "SliderMark",
+    "SliderThumb",
+    "SliderTrack",
+    "Spacer",
+    "Span",
+    "Spinner",
+    "Square",
+    "Stack",
+    "Stat",
+    "StatArrow",
+    "StatGroup",
+    "StatHelpText",
+    "StatLabel",
+    "StatNumber",
+    "Step",
+    "StepDescription",
+    "StepIcon",
+    "StepIndicator",
+    "StepNumber",
+    "StepSeparator",
+    "StepStatus",
+    "StepTitle",
+    "Stepper",
+    "Switch",
+    "Tab",
+    "TabList",
+    "TabPanel",
+    "TabPanels",
+    "Table",
+    "TableCaption",
+    "TableContainer",
+    "Tabs",
+    "Tag",
+    "TagCloseButton",
+    "TagLabel",
+    "TagLeftIcon",
+    "TagRightIcon",
+    "Tbody",
+    "Td",
+    "Text",
+    "TextArea",
+    "Tfoot",
+    "Th",
+    "Thead",
+    "TimePicker",
+    "Tooltip",
+    "Tr",
+    "UnorderedList",
+    "ValidationRule",
+    "VirtualSelect",
+    "VisuallyHidden",
+    "Vstack",
+    "Wrap",
+    "WrapItem",
+    "accordion",
+    "accordion_button",
+    "accordion_icon",
+    "accordion_item",
+    "accordion_panel",
+    "alert",
+    "alert_description",
+    "alert_dialog",
+    "alert_dialog_body",
+    "alert_dialog_content",
+    "alert_dialog_footer",
+    "alert_dialog_header",
+    "alert_dialog_overlay",
+    "alert_icon",
+    "alert_title",
+    "append_table_rows",
+    "aspect_ratio",
+    "autocomplete",
+    "avatar",
+    "avatar_badge",
+    "avatar_group",
+    "badge",
+    "box",
+    "breadcrumb",
+    "breadcrumb_item",
+    "breadcrumb_link",
+    "breadcrumb_separator",
+    "button",
+    "button_group",
+    "card",
+    "card_body",
+    "card_footer",
+    "card_header",
+    "center",
+    "chakra_color_mode_provider",
+    "chakra_provider",
+    "checkbox",
+    "checkbox_group",
+    "circle",
+    "circular_progress",
+    "circular_progress_label",
+    "code",
+    "collapse",
+    "color_mode_button",
+    "color_mode_provider_asset",
+    "color_mode_switch",
+    "component",
+    "components",
+    "constants",
+    "container",
+    "datadisplay",
+    "date_picker",
+    "date_time_picker",
+    "deferred_content",
+    "deferred_tab_panel",
+    "delete_table_rows",
+    "disclosure",
+    "divider",
+    "drawer",
+    "drawer_body",
+    "drawer_close_button",
+    "drawer_content",
+    "drawer_footer",
+    "drawer_header",
+    "drawer_overlay",
+    "editable",
+    "editable_input",
+    "editable_preview",
+    "editable_textarea",
+    "email",
+    "fade",
+    "feedback",
+    "flex",
+    "form",
+    "form_control",
+    "form_error_message",
+    "form_helper_text",
+    "form_label",
+    "forms",
+    "grid",
+    "grid_item",
+    "heading",
+    "highlight",
+    "hstack",
+    "icon",
+    "icon_button",
+    "image",
+    "infinite_feed",
+    "input",
+    "input_group",
+    "input_left_addon",
+    "input_left_element",
+    "input_right_addon",
+    "input_right_element",
+    "insert_table_rows",
+    "kbd",
+    "layout",
+    "lazy_accordion_panel",
+    "link",
+    "link_box",
+    "link_overlay",
+    "list",
+    "list_item",
+    "media",
+    "menu",
+    "menu_button",
+    "menu_divider",
+    "menu_group",
+    "menu_item",
+    "menu_item_option",
+    "menu_list",
+    "menu_option_group",
+    "modal",
+    "modal_body",
+    "modal_close_button",
+    "modal_content",
+    "modal_footer",
+    "modal_header",
+    "modal_overlay",
+    "navigation",
+    "number_decrement_stepper",
+    "number_increment_stepper",
+    "number_input",
+    "number_input_field",
+    "number_input_stepper",
+    "option",
+    "ordered_list",
+    "overlay",
+    "paginated_table",
+    "password",
+    "pin_input",
+    "pin_input_field",
+    "popover",
+    "popover_anchor",
+    "popover_arrow",
+    "popover_body",
+    "popover_close_button",
+    "popover_content",
+    "popover_footer",
+    "popover_header",
+    "popover_trigger",
+    "progress",
+    "radio",
+    "radio_group",
+    "range_slider",
+    "range_slider_filled_track",
+    "range_slider_thumb",
+    "range_slider_track",
+    "responsive_grid",
+    "scale_fade",
+    "select",
+    "skeleton",
+    "skeleton_circle",
+    "skeleton_text",
+    "slide",
+    "slide_fade",
+    "slider",
+    "slider_filled_track",
+    "slider_mark",
+    "slider_thumb",
+    "slider_track",
+    "spacer",
+    "span",
+    "spinner",
+    "square",
+    "stack",
+    "stat",
+    "stat_arrow",
+    "stat_group",
+    "stat_help_text",
+    "stat_label",
+    "stat_number",
+    "step",
+    "step_description",
+    "step_icon",
+    "step_indicator",
+    "step_number",
+    "step_separator",
+    "step_status",
+    "step_title",
+    "stepper",
+    "switch",
+    "tab",
+    "tab_list",
+    "tab_panel",
+    "tab_panels",
+    "table",
+    "table_caption",
+    "table_container",
+    "tabs",
+    "tag",
+    "tag_close_button",
+    "tag_label",
+    "tag_left_icon",
+    "tag_right_icon",
+    "tbody",
+    "td",
+    "text",
+    "text_area",
+    "tfoot",
+    "th",
+    "thead",
+    "time_picker",
+    "tooltip",
+    "tr",
+    "typography",
+    "unordered_list",
+    "update_table_cell",
+    "virtual_select",
+    "visually_hidden",
+    "vstack",
+    "wrap",
+    "wrap_item",
+]
@@ -1,203 +1,483 @@
 """Chakra components."""
 
-from reflex.components.component import Component
+import importlib
 
-from .base import *
-from .datadisplay import *
-from .disclosure import *
-from .feedback import *
-from .forms import *
-from .layout import *
-from .media import *
-from .navigation import *
-from .overlay import *
-from .typography import *
+from reflex.utils import lazy_loader
 
-accordion = Accordion.create
-accordion_button = AccordionButton.create
-accordion_icon = AccordionIcon.create
-accordion_item = AccordionItem.create
-accordion_panel = AccordionPanel.create
-alert = Alert.create
-alert_description = AlertDescription.create
-alert_dialog = AlertDialog.create
-alert_dialog_body = AlertDialogBody.create
-alert_dialog_content = AlertDialogContent.create
-alert_dialog_footer = AlertDialogFooter.create
-alert_dialog_header = AlertDialogHeader.create
-alert_dialog_overlay = AlertDialogOverlay.create
-alert_icon = AlertIcon.create
-alert_title = AlertTitle.create
-aspect_ratio = AspectRatio.create
-avatar = Avatar.create
-avatar_badge = AvatarBadge.create
-avatar_group = AvatarGroup.create
-badge = Badge.create
-box = Box.create
-breadcrumb = Breadcrumb.create
-breadcrumb_item = BreadcrumbItem.create
-breadcrumb_link = BreadcrumbLink.create
-breadcrumb_separator = BreadcrumbSeparator.create
-button = Button.create
-button_group = ButtonGroup.create
-card = Card.create
-card_body = CardBody.create
-card_footer = CardFooter.create
-card_header = CardHeader.create
-center = Center.create
-checkbox = Checkbox.create
-checkbox_group = CheckboxGroup.create
-circle = Circle.create
-circular_progress = CircularProgress.create
-circular_progress_label = CircularProgressLabel.create
-code = Code.create
-collapse = Collapse.create
-color_mode_button = ColorModeButton.create
-color_mode_switch = ColorModeSwitch.create
-component = Component.create
-container = Container.create
-date_picker = DatePicker.create
-date_time_picker = DateTimePicker.create
-divider = Divider.create
-drawer = Drawer.create
-drawer_body = DrawerBody.create
-drawer_close_button = DrawerCloseButton.create
-drawer_content = DrawerContent.create
-drawer_footer = DrawerFooter.create
-drawer_header = DrawerHeader.create
-drawer_overlay = DrawerOverlay.create
-editable = Editable.create
-editable_input = EditableInput.create
-editable_preview = EditablePreview.create
-editable_textarea = EditableTextarea.create
-email = Email.create
-fade = Fade.create
-flex = Flex.create
-form = Form.create
-form_control = FormControl.create
-form_error_message = FormErrorMessage.create
-form_helper_text = FormHelperText.create
-form_label = FormLabel.create
-grid = Grid.create
-grid_item = GridItem.create
-heading = Heading.create
-highlight = Highlight.create
-hstack = Hstack.create
-icon = Icon.create
-icon_button = IconButton.create
-image = Image.create
-input = Input.create
-input_group = InputGroup.create
-input_left_addon = InputLeftAddon.create
-input_left_element = InputLeftElement.create
-input_right_addon = InputRightAddon.create
-input_right_element = InputRightElement.create
-kbd = Kbd.create
-link = Link.create
-link_box = LinkBox.create
-link_overlay = LinkOverlay.create
-list = List.create
-list_item = ListItem.create
-menu = Menu.create
-menu_button = MenuButton.create
-menu_divider = MenuDivider.create
-menu_group = MenuGroup.create
-menu_item = MenuItem.create
-menu_item_option = MenuItemOption.create
-menu_list = MenuList.create
-menu_option_group = MenuOptionGroup.create
-modal = Modal.create
-modal_body = ModalBody.create
-modal_close_button = ModalCloseButton.create
-modal_content = ModalContent.create
-modal_footer = ModalFooter.create
-modal_header = ModalHeader.create
-modal_overlay = ModalOverlay.create
-number_decrement_stepper = NumberDecrementStepper.create
-number_increment_stepper = NumberIncrementStepper.create
-number_input = NumberInput.create
-number_input_field = NumberInputField.create
-number_input_stepper = NumberInputStepper.create
-option = Option.create
-ordered_list = OrderedList.create
-password = Password.create
-pin_input = PinInput.create
-pin_input_field = PinInputField.create
-popover = Popover.create
-popover_anchor = PopoverAnchor.create
-popover_arrow = PopoverArrow.create
-popover_body = PopoverBody.create
-popover_close_button = PopoverCloseButton.create
-popover_content = PopoverContent.create
-popover_footer = PopoverFooter.create
-popover_header = PopoverHeader.create
-popover_trigger = PopoverTrigger.create
-progress = Progress.create
-radio = Radio.create
-radio_group = RadioGroup.create
-range_slider = RangeSlider.create
-range_slider_filled_track = RangeSliderFilledTrack.create
-range_slider_thumb = RangeSliderThumb.create
-range_slider_track = RangeSliderTrack.create
-responsive_grid = ResponsiveGrid.create
-scale_fade = ScaleFade.create
-select = Select.create
-skeleton = Skeleton.create
-skeleton_circle = SkeletonCircle.create
-skeleton_text = SkeletonText.create
-slide = Slide.create
-slide_fade = SlideFade.create
-slider = Slider.create
-slider_filled_track = SliderFilledTrack.create
-slider_mark = SliderMark.create
-slider_thumb = SliderThumb.create
-slider_track = SliderTrack.create
-spacer = Spacer.create
-span = Span.create
-spinner = Spinner.create
-square = Square.create
-stack = Stack.create
-stat = Stat.create
-stat_arrow = StatArrow.create
-stat_group = StatGroup.create
-stat_help_text = StatHelpText.create
-stat_label = StatLabel.create
-stat_number = StatNumber.create
-step = Step.create
-step_description = StepDescription.create
-step_icon = StepIcon.create
-step_indicator = StepIndicator.create
-step_number = StepNumber.create
-step_separator = StepSeparator.create
-step_status = StepStatus.create
-step_title = StepTitle.create
-stepper = Stepper.create
-switch = Switch.create
-tab = Tab.create
-tab_list = TabList.create
-tab_panel = TabPanel.create
-tab_panels = TabPanels.create
-table = Table.create
-table_caption = TableCaption.create
-table_container = TableContainer.create
-tabs = Tabs.create
-tag = Tag.create
-tag_close_button = TagCloseButton.create
-tag_label = TagLabel.create
-tag_left_icon = TagLeftIcon.create
-tag_right_icon = TagRightIcon.create
-tbody = Tbody.create
-td = Td.create
-text = Text.create
-text_area = TextArea.create
-tfoot = Tfoot.create
-th = Th.create
-thead = Thead.create
-time_picker = TimePicker.create
-tooltip = Tooltip.create
-tr = Tr.create
-unordered_list = UnorderedList.create
-visually_hidden = VisuallyHidden.create
-vstack = Vstack.create
-wrap = Wrap.create
-wrap_item = WrapItem.create
+# Components are imported from their submodules on first access, so an app only pays
+# for the components it uses.
+_SUBMODULES: set[str] = {
+    "datadisplay",
+    "disclosure",
+    "feedback",
+    "forms",
+    "layout",
+    "media",
+    "navigation",
+    "overlay",
+    "typography",
+}
+
+_SUBMOD_ATTRS: dict = {
+    "base": [
+        "ChakraColorModeProvider",
+        "ChakraComponent",
+        "ChakraProvider",
+        "ColorModeProviderAssetSync",
+        "LiteralAlertDialogSize",
+        "LiteralAlertVariant",
+        "LiteralAvatarSize",
+        "LiteralButtonSize",
+        "LiteralButtonVariant",
+        "LiteralCardVariant",
+        "LiteralChakraDirection",
+        "LiteralColorScheme",
+        "LiteralDividerVariant",
+        "LiteralDrawerSize",
+        "LiteralHeadingSize",
+        "LiteralImageLoading",
+        "LiteralInputNumberMode",
+        "LiteralInputVariant",
+        "LiteralLanguage",
+        "LiteralLazyBehavior",
+        "LiteralMenuOption",
+        "LiteralMenuStrategy",
+        "LiteralPopOverTrigger",
+        "LiteralSpinnerPlacement",
+        "LiteralSpinnerSize",
+        "LiteralStackDirection",
+        "LiteralStatus",
+        "LiteralTabsVariant",
+        "LiteralTagAlign",
+        "LiteralTagColorScheme",
+        "LiteralTagSize",
+        "LiteralTheme",
+        "LiteralVariant",
+        "chakra_color_mode_provider",
+        "chakra_provider",
+        "color_mode_provider_asset",
+        "component",
+    ],
+    "deferred": ["DeferredContent", "deferred_content"],
+    "datadisplay.badge": ["Badge", "badge"],
+    "datadisplay.code": ["Code", "code"],
+    "datadisplay.divider": ["Divider", "divider"],
+    "datadisplay.feed": ["InfiniteFeed", "infinite_feed"],
+    "datadisplay.keyboard_key": ["Kbd", "kbd"],
+    "datadisplay.list": [
+        "List",
+        "ListItem",
+        "OrderedList",
+        "UnorderedList",
+        ("_list", "list"),
+        "list_item",
+        "ordered_list",
+        "unordered_list",
+    ],
+    "datadisplay.paginated_table": ["PaginatedTable", "paginated_table"],
+    "datadisplay.stat": [
+        "Stat",
+        "StatArrow",
+        "StatGroup",
+        "StatHelpText",
+        "StatLabel",
+        "StatNumber",
+        "stat",
+        "stat_arrow",
+        "stat_group",
+        "stat_help_text",
+        "stat_label",
+        "stat_number",
+    ],
+    "datadisplay.table": [
+        "Table",
+        "TableCaption",
+        "TableContainer",
+        "Tbody",
+        "Td",
+        "Tfoot",
+        "Th",
+        "Thead",
+        "Tr",
+        "table",
+        "table_caption",
+        "table_container",
+        "tbody",
+        "td",
+        "tfoot",
+        "th",
+        "thead",
+        "tr",
+    ],
+    "datadisplay.table_rows": [
+        "append_table_rows",
+        "delete_table_rows",
+        "insert_table_rows",
+        "update_table_cell",
+    ],
+    "datadisplay.tag": [
+        "Tag",
+        "TagCloseButton",
+        "TagLabel",
+        "TagLeftIcon",
+        "TagRightIcon",
+        "tag",
+        "tag_close_button",
+        "tag_label",
+        "tag_left_icon",
+        "tag_right_icon",
+    ],
+    "disclosure.accordion": [
+        "Accordion",
+        "AccordionButton",
+        "AccordionIcon",
+        "AccordionItem",
+        "AccordionPanel",
+        "LazyAccordionPanel",
+        "accordion",
+        "accordion_button",
+        "accordion_icon",
+        "accordion_item",
+        "accordion_panel",
+        "lazy_accordion_panel",
+    ],
+    "disclosure.tabs": [
+        "DeferredTabPanel",
+        "Tab",
+        "TabList",
+        "TabPanel",
+        "TabPanels",
+        "Tabs",
+        "deferred_tab_panel",
+        "tab",
+        "tab_list",
+        "tab_panel",
+        "tab_panels",
+        "tabs",
+    ],
+    "disclosure.transition": [
+        "Collapse",
+        "Fade",
+        "ScaleFade",
+        "Slide",
+        "SlideFade",
+        "collapse",
+        "fade",
+        "scale_fade",
+        "slide",
+        "slide_fade",
+    ],
+    "disclosure.visuallyhidden": ["VisuallyHidden", "visually_hidden"],
+    "feedback.alert": [
+        "Alert",
+        "AlertDescription",
+        "AlertIcon",
+        "AlertTitle",
+        "alert",
+        "alert_description",
+        "alert_icon",
+        "alert_title",
+    ],
+    "feedback.circularprogress": [
+        "CircularProgress",
+        "CircularProgressLabel",
+        "circular_progress",
+        "circular_progress_label",
+    ],
+    "feedback.progress": ["Progress", "progress"],
+    "feedback.skeleton": [
+        "Skeleton",
+        "SkeletonCircle",
+        "SkeletonText",
+        "skeleton",
+        "skeleton_circle",
+        "skeleton_text",
+    ],
+    "feedback.spinner": ["Spinner", "spinner"],
+    "forms.autocomplete": ["Autocomplete", "autocomplete"],
+    "forms.button": ["Button", "ButtonGroup", "button", "button_group"],
+    "forms.checkbox": ["Checkbox", "CheckboxGroup", "checkbox", "checkbox_group"],
+    "forms.colormodeswitch": [
+        "ColorModeButton",
+        "ColorModeScript",
+        "ColorModeSwitch",
+        "color_mode_button",
+        "color_mode_switch",
+    ],
+    "forms.date_picker": ["DatePicker", "date_picker"],
+    "forms.date_time_picker": ["DateTimePicker", "date_time_picker"],
+    "forms.editable": [
+        "Editable",
+        "EditableInput",
+        "EditablePreview",
+        "EditableTextarea",
+        "editable",
+        "editable_input",
+        "editable_preview",
+        "editable_textarea",
+    ],
+    "forms.email": ["Email", "email"],
+    "forms.form": [
+        "Form",
+        "FormControl",
+        "FormErrorMessage",
+        "FormHelperText",
+        "FormLabel",
+        "form",
+        "form_control",
+        "form_error_message",
+        "form_helper_text",
+        "form_label",
+    ],
+    "forms.iconbutton": ["IconButton", "icon_button"],
+    "forms.input": [
+        "Input",
+        "InputGroup",
+        "InputLeftAddon",
+        "InputLeftElement",
+        "InputRightAddon",
+        "InputRightElement",
+        "input",
+        "input_group",
+        "input_left_addon",
+        "input_left_element",
+        "input_right_addon",
+        "input_right_element",
+    ],
+    "forms.numberinput": [
+        "NumberDecrementStepper",
+        "NumberIncrementStepper",
+        "NumberInput",
+        "NumberInputField",
+        "NumberInputStepper",
+        "number_decrement_stepper",
+        "number_increment_stepper",
+        "number_input",
+        "number_input_field",
+        "number_input_stepper",
+    ],
+    "forms.password": ["Password", "password"],
+    "forms.pininput": ["PinInput", "PinInputField", "pin_input", "pin_input_field"],
+    "forms.radio": ["Radio", "RadioGroup", "radio", "radio_group"],
+    "forms.rangeslider": [
+        "RangeSlider",
+        "RangeSliderFilledTrack",
+        "RangeSliderThumb",
+        "RangeSliderTrack",
+        "range_slider",
+        "range_slider_filled_track",
+        "range_slider_thumb",
+        "range_slider_track",
+    ],
+    "forms.select": ["Option", "Select", "option", "select"],
+    "forms.slider": [
+        "Slider",
+        "SliderFilledTrack",
+        "SliderMark",
+        "SliderThumb",
+        "SliderTrack",
+        "slider",
+        "slider_filled_track",
+        "slider_mark",
+        "slider_thumb",
+        "slider_track",
+    ],
+    "forms.switch": ["Switch", "switch"],
+    "forms.textarea": ["TextArea", "text_area"],
+    "forms.time_picker": ["TimePicker", "time_picker"],
+    "forms.validation": ["ValidationRule"],
+    "forms.virtual_select": ["VirtualSelect", "virtual_select"],
+    "layout.aspect_ratio": ["AspectRatio", "aspect_ratio"],
+    "layout.box": ["Box", "box"],
+    "layout.card": [
+        "Card",
+        "CardBody",
+        "CardFooter",
+        "CardHeader",
+        "card",
+        "card_body",
+        "card_footer",
+        "card_header",
+    ],
+    "layout.center": ["Center", "Circle", "Square", "center", "circle", "square"],
+    "layout.container": ["Container", "container"],
+    "layout.flex": ["Flex", "flex"],
+    "layout.grid": [
+        "Grid",
+        "GridItem",
+        "ResponsiveGrid",
+        "grid",
+        "grid_item",
+        "responsive_grid",
+    ],
+    "layout.spacer": ["Spacer", "spacer"],
+    "layout.stack": ["Hstack", "Stack", "Vstack", "hstack", "stack", "vstack"],
+    "layout.wrap": ["Wrap", "WrapItem", "wrap", "wrap_item"],
+    "media.avatar": [
+        "Avatar",
+        "AvatarBadge",
+        "AvatarGroup",
+        "avatar",
+        "avatar_badge",
+        "avatar_group",
+    ],
+    "media.icon": ["Icon", "icon"],
+    "media.image": ["Image", "image"],
+    "navigation.breadcrumb": [
+        "Breadcrumb",
+        "BreadcrumbItem",
+        "BreadcrumbLink",
+        "BreadcrumbSeparator",
+        "breadcrumb",
+        "breadcrumb_item",
+        "breadcrumb_link",
+        "breadcrumb_separator",
+    ],
+    "navigation.link": ["Link", "link"],
+    "navigation.linkoverlay": ["LinkBox", "LinkOverlay", "link_box", "link_overlay"],
+    "navigation.stepper": [
+        "Step",
+        "StepDescription",
+        "StepIcon",
+        "StepIndicator",
+        "StepNumber",
+        "StepSeparator",
+        "StepStatus",
+        "StepTitle",
+        "Stepper",
+        "step",
+        "step_description",
+        "step_icon",
+        "step_indicator",
+        "step_number",
+        "step_separator",
+        "step_status",
+        "step_title",
+        "stepper",
+    ],
+    "overlay.alertdialog": [
+        "AlertDialog",
+        "AlertDialogBody",
+        "AlertDialogContent",
+        "AlertDialogFooter",
+        "AlertDialogHeader",
+        "AlertDialogOverlay",
+        "alert_dialog",
+        "alert_dialog_body",
+        "alert_dialog_content",
+        "alert_dialog_footer",
+        "alert_dialog_header",
+        "alert_dialog_overlay",
+    ],
+    "overlay.drawer": [
+        "Drawer",
+        "DrawerBody",
+        "DrawerCloseButton",
+        "DrawerContent",
+        "DrawerFooter",
+        "DrawerHeader",
+        "DrawerOverlay",
+        "drawer",
+        "drawer_body",
+        "drawer_close_button",
+        "drawer_content",
+        "drawer_footer",
+        "drawer_header",
+        "drawer_overlay",
+    ],
+    "overlay.menu": [
+        "Menu",
+        "MenuButton",
+        "MenuDivider",
+        "MenuGroup",
+        "MenuItem",
+        "MenuItemOption",
+        "MenuList",
+        "MenuOptionGroup",
+        "menu",
+        "menu_button",
+        "menu_divider",
+        "menu_group",
+        "menu_item",
+        "menu_item_option",
+        "menu_list",
+        "menu_option_group",
+    ],
+    "overlay.modal": [
+        "Modal",
+        "ModalBody",
+        "ModalCloseButton",
+        "ModalContent",
+        "ModalFooter",
+        "ModalHeader",
+        "ModalOverlay",
+        "modal",
+        "modal_body",
+        "modal_close_button",
+        "modal_content",
+        "modal_footer",
+        "modal_header",
+        "modal_overlay",
+    ],
+    "overlay.popover": [
+        "Popover",
+        "PopoverAnchor",
+        "PopoverArrow",
+        "PopoverBody",
+        "PopoverCloseButton",
+        "PopoverContent",
+        "PopoverFooter",
+        "PopoverHeader",
+        "PopoverTrigger",
+        "popover",
+        "popover_anchor",
+        "popover_arrow",
+        "popover_body",
+        "popover_close_button",
+        "popover_content",
+        "popover_footer",
+        "popover_header",
+        "popover_trigger",
+    ],
+    "overlay.tooltip": ["Tooltip", "tooltip"],
+    "typography.heading": ["Heading", "heading"],
+    "typography.highlight": ["Highlight", "highlight"],
+    "typography.span": ["Span", "span"],
+    "typography.text": ["Text", "text"],
+}
+
+
+def _attach(package_name: str, submodules: set[str], submod_attrs: dict) -> tuple:
+    """Attach the lazy loader to a package, resolving aliased attributes.
+
+    The lazy loader exports an (attribute, alias) entry under its alias but looks up
+    the alias in the submodule, so aliased attributes are looked up by their name here.
+
+    Args:
+        package_name: The name of the package.
+        submodules: The submodules of the package.
+        submod_attrs: The attributes of each submodule.
+
+    Returns:
+        The __getattr__, __dir__ and __all__ of the package.
+    """
+    getattr_, dir_, all_ = lazy_loader.attach(
+        package_name, submodules=submodules, submod_attrs=submod_attrs
+    )
+    aliases = {
+        attr[1]: (module, attr[0])
+        for module, attrs in submod_attrs.items()
+        for attr in attrs
+        if isinstance(attr, tuple)
+    }
+
+    def __getattr__(name: str):  # noqa: N807
+        if name in aliases:
+            module, attr = aliases[name]
+            return getattr(importlib.import_module(f"{package_name}.{module}"), attr)
+        return getattr_(name)
+
+    return __getattr__, dir_, all_
+
+
+__getattr__, __dir__, __all__ = _attach(__name__, _SUBMODULES, _SUBMOD_ATTRS)
@@ -0,0 +1,884 @@
+"""Stub file for reflex_chakra/components/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import (
+    datadisplay,
+    disclosure,
+    feedback,
+    forms,
+    layout,
+    media,
+    navigation,
+    overlay,
+    typography,
+)
+from .base import (
+    ChakraColorModeProvider,
+    ChakraComponent,
+    ChakraProvider,
+    ColorModeProviderAssetSync,
+    LiteralAlertDialogSize,
+    LiteralAlertVariant,
+    LiteralAvatarSize,
+    LiteralButtonSize,
+    LiteralButtonVariant,
+    LiteralCardVariant,
+    LiteralChakraDirection,
+    LiteralColorScheme,
+    LiteralDividerVariant,
+    LiteralDrawerSize,
+    LiteralHeadingSize,
+    LiteralImageLoading,
+    LiteralInputNumberMode,
+    LiteralInputVariant,
+    LiteralLanguage,
+    LiteralLazyBehavior,
+    LiteralMenuOption,
+    LiteralMenuStrategy,
+    LiteralPopOverTrigger,
+    LiteralSpinnerPlacement,
+    LiteralSpinnerSize,
+    LiteralStackDirection,
+    LiteralStatus,
+    LiteralTabsVariant,
+    LiteralTagAlign,
+    LiteralTagColorScheme,
+    LiteralTagSize,
+    LiteralTheme,
+    LiteralVariant,
+    chakra_color_mode_provider,
+    chakra_provider,
+    color_mode_provider_asset,
+    component,
+)
+from .datadisplay.badge import Badge, badge
+from .datadisplay.code import Code, code
+from .datadisplay.divider import Divider, divider
+from .datadisplay.feed import InfiniteFeed, infinite_feed
+from .datadisplay.keyboard_key import Kbd, kbd
+from .datadisplay.list import (
+    List,
+    ListItem,
+    OrderedList,
+    UnorderedList,
+    list_item,
+    ordered_list,
+    unordered_list,
+)
+from .datadisplay.list import _list as list
+from .datadisplay.paginated_table import PaginatedTable, paginated_table
+from .datadisplay.stat import (
+    Stat,
+    StatArrow,
+    StatGroup,
+    StatHelpText,
+    StatLabel,
+    StatNumber,
+    stat,
+    stat_arrow,
+    stat_group,
+    stat_help_text,
+    stat_label,
+    stat_number,
+)
+from .datadisplay.table import (
+    Table,
+    TableCaption,
+    TableContainer,
+    Tbody,
+    Td,
+    Tfoot,
+    Th,
+    Thead,
+    Tr,
+    table,
+    table_caption,
+    table_container,
+    tbody,
+    td,
+    tfoot,
+    th,
+    thead,
+    tr,
+)
+from .datadisplay.table_rows import (
+    append_table_rows,
+    delete_table_rows,
+    insert_table_rows,
+    update_table_cell,
+)
+from .datadisplay.tag import (
+    Tag,
+    TagCloseButton,
+    TagLabel,
+    TagLeftIcon,
+    TagRightIcon,
+    tag,
+    tag_close_button,
+    tag_label,
+    tag_left_icon,
+    tag_right_icon,
+)
+from .deferred import DeferredContent, deferred_content
+from .disclosure.accordion import (
+    Accordion,
+    AccordionButton,
+    AccordionIcon,
+    AccordionItem,
+    AccordionPanel,
+    LazyAccordionPanel,
+    accordion,
+    accordion_button,
+    accordion_icon,
+    accordion_item,
+    accordion_panel,
+    lazy_accordion_panel,
+)
+from .disclosure.tabs import (
+    DeferredTabPanel,
+    Tab,
+    TabList,
+    TabPanel,
+    TabPanels,
+    Tabs,
+    deferred_tab_panel,
+    tab,
+    tab_list,
+    tab_panel,
+    tab_panels,
+    tabs,
+)
+from .disclosure.transition import (
+    Collapse,
+    Fade,
+    ScaleFade,
+    Slide,
+    SlideFade,
+    collapse,
+    fade,
+    scale_fade,
+    slide,
+    slide_fade,
+)
+from .disclosure.visuallyhidden import VisuallyHidden, visually_hidden
+from .feedback.alert import (
+    Alert,
+    AlertDescription,
+    AlertIcon,
+    AlertTitle,
+    alert,
+    alert_description,
+    alert_icon,
+    alert_title,
+)
+from .feedback.circularprogress import (
+    CircularProgress,
+    CircularProgressLabel,
+    circular_progress,
+    circular_progress_label,
+)
+from .feedback.progress import Progress, progress
+from .feedback.skeleton import (
+    Skeleton,
+    SkeletonCircle,
+    SkeletonText,
+    skeleton,
+    skeleton_circle,
+    skeleton_text,
+)
+from .feedback.spinner import Spinner, spinner
+from .forms.autocomplete import Autocomplete, autocomplete
+from .forms.button import Button, ButtonGroup, button, button_group
+from .forms.checkbox import Checkbox, CheckboxGroup, checkbox, checkbox_group
+from .forms.colormodeswitch import (
+    ColorModeButton,
+    ColorModeScript,
+    ColorModeSwitch,
+    color_mode_button,
+    color_mode_switch,
+)
+from .forms.date_picker import DatePicker, date_picker
+from .forms.date_time_picker import DateTimePicker, date_time_picker
+from .forms.editable import (
+    Editable,
+    EditableInput,
+    EditablePreview,
+    EditableTextarea,
+    editable,
+    editable_input,
+    editable_preview,
+    editable_textarea,
+)
+from .forms.email import Email, email
+from .forms.form import (
+    Form,
+    FormControl,
+    FormErrorMessage,
+    FormHelperText,
+    FormLabel,
+    form,
+    form_control,
+    form_error_message,
+    form_helper_text,
+    form_label,
+)
+from .forms.iconbutton import IconButton, icon_button
+from .forms.input import (
+    Input,
+    InputGroup,
+    InputLeftAddon,
+    InputLeftElement,
+    InputRightAddon,
+    InputRightElement,
+    input,
+    input_group,
+    input_left_addon,
+    input_left_element,
+    input_right_addon,
+    input_right_element,
+)
+from .forms.numberinput import (
+    NumberDecrementStepper,
+    NumberIncrementStepper,
+    NumberInput,
+    NumberInputField,
+    NumberInputStepper,
+    number_decrement_stepper,
+    number_increment_stepper,
+    number_input,
+    number_input_field,
+    number_input_stepper,
+)
+from .forms.password import Password, password
+from .forms.pininput import PinInput, PinInputField, pin_input, pin_input_field
+from .forms.radio import Radio, RadioGroup, radio, radio_group
+from .forms.rangeslider import (
+    RangeSlider,
+    RangeSliderFilledTrack,
+    RangeSliderThumb,
+    RangeSliderTrack,
+    range_slider,
+    range_slider_filled_track,
+    range_slider_thumb,
+    range_slider_track,
+)
+from .forms.select import Option, Select, option, select
+from .forms.slider import (
+    Slider,
+    SliderFilledTrack,
+    SliderMark,
+    SliderThumb,
+    SliderTrack,
+    slider,
+    slider_filled_track,
+    slider_mark,
+    slider_thumb,
+    slider_track,
+)
+from .forms.switch import Switch, switch
+from .forms.textarea import TextArea, text_area
+from .forms.time_picker import TimePicker, time_picker
+from .forms.validation import ValidationRule
+from .forms.virtual_select import VirtualSelect, virtual_select
+from .layout.aspect_ratio import AspectRatio, aspect_ratio
+from .layout.box import Box, box
+from .layout.card import (
+    Card,
+    CardBody,
+    CardFooter,
+    CardHeader,
+    card,
+    card_body,
+    card_footer,
+    card_header,
+)
+from .layout.center import Center, Circle, Square, center, circle, square
+from .layout.container import Container, container
+from .layout.flex import Flex, flex
+from .layout.grid import (
+    Grid,
+    GridItem,
+    ResponsiveGrid,
+    grid,
+    grid_item,
+    responsive_grid,
+)
+from .layout.spacer import Spacer, spacer
+from .layout.stack import Hstack, Stack, Vstack, hstack, stack, vstack
+from .layout.wrap import Wrap, WrapItem, wrap, wrap_item
+from .media.avatar import (
+    Avatar,
+    AvatarBadge,
+    AvatarGroup,
+    avatar,
+    avatar_badge,
+    avatar_group,
+)
+from .media.icon import Icon, icon
+from .media.image import Image, image
+from .navigation.breadcrumb import (
+    Breadcrumb,
+    BreadcrumbItem,
+    BreadcrumbLink,
+    BreadcrumbSeparator,
+    breadcrumb,
+    breadcrumb_item,
+    breadcrumb_link,
+    breadcrumb_separator,
+)
+from .navigation.link import Link, link
+from .navigation.linkoverlay import LinkBox, LinkOverlay, link_box, link_overlay
+from .navigation.stepper import (
+    Step,
+    StepDescription,
+    StepIcon,
+    StepIndicator,
+    StepNumber,
+    Stepper,
+    StepSeparator,
+    StepStatus,
+    StepTitle,
+    step,
+    step_description,
+    step_icon,
+    step_indicator,
+    step_number,
+    step_separator,
+    step_status,
+    step_title,
+    stepper,
+)
+from .overlay.alertdialog import (
+    AlertDialog,
+    AlertDialogBody,
+    AlertDialogContent,
+    AlertDialogFooter,
+    AlertDialogHeader,
+    AlertDialogOverlay,
+    alert_dialog,
+    alert_dialog_body,
+    alert_dialog_content,
+    alert_dialog_footer,
+    alert_dialog_header,
+    alert_dialog_overlay,
+)
+from .overlay.drawer import (
+    Drawer,
+    DrawerBody,
+    DrawerCloseButton,
+    DrawerContent,
+    DrawerFooter,
+    DrawerHeader,
+    DrawerOverlay,
+    drawer,
+    drawer_body,
+    drawer_close_button,
+    drawer_content,
+    drawer_footer,
+    drawer_header,
+    drawer_overlay,
+)
+from .overlay.menu import (
+    Menu,
+    MenuButton,
+    MenuDivider,
+    MenuGroup,
+    MenuItem,
+    MenuItemOption,
+    MenuList,
+    MenuOptionGroup,
+    menu,
+    menu_button,
+    menu_divider,
+    menu_group,
+    menu_item,
+    menu_item_option,
+    menu_list,
+    menu_option_group,
+)
+from .overlay.modal import (
+    Modal,
+    ModalBody,
+    ModalCloseButton,
+    ModalContent,
+    ModalFooter,
+    ModalHeader,
+    ModalOverlay,
+    modal,
+    modal_body,
+    modal_close_button,
+    modal_content,
+    modal_footer,
+    modal_header,
+    modal_overlay,
+)
+from .overlay.popover import (
+    Popover,
+    PopoverAnchor,
+    PopoverArrow,
+    PopoverBody,
+    PopoverCloseButton,
+    PopoverContent,
+    PopoverFooter,
+    PopoverHeader,
+    PopoverTrigger,
+    popover,
+    popover_anchor,
+    popover_arrow,
+    popover_body,
+    popover_close_button,
+    popover_content,
+    popover_footer,
+    popover_header,
+    popover_trigger,
+)
+from .overlay.tooltip import Tooltip, tooltip
+from .typography.heading import Heading, heading
+from .typography.highlight import Highlight, highlight
+from .typography.span import Span, span
+from .typography.text import Text, text
+
+__all__ = [
+    "Accordion",
+    "AccordionButton",
+    "AccordionIcon",
+    "AccordionItem",
+    "AccordionPanel",
+    "Alert",
+    "AlertDescription",
+    "AlertDialog",
+    "AlertDialogBody",
+    "AlertDialogContent",
+    "AlertDialogFooter",
+    "AlertDialogHeader",
+    "AlertDialogOverlay",
+    "AlertIcon",
+    "AlertTitle",
+    "AspectRatio",
+    "Autocomplete",
+    "Avatar",
+    "AvatarBadge",
+    "AvatarGroup",
+    "Badge",
+    "Box",
+    "Breadcrumb",
+    "BreadcrumbItem",
+    "BreadcrumbLink",
+    "BreadcrumbSeparator",
+    "Button",
+    "ButtonGroup",
+    "Card",
+    "CardBody",
+    "CardFooter",
+    "CardHeader",
+    "Center",
+    "ChakraColorModeProvider",
+    "ChakraComponent",
+    "ChakraProvider",
+    "Checkbox",
+    "CheckboxGroup",
+    "Circle",
+    "CircularProgress",
+    "CircularProgressLabel",
+    "Code",
+    "Collapse",
+    "ColorModeButton",
+    "ColorModeProviderAssetSync",
+    "ColorModeScript",
+    "ColorModeSwitch",
+    "Container",
+    "DatePicker",
+    "DateTimePicker",
+    "DeferredContent",
+    "DeferredTabPanel",
+    "Divider",
+    "Drawer",
+    "DrawerBody",
+    "DrawerCloseButton",
+    "DrawerContent",
+    "DrawerFooter",
+    "DrawerHeader",
+    "DrawerOverlay",
+    "Editable",
+    "EditableInput",
+    "EditablePreview",
+    "EditableTextarea",
+    "Email",
+    "Fade",
+    "Flex",
+    "Form",
+    "FormControl",
+    "FormErrorMessage",
+    "FormHelperText",
+    "FormLabel",
+    "Grid",
+    "GridItem",
+    "Heading",
+    "Highlight",
+    "Hstack",
+    "Icon",
+    "IconButton",
+    "Image",
+    "InfiniteFeed",
+    "Input",
+    "InputGroup",
+    "InputLeftAddon",
+    "InputLeftElement",
+    "InputRightAddon",
+    "InputRightElement",
+    "Kbd",
+    "LazyAccordionPanel",
+    "Link",
+    "LinkBox",
+    "LinkOverlay",
+    "List",
+    "ListItem",
+    "LiteralAlertDialogSize",
+    "LiteralAlertVariant",
+    "LiteralAvatarSize",
+    "LiteralButtonSize",
+    "LiteralButtonVariant",
+    "LiteralCardVariant",
+    "LiteralChakraDirection",
+    "LiteralColorScheme",
+    "LiteralDividerVariant",
+    "LiteralDrawerSize",
+    "LiteralHeadingSize",
+    "LiteralImageLoading",
+    "LiteralInputNumberMode",
+    "LiteralInputVariant",
+    "LiteralLanguage",
+    "LiteralLazyBehavior",
+    "LiteralMenuOption",
+    "LiteralMenuStrategy",
+    "LiteralPopOverTrigger",
+    "LiteralSpinnerPlacement",
+    "LiteralSpinnerSize",
+    "LiteralStackDirection",
+    "LiteralStatus",
+    "LiteralTabsVariant",
+    "LiteralTagAlign",
+    "LiteralTagColorScheme",
+    "LiteralTagSize",
+    "LiteralTheme",
+    "LiteralVariant",
+    "Menu",
+    "MenuButton",
+    "MenuDivider",
+    "MenuGroup",
+    "MenuItem",
+    "MenuItemOption",
+    "MenuList",
+    "MenuOptionGroup",
+    "Modal",
+    "ModalBody",
+    "ModalCloseButton",
+    "ModalContent",
+    "ModalFooter",
+    "ModalHeader",
+    "ModalOverlay",
+    "NumberDecrementStepper",
+    "NumberIncrementStepper",
+    "NumberInput",
+    "NumberInputField",
+    "NumberInputStepper",
+    "Option",
+    "OrderedList",
+    "PaginatedTable",
+    "Password",
+    "PinInput",
+    "PinInputField",
+    "Popover",
+    "PopoverAnchor",
+    "PopoverArrow",
+    "PopoverBody",
+    "PopoverCloseButton",
+    "PopoverContent",
+    "PopoverFooter",
+    "PopoverHeader",
+    "PopoverTrigger",
+    "Progress",
+    "Radio",
+    "RadioGroup",
+    "RangeSlider",
+    "RangeSliderFilledTrack",
+    "RangeSliderThumb",
+    "RangeSliderTrack",
+    "ResponsiveGrid",
+    "ScaleFade",
+    "Select",
+    "Skeleton",
+    "SkeletonCircle",
+    "SkeletonText",
+    "Slide",
+    "SlideFade",
+    "Slider",
+    "SliderFilledTrack",
+    "SliderMark",
+    "SliderThumb",
+    "SliderTrack",
+    "Spacer",
+    "Span",
+    "Spinner",
+    "Square",
+    "Stack",
+    "Stat",
+    "StatArrow",
+    "StatGroup",
+    "StatHelpText",
+    "StatLabel",
+    "StatNumber",
+    "Step",
+    "StepDescription",
+    "StepIcon",
+    "StepIndicator",
+    "StepNumber",
+    "StepSeparator",
+    "StepStatus",
+    "StepTitle",
+    "Stepper",
+    "Switch",
+    "Tab",
+    "TabList",
+    "TabPanel",
+    "TabPanels",
+    "Table",
+    "TableCaption",
+    "TableContainer",
+    "Tabs",
+    "Tag",
+    "TagCloseButton",
+    "TagLabel",
+    "TagLeftIcon",
+    "TagRightIcon",
+    "Tbody",
+    "Td",
+    "Text",
+    "TextArea",
+    "Tfoot",
+    "Th",
+    "Thead",
+    "TimePicker",
+    "Tooltip",
+    "Tr",
+    "UnorderedList",
+    "ValidationRule",
+    "VirtualSelect",
+    "VisuallyHidden",
+    "Vstack",
+    "Wrap",
+    "WrapItem",
+    "accordion",
+    "accordion_button",
+    "accordion_icon",
+    "accordion_item",
+    "accordion_panel",
+    "alert",
+    "alert_description",
+    "alert_dialog",
+    "alert_dialog_body",
+    "alert_dialog_content",
+    "alert_dialog_footer",
+    "alert_dialog_header",
+    "alert_dialog_overlay",
+    "alert_icon",
+    "alert_title",
+    "append_table_rows",
+    "aspect_ratio",
+    "autocomplete",
+    "avatar",
+    "avatar_badge",
+    "avatar_group",
+    "badge",
+    "box",
+    "breadcrumb",
+    "breadcrumb_item",
+    "breadcrumb_link",
+    "breadcrumb_separator",
+    "button",
+    "button_group",
+    "card",
+    "card_body",
+    "card_footer",
+    "card_header",
+    "center",
+    "chakra_color_mode_provider",
+    "chakra_provider",
+    "checkbox",
+    "checkbox_group",
+    "circle",
+    "circular_progress",
+    "circular_progress_label",
+    "code",
+    "collapse",
+    "color_mode_button",
+    "color_mode_provider_asset",
+    "color_mode_switch",
+    "component",
+    "container",
+    "datadisplay",
+    "date_picker",
+    "date_time_picker",
+    "deferred_content",
+    "deferred_tab_panel",
+    "delete_table_rows",
+    "disclosure",
+    "divider",
+    "drawer",
+    "drawer_body",
+    "drawer_close_button",
+    "drawer_content",
+    "drawer_footer",
+    "drawer_header",
+    "drawer_overlay",
+    "editable",
+    "editable_input",
+    "editable_preview",
+    "editable_textarea",
+    "email",
+    "fade",
+    "feedback",
+    "flex",
+    "form",
+    "form_control",
+    "form_error_message",
+    "form_helper_text",
+    "form_label",
+    "forms",
+    "grid",
+    "grid_item",
+    "heading",
+    "highlight",
+    "hstack",
+    "icon",
+    "icon_button",
+    "image",
+    "infinite_feed",
+    "input",
+    "input_group",
+    "input_left_addon",
+    "input_left_element",
+    "input_right_addon",
+    "input_right_element",
+    "insert_table_rows",
+    "kbd",
+    "layout",
+    "lazy_accordion_panel",
+    "link",
+    "link_box",
+    "link_overlay",
+    "list",
+    "list_item",
+    "media",
+    "menu",
+    "menu_button",
+    "menu_divider",
+    "menu_group",
+    "menu_item",
+    "menu_item_option",
+    "menu_list",
+    "menu_option_group",
+    "modal",
+    "modal_body",
+    "modal_close_button",
+    "modal_content",
+    "modal_footer",
+    "modal_header",
+    "modal_overlay",
+    "navigation",
+    "number_decrement_stepper",
+    "number_increment_stepper",
+    "number_input",
+    "number_input_field",
+    "number_input_stepper",
+    "option",
+    "ordered_list",
+    "overlay",
+    "paginated_table",
+    "password",
+    "pin_input",
+    "pin_input_field",
+    "popover",
+    "popover_anchor",
+    "popover_arrow",
+    "popover_body",
+    "popover_close_button",
+    "popover_content",
+    "popover_footer",
+    "popover_header",
+    "popover_trigger",
+    "progress",
+    "radio",
+    "radio_group",
+    "range_slider",
+    "range_slider_filled_track",
+    "range_slider_thumb",
+    "range_slider_track",
+    "responsive_grid",
+    "scale_fade",
+    "select",
+    "skeleton",
+    "skeleton_circle",
+    "skeleton_text",
+    "slide",
+    "slide_fade",
+    "slider",
+    "slider_filled_track",
+    "slider_mark",
+    "slider_thumb",
+    "slider_track",
+    "spacer",
+    "span",
+    "spinner",
+    "square",
+    "stack",
+    "stat",
+    "stat_arrow",
+    "stat_group",
+    "stat_help_text",
+    "stat_label",
+    "stat_number",
+    "step",
+    "step_description",
+    "step_icon",
+    "step_indicator",
+    "step_number",
+    "step_separator",
+    "step_status",
+    "step_title",
+    "stepper",
+    "switch",
+    "tab",
+    "tab_list",
+    "tab_panel",
+    "tab_panels",
+    "table",
+    "table_caption",
+    "table_container",
+    "tabs",
+    "tag",
+    "tag_close_button",
+    "tag_label",
+    "tag_left_icon",
+    "tag_right_icon",
+    "tbody",
+    "td",
+    "text",
+    "text_area",
+    "tfoot",
+    "th",
+    "thead",
+    "time_picker",
+    "tooltip",
+    "tr",
+    "typography",
+    "unordered_list",
+    "update_table_cell",
+    "virtual_select",
+    "visually_hidden",
+    "vstack",
+    "wrap",
+    "wrap_item",
+]
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import builtins
+import hashlib
+import keyword
 import shutil
+from functools import cache
 from pathlib import Path
 from typing import Literal
 
@@ -13,6 +17,73 @@ from reflex.vars.base import Var
 from reflex_chakra import constants
 
 
+@cache
+def _packaged_color_mode_provider() -> tuple[bytes, str]:
+    """Read the packaged color mode provider once per process.
+
+    Returns:
+        The file contents and their sha256 digest.
+    """
+    content = (
+        constants.ASSETS_DIR / constants.COLOR_MODE_PROVIDER_FILENAME
+    ).read_bytes()
+    return content, hashlib.sha256(content).hexdigest()
+
+
+class ColorModeProviderAssetSync:
+    """Keep the client's copy of the color mode provider in sync with the packaged one.
+
+    The check runs once per working directory and packaged file digest. Afterwards
+    only the client file's mtime and size are compared, and the file contents are
+    read again only when those change.
+    """
+
+    def __init__(self):
+        """Initialize the sync cache."""
+        # (client asset path, packaged digest) -> (mtime_ns, size) of the synced client file.
+        self._synced: dict[tuple[Path, str], tuple[int, int]] = {}
+
+        # The number of syscalls (stat, open, read, close) avoided by the cache.
+        self.saved_syscalls = 0
+
+    def sync(self) -> None:
+        """Copy the color mode provider to the client's asset dir if it is missing or stale."""
+        client_color_mode_provider = (
+            Path.cwd()
+            / constants.ASSETS_DIR_NAME
+            / constants.COLOR_MODE_PROVIDER_FILENAME
+        )
+        content, digest = _packaged_color_mode_provider()
+        key = (client_color_mode_provider, digest)
+        try:
+            stat = client_color_mode_provider.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is not None:
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._synced.get(key) == signature:
+                # The uncached check opens, reads and closes both copies.
+                self.saved_syscalls += 6
+                return
+            if client_color_mode_provider.read_bytes() == content:
+                self._synced[key] = signature
+                return
+        client_color_mode_provider.parent.mkdir(exist_ok=True)
+        shutil.copy(
+            constants.ASSETS_DIR / constants.COLOR_MODE_PROVIDER_FILENAME,
+            client_color_mode_provider.parent,
+        )
+        stat = client_color_mode_provider.stat()
+        self._synced[key] = (stat.st_mtime_ns, stat.st_size)
+
+    def clear(self) -> None:
+        """Forget every synced asset, forcing a full check on the next sync."""
+        self._synced.clear()
+
+
+color_mode_provider_asset = ColorModeProviderAssetSync()
+
+
 class ChakraComponent(Component):
     """A component that wraps a Chakra component."""
 
@@ -28,7 +99,7 @@ class ChakraComponent(Component):
     @staticmethod
     def _get_app_wrap_components() -> dict[tuple[int, str], Component]:
         return {
-            (60, "ChakraProvider"): chakra_provider,
+            (60, "ChakraProvider"): _get_chakra_provider(),
         }
 
     def _get_style(self) -> dict:
@@ -39,6 +110,22 @@ class ChakraComponent(Component):
         """
         return {"sx": self.style}
 
+    @classmethod
+    @cache
+    def _get_prop_aliases(cls) -> dict[str, str]:
+        """Get the trailing underscore aliases of props named after python keywords or builtins.
+
+        Returns:
+            A mapping of the aliased kwarg (e.g. `type_`) to the prop name (e.g. `type`).
+        """
+        props = cls.get_props()
+        return {
+            f"{prop}_": prop
+            for prop in props
+            if (keyword.iskeyword(prop) or hasattr(builtins, prop))
+            and f"{prop}_" not in props
+        }
+
     @classmethod
     def create(cls, *children, **props) -> Component:
         """Create a new Chakra component.
@@ -51,33 +138,12 @@ class ChakraComponent(Component):
             A new Chakra component.
         """
         # copy color mode provider file to client's asset dir if it doesnt exist.
-        client_asset_dir = Path.cwd() / constants.ASSETS_DIR_NAME
-        if (
-            not (
-                client_color_mode_provider := (
-                    Path.cwd()
-                    / constants.ASSETS_DIR_NAME
-                    / constants.COLOR_MODE_PROVIDER_FILENAME
-                )
-            ).exists()
-            or client_color_mode_provider.read_bytes()
-            != (
-                constants.ASSETS_DIR / constants.COLOR_MODE_PROVIDER_FILENAME
-            ).read_bytes()
-        ):
-            client_asset_dir.mkdir(exist_ok=True)
-            shutil.copy(
-                constants.ASSETS_DIR / constants.COLOR_MODE_PROVIDER_FILENAME,
-                client_color_mode_provider.parent,
-            )
-
-        new_prop_names = [
-            prop for prop in cls.get_props() if prop in ["type", "min", "max"]
-        ]
-        for prop in new_prop_names:
-            under_prop = f"{prop}_"
-            if under_prop in props:
-                props[prop] = props.pop(under_prop)
+        color_mode_provider_asset.sync()
+
+        # accept `type_`, `min_`, etc. for props that shadow python keywords or builtins.
+        if prop_aliases := cls._get_prop_aliases():
+            for under_prop in [name for name in props if name in prop_aliases]:
+                props[prop_aliases[under_prop]] = props.pop(under_prop)
 
         return super().create(*children, **props)
 
@@ -114,11 +180,18 @@ class ChakraProvider(ChakraComponent):
     @staticmethod
     def _get_app_wrap_components() -> dict[tuple[int, str], Component]:
         return {
-            (50, "ChakraColorModeProvider"): chakra_color_mode_provider,
+            (50, "ChakraColorModeProvider"): _get_chakra_color_mode_provider(),
         }
 
 
-chakra_provider = ChakraProvider.create()
+@cache
+def _get_chakra_provider() -> Component:
+    """Get the ChakraProvider wrapping the app, created on first use.
+
+    Returns:
+        The ChakraProvider component.
+    """
+    return ChakraProvider.create()
 
 
 class ChakraColorModeProvider(Component):
@@ -129,7 +202,19 @@ class ChakraColorModeProvider(Component):
     is_default = True
 
 
-chakra_color_mode_provider = ChakraColorModeProvider.create()
+@cache
+def _get_chakra_color_mode_provider() -> Component:
+    """Get the ChakraColorModeProvider wrapping the app, created on first use.
+
+    Returns:
+        The ChakraColorModeProvider component.
+    """
+    return ChakraColorModeProvider.create()
+
+
+# created on first access by __getattr__, so importing this module creates no components.
+chakra_provider: Component
+chakra_color_mode_provider: Component
 
 
 LiteralColorScheme = Literal[
@@ -234,5 +319,18 @@ LiteralDrawerSize = Literal[LiteralSpinnerSize, "xl", "full"]
 LiteralMenuStrategy = Literal["fixed", "absolute"]
 LiteralMenuOption = Literal["checkbox", "radio"]
 LiteralPopOverTrigger = Literal["click", "hover"]
+LiteralLazyBehavior = Literal["unmount", "keepMounted"]
 
 LiteralHeadingSize = Literal["lg", "md", "sm", "xs", "xl", "2xl", "3xl", "4xl"]
+
+
+component = Component.create
+
+
+def __getattr__(name: str):
+    if name == "chakra_provider":
+        return _get_chakra_provider()
+    if name == "chakra_color_mode_provider":
+        return _get_chakra_color_mode_provider()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -19,6 +19,12 @@ from reflex.event import (
 from reflex.utils.imports import ImportDict
 from reflex.vars.base import Var
 
+class ColorModeProviderAssetSync:
+    def sync(self) -> None: ...
+    def clear(self) -> None: ...
+
+color_mode_provider_asset = ColorModeProviderAssetSync()
+
 class ChakraComponent(Component):
     @classmethod
     def create(
@@ -113,8 +119,6 @@ class ChakraProvider(ChakraComponent):
 
     def add_imports(self) -> ImportDict: ...
 
-chakra_provider = ChakraProvider.create()
-
 class ChakraColorModeProvider(Component):
     @classmethod
     def create(
@@ -166,7 +170,8 @@ class ChakraColorModeProvider(Component):
             The component.
         """
 
-chakra_color_mode_provider = ChakraColorModeProvider.create()
+chakra_provider: Component
+chakra_color_mode_provider: Component
 LiteralColorScheme: TypeAlias = Literal[
     "none",
     "gray",
@@ -243,6 +248,8 @@ LiteralDrawerSize: TypeAlias = Literal[LiteralSpinnerSize, "xl", "full"]
 LiteralMenuStrategy: TypeAlias = Literal["fixed", "absolute"]
 LiteralMenuOption: TypeAlias = Literal["checkbox", "radio"]
 LiteralPopOverTrigger: TypeAlias = Literal["click", "hover"]
+LiteralLazyBehavior: TypeAlias = Literal["unmount", "keepMounted"]
 LiteralHeadingSize: TypeAlias = Literal[
     "lg", "md", "sm", "xs", "xl", "2xl", "3xl", "4xl"
 ]
+component = Component.create
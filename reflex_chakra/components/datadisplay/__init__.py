@@ -1,41 +1,60 @@
 """Data display components."""
 
-from .badge import Badge
-from .code import Code
-from .divider import Divider
-from .keyboard_key import KeyboardKey as Kbd
-from .list import List, ListItem, OrderedList, UnorderedList
-from .stat import Stat, StatArrow, StatGroup, StatHelpText, StatLabel, StatNumber
-from .table import Table, TableCaption, TableContainer, Tbody, Td, Tfoot, Th, Thead, Tr
-from .tag import Tag, TagCloseButton, TagLabel, TagLeftIcon, TagRightIcon
+from reflex.utils import lazy_loader
 
-__all__ = [
-    "Badge",
-    "Code",
-    "Divider",
-    "Kbd",
-    "List",
-    "ListItem",
-    "OrderedList",
-    "Stat",
-    "StatArrow",
-    "StatGroup",
-    "StatHelpText",
-    "StatLabel",
-    "StatNumber",
-    "Table",
-    "TableCaption",
-    "TableContainer",
-    "Tag",
-    "TagCloseButton",
-    "TagLabel",
-    "TagLeftIcon",
-    "TagRightIcon",
-    "Tbody",
-    "Td",
-    "Tfoot",
-    "Th",
-    "Thead",
-    "Tr",
-    "UnorderedList",
-]
+_SUBMODULES: set[str] = {
+    "badge",
+    "code",
+    "divider",
+    "feed",
+    "keyboard_key",
+    "list",
+    "paginated_table",
+    "stat",
+    "table",
+    "table_rows",
+    "table_view",
+    "tag",
+}
+
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "badge": ["Badge"],
+    "code": ["Code"],
+    "divider": ["Divider"],
+    "feed": ["InfiniteFeed"],
+    "keyboard_key": ["Kbd"],
+    "list": ["List", "ListItem", "OrderedList", "UnorderedList"],
+    "paginated_table": ["PaginatedTable"],
+    "stat": [
+        "Stat",
+        "StatArrow",
+        "StatGroup",
+        "StatHelpText",
+        "StatLabel",
+        "StatNumber",
+    ],
+    "table": [
+        "Table",
+        "TableCaption",
+        "TableContainer",
+        "Tbody",
+        "Td",
+        "Tfoot",
+        "Th",
+        "Thead",
+        "Tr",
+    ],
+    "table_rows": [
+        "append_table_rows",
+        "delete_table_rows",
+        "insert_table_rows",
+        "update_table_cell",
+    ],
+    "tag": ["Tag", "TagCloseButton", "TagLabel", "TagLeftIcon", "TagRightIcon"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
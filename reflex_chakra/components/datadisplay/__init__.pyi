@@ -0,0 +1,84 @@
+"""Stub file for reflex_chakra/components/datadisplay/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import (
+    badge,
+    code,
+    divider,
+    feed,
+    keyboard_key,
+    list,
+    paginated_table,
+    stat,
+    table,
+    table_rows,
+    table_view,
+    tag,
+)
+from .badge import Badge
+from .code import Code
+from .divider import Divider
+from .feed import InfiniteFeed
+from .keyboard_key import Kbd
+from .list import List, ListItem, OrderedList, UnorderedList
+from .paginated_table import PaginatedTable
+from .stat import Stat, StatArrow, StatGroup, StatHelpText, StatLabel, StatNumber
+from .table import Table, TableCaption, TableContainer, Tbody, Td, Tfoot, Th, Thead, Tr
+from .table_rows import (
+    append_table_rows,
+    delete_table_rows,
+    insert_table_rows,
+    update_table_cell,
+)
+from .tag import Tag, TagCloseButton, TagLabel, TagLeftIcon, TagRightIcon
+
+__all__ = [
+    "Badge",
+    "Code",
+    "Divider",
+    "InfiniteFeed",
+    "Kbd",
+    "List",
+    "ListItem",
+    "OrderedList",
+    "PaginatedTable",
+    "Stat",
+    "StatArrow",
+    "StatGroup",
+    "StatHelpText",
+    "StatLabel",
+    "StatNumber",
+    "Table",
+    "TableCaption",
+    "TableContainer",
+    "Tag",
+    "TagCloseButton",
+    "TagLabel",
+    "TagLeftIcon",
+    "TagRightIcon",
+    "Tbody",
+    "Td",
+    "Tfoot",
+    "Th",
+    "Thead",
+    "Tr",
+    "UnorderedList",
+    "append_table_rows",
+    "badge",
+    "code",
+    "delete_table_rows",
+    "divider",
+    "feed",
+    "insert_table_rows",
+    "keyboard_key",
+    "list",
+    "paginated_table",
+    "stat",
+    "table",
+    "table_rows",
+    "table_view",
+    "tag",
+    "update_table_cell",
+]
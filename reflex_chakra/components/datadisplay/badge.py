@@ -15,3 +15,6 @@ class Badge(ChakraComponent):
 
     # The color of the badge
     color_scheme: Var[str]
+
+
+badge = Badge.create
@@ -74,3 +74,5 @@ class Badge(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+badge = Badge.create
@@ -9,3 +9,6 @@ class Code(ChakraComponent):
     """Used to display inline code."""
 
     tag = "Code"
+
+
+code = Code.create
@@ -67,3 +67,5 @@ class Code(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+code = Code.create
@@ -19,3 +19,6 @@ class Divider(ChakraComponent):
 
     # Variant of the divider ("solid" | "dashed")
     variant: Var[LiteralDividerVariant]
+
+
+divider = Divider.create
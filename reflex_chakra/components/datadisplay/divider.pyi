@@ -79,3 +79,5 @@ class Divider(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+divider = Divider.create
@@ -0,0 +1,344 @@
+"""A list that loads its items from a backend source as it is scrolled."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from reflex.components.component import Component
+from reflex.components.core.cond import cond
+from reflex.components.core.foreach import Foreach
+from reflex.constants import Hooks, Imports, MemoizationMode
+from reflex.event import EventChain
+from reflex.state import ComponentState
+from reflex.vars.base import Field, Var, VarData, field
+
+from reflex_chakra.components.datadisplay.list import List, ListItem
+from reflex_chakra.components.feedback.skeleton import SkeletonText
+from reflex_chakra.components.sources import (
+    fetch_items,
+    hook_var,
+    next_request,
+    unique_names,
+)
+from reflex_chakra.components.typography.text import Text
+
+# A feed source is either a cursor function, called with a cursor (None for the first
+# page) and a limit, that returns a tuple (items, next_cursor) with next_cursor None
+# after the last page; or a generator function, sync or async, called with an offset
+# and a limit that yields the items in [offset, offset + limit).
+FeedSource = Callable[[Any, int], Any]
+
+# A function rendering an item of the feed.
+ItemRenderer = Callable[[Var], Component]
+
+
+async def fetch_page(source: FeedSource, cursor: Any, limit: int) -> tuple[list, Any]:
+    """Fetch a page of at most `limit` items from a feed source.
+
+    Args:
+        source: The feed source.
+        cursor: The cursor of the page, None for the first page.
+        limit: The maximum number of items.
+
+    Returns:
+        The items and the cursor of the next page, None after the last page.
+    """
+    if inspect.isasyncgenfunction(source) or inspect.isgeneratorfunction(source):
+        offset = cursor or 0
+        items, done = await fetch_items(source, offset, limit=limit)
+        return items, None if done else offset + limit
+    result = source(cursor, limit)
+    if inspect.isawaitable(result):
+        result = await result
+    items, next_cursor = result
+    return list(items), next_cursor
+
+
+class InfiniteFeed(ComponentState):
+    """A list fed one page at a time by a backend source as it is scrolled.
+
+    Only the last fetched page is kept in the state. The browser keeps the pages and
+    the cursor of each page, requests the next page when a sentinel item nears the
+    viewport, and keeps at most `max_pages` pages mounted: the pages far from the
+    viewport are replaced by spacers of the same height, and fetched again with their
+    cursor when the feed is scrolled back to them.
+    """
+
+    # The id of the request the fetched page answers.
+    fetched_request: Field[int] = field(-1)
+
+    # The index of the last fetched page.
+    fetched_page: Field[int] = field(-1)
+
+    # The items of the last fetched page.
+    fetched_items: Field[list] = field(default_factory=list)
+
+    # The cursor of the page after the last fetched one, None after the last page.
+    next_cursor: Field[int | str | None] = field(None)
+
+    # Whether the source raised while fetching the last requested page.
+    fetched_error: Field[bool] = field(False)
+
+    # The feed source and page size of this instance, set by get_component.
+    _source: ClassVar[FeedSource]
+    _page_size: ClassVar[int]
+
+    async def load_page(self, request: int, page: int, cursor: int | str | None):
+        """Fetch a page from the feed source.
+
+        Args:
+            request: The id of the request.
+            page: The index of the page.
+            cursor: The cursor of the page.
+        """
+        cls = type(self)
+        # the request is always answered, so the browser can retry a failed page.
+        self.fetched_error = True
+        try:
+            items, next_cursor = await fetch_page(cls._source, cursor, cls._page_size)
+            self.fetched_items = items
+            self.next_cursor = next_cursor
+            self.fetched_error = False
+        finally:
+            self.fetched_page = page
+            self.fetched_request = request
+
+    @classmethod
+    def get_component(
+        cls,
+        *children,
+        source: FeedSource,
+        page_size: int = 20,
+        max_pages: int = 5,
+        render_item: ItemRenderer | None = None,
+        root_margin: str = "400px",
+        skeleton_lines: int = 3,
+        error_text: str = "Could not load more items.",
+        **props,
+    ) -> Component:
+        """Create an infinite feed.
+
+        Args:
+            *children: Components rendered before the items.
+            source: A cursor function or a generator function returning the items of a page.
+            page_size: The number of items per page.
+            max_pages: The number of pages kept mounted in the browser, at least 2.
+            render_item: A function rendering an item, called with the item var. Defaults to the item as text.
+            root_margin: How close to the viewport the ends of the feed are when the next pages are requested, as a CSS margin.
+            skeleton_lines: The number of lines of the placeholder shown while a page is loading.
+            error_text: The text shown while a page that failed to load waits to be requested again.
+            **props: The properties of the list.
+
+        Returns:
+            The infinite feed component.
+        """
+        cls._source = staticmethod(source)
+        cls._page_size = page_size
+        max_pages = max(max_pages, 2)
+
+        feed, view, version, check, container, top, bottom, request, load, evict = (
+            unique_names(
+                "feed",
+                "state",
+                "view",
+                "version",
+                "check",
+                "container",
+                "top",
+                "bottom",
+                "request",
+                "load",
+                "evict",
+            )
+        )
+        fetched_request, fetched_page, fetched_items, next_cursor, fetched_error = (
+            str(cls.fetched_request),
+            str(cls.fetched_page),
+            str(cls.fetched_items),
+            str(cls.next_cursor),
+            str(cls.fetched_error),
+        )
+        load_chain = str(
+            Var.create(
+                EventChain.create(
+                    cls.load_page,  # pyright: ignore[reportArgumentType]
+                    args_spec=lambda request, page, cursor: [request, page, cursor],
+                )
+            )
+        )
+        hooks = [
+            f"const {container} = useRef(null);",
+            f"const {top} = useRef(null);",
+            f"const {bottom} = useRef(null);",
+            f"const {request} = useRef(0);",
+            # the pages in [lo, hi] are mounted, the heights of the others are kept.
+            f"const {feed} = useRef({{ pages: new Map(), heights: new Map(), cursors: [null], lo: 0, hi: -1, last: -1, loading: null, failed: null, failures: 0, retryAt: 0, visible: {{ top: false, bottom: false }} }});",
+            f"const [{version}, set_{version}] = useState(0);",
+            f"""const {load} = (page) => {{
+    const feed = {feed}.current;
+    if (feed.loading !== null || Date.now() < feed.retryAt || page < 0 || page >= feed.cursors.length || (feed.last >= 0 && page > feed.last)) return;
+    feed.loading = page;
+    {next_request(request)}
+    set_{version}((version) => version + 1);
+    {load_chain}({request}.current, page, feed.cursors[page]);
+}};""",
+            f"""const {check} = useRef(null);
+{check}.current = () => {{
+    const feed = {feed}.current;
+    if (feed.visible.bottom) {load}(feed.hi + 1);
+    if (feed.visible.top) {load}(feed.lo - 1);
+}};""",
+            f"""const {evict} = (page, fromTop) => {{
+    const feed = {feed}.current;
+    const nodes = (page) => {container}.current?.querySelectorAll(`[data-feed-page="${{page}}"]`) ?? [];
+    const first = (page) => nodes(page)[0]?.getBoundingClientRect().top;
+    const last = (page) => {{
+        const found = nodes(page);
+        return found[found.length - 1]?.getBoundingClientRect().bottom;
+    }};
+    // the distance to the neighbouring page includes the spacing between the items.
+    const height = fromTop ? first(page + 1) - first(page) : last(page) - last(page - 1);
+    feed.heights.set(page, Number.isFinite(height) ? Math.max(0, height) : 0);
+    feed.pages.delete(page);
+}};""",
+            f"""useEffect(() => {{
+    const feed = {feed}.current;
+    const page = {fetched_page};
+    if (feed.loading !== page || {fetched_request} !== {request}.current) return;
+    feed.loading = null;
+    if ({fetched_error}) {{
+        // request the page again later, waiting longer after each failure.
+        feed.failed = page;
+        feed.failures += 1;
+        const delay = Math.min(30000, 1000 * 2 ** (feed.failures - 1));
+        feed.retryAt = Date.now() + delay;
+        setTimeout(() => {check}.current(), delay);
+        set_{version}((version) => version + 1);
+        return;
+    }}
+    feed.failed = null;
+    feed.failures = 0;
+    if ({next_cursor} === null || {next_cursor} === undefined) feed.last = page;
+    else feed.cursors[page + 1] = {next_cursor};
+    if (page === feed.hi + 1) {{
+        feed.pages.set(page, {fetched_items});
+        feed.heights.delete(page);
+        feed.hi = page;
+        if (feed.hi - feed.lo + 1 > {max_pages}) {evict}(feed.lo++, true);
+    }} else if (page === feed.lo - 1) {{
+        feed.pages.set(page, {fetched_items});
+        feed.heights.delete(page);
+        feed.lo = page;
+        if (feed.hi - feed.lo + 1 > {max_pages}) {evict}(feed.hi--, false);
+    }}
+    set_{version}((version) => version + 1);
+}}, [{fetched_request}]);""",
+            f"""useEffect(() => {{
+    const node = {container}.current;
+    if (!node) return;
+    let root = node.parentElement;
+    while (root && !/(auto|scroll)/.test(getComputedStyle(root).overflowY)) {{
+        root = root.parentElement;
+    }}
+    const observer = new IntersectionObserver((entries) => {{
+        const visible = {feed}.current.visible;
+        for (const entry of entries) {{
+            if (entry.target === {top}.current) visible.top = entry.isIntersecting;
+            if (entry.target === {bottom}.current) visible.bottom = entry.isIntersecting;
+        }}
+        {check}.current();
+    }}, {{ root, rootMargin: "{root_margin}" }});
+    observer.observe({top}.current);
+    observer.observe({bottom}.current);
+    return () => observer.disconnect();
+}}, []);""",
+            # the sentinels may still be in view once a page is mounted.
+            f"useEffect(() => {check}.current(), [{version}]);",
+            f"""const {view} = useMemo(() => {{
+    const feed = {feed}.current;
+    const items = [];
+    for (let page = feed.lo; page <= feed.hi; page++) {{
+        for (const item of feed.pages.get(page) ?? []) items.push({{ page, item }});
+    }}
+    let before = 0;
+    let after = 0;
+    for (const [page, height] of feed.heights) {{
+        if (page < feed.lo) before += height;
+        else if (page > feed.hi) after += height;
+    }}
+    return {{
+        items,
+        before: `${{before}}px`,
+        after: `${{after}}px`,
+        loadingTop: feed.loading !== null && feed.loading < feed.lo,
+        loadingBottom: feed.loading !== null && feed.loading > feed.hi,
+        failedTop: feed.loading === null && feed.failed !== null && feed.failed < feed.lo,
+        failedBottom: feed.loading === null && feed.failed !== null && feed.failed > feed.hi,
+    }};
+}}, [{version}]);""",
+        ]
+        var_data = VarData.merge(
+            cls.fetched_request._get_all_var_data(),
+            VarData(imports=Imports.EVENTS, hooks={Hooks.EVENTS: None}),
+            VarData(
+                imports={"react": ["useEffect", "useMemo", "useRef", "useState"]},
+                hooks=dict.fromkeys(hooks),
+            ),
+        )
+
+        def create_item(entry: Var) -> Component:
+            item = entry.to(dict)["item"]
+            return ListItem.create(
+                render_item(item) if render_item is not None else item,
+                custom_attrs={"data-feed-page": entry.to(dict)["page"]},
+            )
+
+        def create_status(end: str) -> list[Component]:
+            return [
+                cond(
+                    hook_var(var_data, f"{view}.loading{end}", bool),
+                    ListItem.create(
+                        SkeletonText.create(no_of_lines=skeleton_lines),
+                        list_style_type="none",
+                    ),
+                ),
+                cond(
+                    hook_var(var_data, f"{view}.failed{end}", bool),
+                    ListItem.create(
+                        Text.create(error_text, color="red.500"),
+                        list_style_type="none",
+                    ),
+                ),
+            ]
+
+        component = List.create(
+            *children,
+            # the spacers keep the height of the pages that are not mounted.
+            ListItem.create(
+                height=hook_var(var_data, f"{view}.before", str), list_style_type="none"
+            ),
+            ListItem.create(
+                list_style_type="none", custom_attrs={"ref": hook_var(var_data, top)}
+            ),
+            *create_status("Top"),
+            Foreach.create(
+                hook_var(var_data, f"{view}.items", list[dict]), create_item
+            ),
+            *create_status("Bottom"),
+            ListItem.create(
+                list_style_type="none", custom_attrs={"ref": hook_var(var_data, bottom)}
+            ),
+            ListItem.create(
+                height=hook_var(var_data, f"{view}.after", str), list_style_type="none"
+            ),
+            custom_attrs={"ref": hook_var(var_data, container)},
+            **props,
+        )
+        # the feed hooks must be rendered in the same component as the sentinels.
+        component._memoization_mode = MemoizationMode(recursive=False)
+        return component
+
+
+infinite_feed = InfiniteFeed.create
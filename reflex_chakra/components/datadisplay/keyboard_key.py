@@ -7,3 +7,7 @@ class KeyboardKey(ChakraComponent):
     """Display a keyboard key text."""
 
     tag = "Kbd"
+
+
+Kbd = KeyboardKey
+kbd = KeyboardKey.create
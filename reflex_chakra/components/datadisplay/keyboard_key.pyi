@@ -67,3 +67,6 @@ class KeyboardKey(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+Kbd = KeyboardKey
+kbd = KeyboardKey.create
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from reflex.components.component import Component
 from reflex.components.core.foreach import Foreach
-from reflex.vars.base import Var
+from reflex.constants import MemoizationMode
+from reflex.event import EventChain, EventHandler, no_args_event_spec
+from reflex.vars.base import LiteralVar, Var, VarData, get_unique_variable_name
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.virtualization import VirtualWindow
 
 
 class List(ChakraComponent):
@@ -23,18 +26,48 @@ class List(ChakraComponent):
     # Shorthand prop for listStyleType
     style_type: Var[str]
 
+    # Fired when a virtualized list is scrolled to its last items, to load more of them.
+    on_end_reached: EventHandler[no_args_event_spec]
+
     @classmethod
-    def create(cls, *children, items: Var[list] | None = None, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        items: Var[list] | None = None,
+        virtualized: bool = False,
+        item_height: int = 40,
+        estimate_item_height: bool = False,
+        overscan: int = 10,
+        **props,
+    ) -> Component:
         """Create a list component.
 
         Args:
             *children: The children of the component.
             items: A list of items to add to the list.
+            virtualized: If true, only the items visible in the nearest scrollable container are rendered.
+            item_height: The height of an item in pixels when virtualized.
+            estimate_item_height: If true, item_height is only an estimate and the actual height is measured from the rendered items.
+            overscan: The number of items rendered above and below the visible ones when virtualized.
             **props: The properties of the component.
 
+        Raises:
+            ValueError: If on_end_reached is set on a list that is not virtualized.
+
         Returns:
             The list component.
         """
+        if virtualized and len(children) == 0:
+            return cls._create_virtualized(
+                items if items is not None else [],
+                item_height=item_height,
+                estimate_item_height=estimate_item_height,
+                overscan=overscan,
+                **props,
+            )
+        if "on_end_reached" in props:
+            msg = "list on_end_reached requires virtualized=True"
+            raise ValueError(msg)
         if len(children) == 0:
             if isinstance(items, Var):
                 children = [Foreach.create(items, ListItem.create)]
@@ -42,6 +75,84 @@ class List(ChakraComponent):
                 children = [ListItem.create(item) for item in items or []]
         return super().create(*children, **props)
 
+    @classmethod
+    def _create_virtualized(
+        cls,
+        items,
+        item_height: int,
+        estimate_item_height: bool,
+        overscan: int,
+        **props,
+    ) -> Component:
+        """Create a list that only renders the items visible in its scroll container.
+
+        Args:
+            items: The items of the list.
+            item_height: The height of an item in pixels.
+            estimate_item_height: Whether to measure the actual item height.
+            overscan: The number of items rendered above and below the visible ones.
+            **props: The properties of the component.
+
+        Returns:
+            The list component.
+        """
+        window = VirtualWindow(
+            items,
+            item_height=item_height,
+            overscan=overscan,
+            measure=estimate_item_height,
+        )
+        ref = window.ref
+        on_end_reached = props.pop("on_end_reached", None)
+        if on_end_reached is not None:
+            on_end_reached = LiteralVar.create(
+                EventChain.create(
+                    on_end_reached, args_spec=no_args_event_spec, key="on_end_reached"
+                )
+            )
+            length = window.all_items.length()
+            fired = f"end_reached_{get_unique_variable_name()}"
+            # fire once per length, so again once new items arrive if the end is
+            # still in the window.
+            ref = Var(
+                _js_expr=str(ref),
+                _var_type=object,
+                _var_data=VarData.merge(
+                    ref._get_all_var_data(),
+                    on_end_reached._get_all_var_data(),
+                    VarData(
+                        hooks={
+                            f"const {fired} = useRef(-1);": None,
+                            f"""useEffect(() => {{
+    if ({window.end!s} < {length!s} || {fired}.current === {length!s}) return;
+    {fired}.current = {length!s};
+    ({on_end_reached!s})();
+}}, [{window.end!s}, {length!s}]);""": None,
+                        }
+                    ),
+                ),
+            )
+
+        def create_item(item: Var, index: Var) -> Component:
+            if issubclass(cls, OrderedList):
+                # keep the numbering of the items after the ones that are not rendered.
+                return ListItem.create(
+                    item, custom_attrs={"value": window.start + index.to(int) + 1}
+                )
+            return ListItem.create(item)
+
+        # the spacer items keep the scroll height of the items that are not rendered.
+        component = super().create(
+            ListItem.create(height=window.space_before, list_style_type="none"),
+            Foreach.create(window.items, create_item),
+            ListItem.create(height=window.space_after, list_style_type="none"),
+            custom_attrs={"ref": ref},
+            **props,
+        )
+        # the window hooks must be rendered in the same component as the ref.
+        component._memoization_mode = MemoizationMode(recursive=False)
+        return component
+
 
 class ListItem(ChakraComponent):
     """A single list item."""
@@ -59,3 +170,10 @@ class UnorderedList(List):
     """An unordered list component with bullets."""
 
     tag = "UnorderedList"
+
+
+# exported as `list` by the lazy loader, without shadowing the builtin in this module.
+_list = List.create
+list_item = ListItem.create
+ordered_list = OrderedList.create
+unordered_list = UnorderedList.create
@@ -23,6 +23,10 @@ class List(ChakraComponent):
         cls,
         *children,
         items: Var[list] | list | None = None,
+        virtualized: bool | None = False,
+        item_height: int | None = 40,
+        estimate_item_height: bool | None = False,
+        overscan: int | None = 10,
         spacing: Var[str] | str | None = None,
         style_position: Var[str] | str | None = None,
         style_type: Var[str] | str | None = None,
@@ -41,6 +45,7 @@ class List(ChakraComponent):
         on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
         on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
         on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_end_reached: EventType[()] | None = None,
         on_focus: EventType[()] | None = None,
         on_mount: EventType[()] | None = None,
         on_mouse_down: EventType[()] | None = None,
@@ -60,9 +65,14 @@ class List(ChakraComponent):
         Args:
             *children: The children of the component.
             items: A list of items to add to the list.
+            virtualized: If true, only the items visible in the nearest scrollable container are rendered.
+            item_height: The height of an item in pixels when virtualized.
+            estimate_item_height: If true, item_height is only an estimate and the actual height is measured from the rendered items.
+            overscan: The number of items rendered above and below the visible ones when virtualized.
             spacing: The space between each list item
             style_position: Shorthand prop for listStylePosition
             style_type: Shorthand prop for listStyleType
+            on_end_reached: Fired when a virtualized list is scrolled to its last items, to load more of them.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -72,6 +82,9 @@ class List(ChakraComponent):
             custom_attrs: custom attribute
             **props: The properties of the component.
 
+        Raises:
+            ValueError: If on_end_reached is set on a list that is not virtualized.
+
         Returns:
             The list component.
         """
@@ -133,6 +146,10 @@ class OrderedList(List):
         cls,
         *children,
         items: Var[list] | list | None = None,
+        virtualized: bool | None = False,
+        item_height: int | None = 40,
+        estimate_item_height: bool | None = False,
+        overscan: int | None = 10,
         spacing: Var[str] | str | None = None,
         style_position: Var[str] | str | None = None,
         style_type: Var[str] | str | None = None,
@@ -151,6 +168,7 @@ class OrderedList(List):
         on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
         on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
         on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_end_reached: EventType[()] | None = None,
         on_focus: EventType[()] | None = None,
         on_mount: EventType[()] | None = None,
         on_mouse_down: EventType[()] | None = None,
@@ -170,9 +188,14 @@ class OrderedList(List):
         Args:
             *children: The children of the component.
             items: A list of items to add to the list.
+            virtualized: If true, only the items visible in the nearest scrollable container are rendered.
+            item_height: The height of an item in pixels when virtualized.
+            estimate_item_height: If true, item_height is only an estimate and the actual height is measured from the rendered items.
+            overscan: The number of items rendered above and below the visible ones when virtualized.
             spacing: The space between each list item
             style_position: Shorthand prop for listStylePosition
             style_type: Shorthand prop for listStyleType
+            on_end_reached: Fired when a virtualized list is scrolled to its last items, to load more of them.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -182,6 +205,9 @@ class OrderedList(List):
             custom_attrs: custom attribute
             **props: The properties of the component.
 
+        Raises:
+            ValueError: If on_end_reached is set on a list that is not virtualized.
+
         Returns:
             The list component.
         """
@@ -192,6 +218,10 @@ class UnorderedList(List):
         cls,
         *children,
         items: Var[list] | list | None = None,
+        virtualized: bool | None = False,
+        item_height: int | None = 40,
+        estimate_item_height: bool | None = False,
+        overscan: int | None = 10,
         spacing: Var[str] | str | None = None,
         style_position: Var[str] | str | None = None,
         style_type: Var[str] | str | None = None,
@@ -210,6 +240,7 @@ class UnorderedList(List):
         on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
         on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
         on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_end_reached: EventType[()] | None = None,
         on_focus: EventType[()] | None = None,
         on_mount: EventType[()] | None = None,
         on_mouse_down: EventType[()] | None = None,
@@ -229,9 +260,14 @@ class UnorderedList(List):
         Args:
             *children: The children of the component.
             items: A list of items to add to the list.
+            virtualized: If true, only the items visible in the nearest scrollable container are rendered.
+            item_height: The height of an item in pixels when virtualized.
+            estimate_item_height: If true, item_height is only an estimate and the actual height is measured from the rendered items.
+            overscan: The number of items rendered above and below the visible ones when virtualized.
             spacing: The space between each list item
             style_position: Shorthand prop for listStylePosition
             style_type: Shorthand prop for listStyleType
+            on_end_reached: Fired when a virtualized list is scrolled to its last items, to load more of them.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -241,6 +277,14 @@ class UnorderedList(List):
             custom_attrs: custom attribute
             **props: The properties of the component.
 
+        Raises:
+            ValueError: If on_end_reached is set on a list that is not virtualized.
+
         Returns:
             The list component.
         """
+
+_list = List.create
+list_item = ListItem.create
+ordered_list = OrderedList.create
+unordered_list = UnorderedList.create
@@ -0,0 +1,241 @@
+"""A table that fetches its rows one page at a time from a backend data source."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from reflex.components.component import Component
+from reflex.components.core.cond import cond
+from reflex.constants import Hooks, Imports, MemoizationMode
+from reflex.event import EventChain, call_function
+from reflex.state import ComponentState
+from reflex.vars.base import Field, Var, VarData, field
+
+from reflex_chakra.components.datadisplay.table import Table
+from reflex_chakra.components.forms.button import Button
+from reflex_chakra.components.layout.box import Box
+from reflex_chakra.components.layout.stack import Hstack
+from reflex_chakra.components.sources import (
+    fetch_items,
+    hook_var,
+    next_request,
+    unique_names,
+)
+from reflex_chakra.components.typography.text import Text
+
+# A data source returns the rows in [offset, offset + limit). It may be sync or async,
+# and return a list, any iterable or an async iterable (e.g. an async generator).
+TableDataSource = Callable[[int, int], Any]
+
+
+class PaginatedTable(ComponentState):
+    """A table backed by a data source called with an offset and a limit.
+
+    Only the last fetched page is kept in the state, and the browser keeps an LRU
+    cache of recently viewed pages, so revisiting a page does not hit the backend.
+    """
+
+    # The id of the request the fetched page answers.
+    fetched_request: Field[int] = field(-1)
+
+    # The index of the last fetched page.
+    fetched_page: Field[int] = field(-1)
+
+    # The rows of the last fetched page.
+    fetched_rows: Field[list[list]] = field(default_factory=list)
+
+    # The index of the last page, -1 while unknown.
+    last_page: Field[int] = field(-1)
+
+    # Whether the source raised while fetching the last requested page.
+    fetched_error: Field[bool] = field(False)
+
+    # The data source and page size of this instance, set by get_component.
+    _source: ClassVar[TableDataSource]
+    _page_size: ClassVar[int]
+
+    async def load_page(self, request: int, page: int):
+        """Fetch a page from the data source.
+
+        Args:
+            request: The id of the request.
+            page: The index of the page.
+        """
+        cls = type(self)
+        # the request is always answered, so the browser can retry a failed page.
+        self.fetched_error = True
+        try:
+            rows, done = await fetch_items(
+                cls._source, page * cls._page_size, limit=cls._page_size
+            )
+            if done:
+                self.last_page = page
+            self.fetched_rows = [list(row) for row in rows]
+            self.fetched_error = False
+        finally:
+            self.fetched_page = page
+            self.fetched_request = request
+
+    @classmethod
+    def get_component(
+        cls,
+        *children,
+        source: TableDataSource,
+        page_size: int = 50,
+        prefetch: bool = True,
+        cache_pages: int = 8,
+        headers=None,
+        footers=None,
+        caption=None,
+        error_text: str = "Could not load this page.",
+        **props,
+    ) -> Component:
+        """Create a paginated table.
+
+        Args:
+            *children: Components rendered under the pagination controls.
+            source: A function called with an offset and a limit that returns the rows in that range.
+            page_size: The number of rows per page.
+            prefetch: If true, the next page is fetched as soon as the current one is shown.
+            cache_pages: The number of pages kept in the browser, at least 2.
+            headers: The headers of the table.
+            footers: The footers of the table.
+            caption: The caption of the table.
+            error_text: The text shown while a page that failed to load waits to be requested again.
+            **props: The properties of the table.
+
+        Returns:
+            The paginated table component.
+        """
+        cls._source = staticmethod(source)
+        cls._page_size = page_size
+        cache_pages = max(cache_pages, 2)
+
+        cache, pending, failed, request, request_page, page, version, go = unique_names(
+            "pages",
+            "cache",
+            "pending",
+            "failed",
+            "request",
+            "request_page",
+            "page",
+            "version",
+            "go",
+        )
+        fetched_request, fetched_page, fetched_rows, last_page, fetched_error = (
+            str(cls.fetched_request),
+            str(cls.fetched_page),
+            str(cls.fetched_rows),
+            str(cls.last_page),
+            str(cls.fetched_error),
+        )
+        load = str(
+            Var.create(
+                EventChain.create(
+                    cls.load_page,  # pyright: ignore[reportArgumentType]
+                    args_spec=lambda request, page: [request, page],
+                )
+            )
+        )
+        hooks = [
+            f"const {cache} = useRef(new Map());",
+            f"const {pending} = useRef(new Set());",
+            # the failed pages, with their number of failures and when to retry them.
+            f"const {failed} = useRef(new Map());",
+            f"const {request} = useRef(0);",
+            f"""const {request_page} = (page) => {{
+    if ({pending}.current.has(page) || Date.now() < ({failed}.current.get(page)?.retryAt ?? 0)) return;
+    {pending}.current.add(page);
+    {next_request(request)}
+    {load}({request}.current, page);
+}};""",
+            f"const [{page}, set_{page}] = useState(0);",
+            f"const [{version}, set_{version}] = useState(0);",
+            f"""useEffect(() => {{
+    if ({fetched_request} < 0) return;
+    const cache = {cache}.current;
+    {pending}.current.delete({fetched_page});
+    if ({fetched_error}) {{
+        // request the page again later, waiting longer after each failure.
+        const failures = ({failed}.current.get({fetched_page})?.failures ?? 0) + 1;
+        const delay = Math.min(30000, 1000 * 2 ** (failures - 1));
+        {failed}.current.set({fetched_page}, {{ failures, retryAt: Date.now() + delay }});
+        setTimeout(() => set_{version}((version) => version + 1), delay);
+        set_{version}((version) => version + 1);
+        return;
+    }}
+    {failed}.current.delete({fetched_page});
+    cache.delete({fetched_page});
+    cache.set({fetched_page}, {fetched_rows});
+    // evict the least recently used pages, but never the one on display.
+    for (const key of cache.keys()) {{
+        if (cache.size <= {cache_pages}) break;
+        if (key !== {page}) cache.delete(key);
+    }}
+    set_{version}((version) => version + 1);
+}}, [{fetched_request}]);""",
+            f"""useEffect(() => {{
+    const cache = {cache}.current;
+    const next = {page} + 1;
+    if (!cache.has({page})) {{
+        {request_page}({page});
+    }} else if ({str(prefetch).lower()} && ({last_page} < 0 || next <= {last_page}) && !cache.has(next)) {{
+        {request_page}(next);
+    }}
+}}, [{page}, {version}]);""",
+            f"""const {go} = (page) => {{
+    const rows = {cache}.current.get(page);
+    if (rows !== undefined) {{
+        {cache}.current.delete(page);
+        {cache}.current.set(page, rows);
+    }}
+    set_{page}(page);
+}};""",
+        ]
+        var_data = VarData.merge(
+            cls.fetched_request._get_all_var_data(),
+            VarData(imports=Imports.EVENTS, hooks={Hooks.EVENTS: None}),
+            VarData(
+                imports={"react": ["useEffect", "useRef", "useState"]},
+                hooks=dict.fromkeys(hooks),
+            ),
+        )
+        current_page = hook_var(var_data, page, int).to(int)
+        rows = hook_var(var_data, f"({cache}.current.get({page}) ?? [])", list[list])
+        page_failed = hook_var(
+            var_data,
+            f"(!{cache}.current.has({page}) && {failed}.current.has({page}))",
+            bool,
+        )
+
+        component = Box.create(
+            Table.create(
+                caption=caption, headers=headers, rows=rows, footers=footers, **props
+            ),
+            cond(
+                page_failed, Text.create(error_text, color="red.500", padding_top="2")
+            ),
+            Hstack.create(
+                Button.create(
+                    "Previous",
+                    on_click=call_function(f"() => {go}({page} - 1)"),
+                    is_disabled=current_page == 0,
+                ),
+                Text.create("Page ", current_page + 1),
+                Button.create(
+                    "Next",
+                    on_click=call_function(f"() => {go}({page} + 1)"),
+                    is_disabled=(cls.last_page >= 0) & (current_page >= cls.last_page),
+                ),
+                justify="end",
+                padding_top="2",
+            ),
+            *children,
+        )
+        # the page cache hooks must be rendered in the same component as the controls.
+        component._memoization_mode = MemoizationMode(recursive=False)
+        return component
+
+
+paginated_table = PaginatedTable.create
@@ -79,3 +79,11 @@ class StatGroup(ChakraComponent):
     """A stat group component to evenly space out the stats."""
 
     tag = "StatGroup"
+
+
+stat = Stat.create
+stat_arrow = StatArrow.create
+stat_group = StatGroup.create
+stat_help_text = StatHelpText.create
+stat_label = StatLabel.create
+stat_number = StatNumber.create
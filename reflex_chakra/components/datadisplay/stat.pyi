@@ -332,3 +332,10 @@ class StatGroup(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+stat = Stat.create
+stat_arrow = StatArrow.create
+stat_group = StatGroup.create
+stat_help_text = StatHelpText.create
+stat_label = StatLabel.create
+stat_number = StatNumber.create
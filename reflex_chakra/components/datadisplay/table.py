@@ -1,13 +1,102 @@
 """Table components."""
 
+from collections.abc import Callable, Mapping, Sequence
 from typing import ClassVar
 
 from reflex.components.component import Component
 from reflex.components.core.foreach import Foreach
+from reflex.constants import MemoizationMode
 from reflex.utils import types
+from reflex.utils.imports import ImportDict, ImportVar
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.datadisplay.table_rows import PatchedRows
+from reflex_chakra.components.datadisplay.table_view import TableView
+from reflex_chakra.components.virtualization import VirtualWindow
+
+
+def _to_list(column) -> list:
+    """Convert a column to a list, using the fast path of numpy and pyarrow arrays.
+
+    Args:
+        column: The column.
+
+    Returns:
+        The column values.
+    """
+    if hasattr(column, "to_pylist"):
+        return column.to_pylist()
+    if hasattr(column, "tolist"):
+        return column.tolist()
+    return list(column)
+
+
+# the pyarrow types of numbers, as the prefix of their name.
+_ARROW_NUMERIC_TYPES: tuple[str, ...] = (
+    "int",
+    "uint",
+    "float",
+    "double",
+    "halffloat",
+    "decimal",
+)
+
+
+def _get_dataframe_columns(df) -> tuple[dict[str, list], list[int]]:
+    """Extract the columns of a pandas or pyarrow frame, one column at a time.
+
+    Args:
+        df: A pandas DataFrame, or a pyarrow Table or RecordBatch.
+
+    Raises:
+        TypeError: If df is not a pandas or pyarrow frame.
+        ValueError: If the column names are not unique.
+
+    Returns:
+        The values of each column by name, and the indexes of the numeric columns.
+    """
+    if hasattr(df, "schema") and hasattr(df, "column_names"):
+        # pyarrow: each column is converted from its buffers without building rows.
+        names = list(df.column_names)
+        numeric = [
+            str(field.type).startswith(_ARROW_NUMERIC_TYPES) for field in df.schema
+        ]
+        values = [df.column(index).to_pylist() for index in range(len(names))]
+    elif hasattr(df, "dtypes") and hasattr(df, "iloc"):
+        names = list(df.columns)
+        numeric = [getattr(dtype, "kind", "O") in "iuf" for dtype in df.dtypes]
+        values = []
+        for index in range(len(names)):
+            column = df.iloc[:, index]
+            if column.hasnans:
+                column = column.astype(object).where(column.notna(), None)
+            values.append(column.tolist())
+    else:
+        msg = f"table dataframe should be a pandas DataFrame or a pyarrow Table. Got {type(df)} instead"
+        raise TypeError(msg)
+    columns = dict(zip((str(name) for name in names), values, strict=True))
+    if len(columns) != len(names):
+        msg = f"table dataframe column names should be unique. Got {names}"
+        raise ValueError(msg)
+    return columns, [index for index, is_numeric in enumerate(numeric) if is_numeric]
+
+
+def _numeric_props(index: Var | int, numeric_columns: Sequence[int] | None) -> dict:
+    """Get the props right-aligning a cell if it is in a numeric column.
+
+    Args:
+        index: The index of the cell in its row.
+        numeric_columns: The indexes of the numeric columns.
+
+    Returns:
+        The props of the cell.
+    """
+    if not numeric_columns:
+        return {}
+    if isinstance(index, Var):
+        return {"is_numeric": Var.create(list(numeric_columns)).contains(index)}
+    return {"is_numeric": True} if index in numeric_columns else {}
 
 
 class Table(ChakraComponent):
@@ -29,7 +118,26 @@ class Table(ChakraComponent):
 
     @classmethod
     def create(
-        cls, *children, caption=None, headers=None, rows=None, footers=None, **props
+        cls,
+        *children,
+        caption=None,
+        headers=None,
+        rows=None,
+        footers=None,
+        columns=None,
+        virtualized: bool = False,
+        max_height: str = "60vh",
+        row_height: int = 40,
+        estimate_row_height: bool = False,
+        overscan: int = 10,
+        memoize_rows: bool = False,
+        row_key: int | None = None,
+        sortable: bool | Sequence[int | str] = False,
+        filter_text: Var[str] | str | None = None,
+        filter_columns: Sequence[int | str] | None = None,
+        numeric_columns: Sequence[int | str] | None = None,
+        rows_id: str | None = None,
+        **props,
     ) -> Component:
         """Create a table component.
 
@@ -39,26 +147,195 @@ class Table(ChakraComponent):
             headers: The headers of the table component.
             rows: The rows of the table component.
             footers: The footers of the table component.
+            columns: The cells of the table component in column-major order, used instead of rows. When a dict of column name to values is given without headers, the names are used as headers.
+            virtualized: If true, only the rows visible in a scrollable container are rendered, and the headers and footers stick to its edges.
+            max_height: The height of the scrollable container of a virtualized table.
+            row_height: The height of a row in pixels in a virtualized table.
+            estimate_row_height: If true, row_height is only an estimate and the actual height is measured from the rendered rows.
+            overscan: The number of rows rendered above and below the visible ones in a virtualized table.
+            memoize_rows: If true, rows from a Var are memoized and only re-render when one of their cells changes.
+            row_key: The index of the column holding a stable key for each row, used with memoize_rows. Defaults to the row index.
+            sortable: The columns that are sorted in the browser when their header is clicked, as indexes or header names, or True for every column.
+            filter_text: Only the rows with a cell containing this text (case-insensitive) are shown. Filtering runs in the browser.
+            filter_columns: The columns searched by filter_text, as indexes or header names. Defaults to every column.
+            numeric_columns: The columns whose cells are right-aligned as numbers, as indexes or header names.
+            rows_id: An id the backend sends row deltas to, with append_table_rows, insert_table_rows, update_table_cell and delete_table_rows.
             **props: The properties of the component.
 
         Returns:
             The table component.
         """
+        sticky = {"position": "sticky", "z_index": "1", "bg": "chakra-body-bg"}
         if len(children) == 0:
             children = []
 
             if caption is not None:
                 children.append(TableCaption.create(caption))
 
+            if headers is None and columns is not None:
+                headers = Tbody.get_column_names(columns)
+
+            numeric_columns = cls._get_column_indexes(numeric_columns, headers)
+
+            view = (
+                cls._create_view(
+                    rows,
+                    columns,
+                    headers,
+                    sortable,
+                    filter_text,
+                    filter_columns,
+                    rows_id,
+                )
+                if sortable or filter_text is not None
+                else None
+            )
+            if view is not None:
+                rows, columns = view.rows, None
+
             if headers is not None:
-                children.append(Thead.create(headers=headers))
+                children.append(
+                    Thead.create(
+                        headers=headers,
+                        view=view,
+                        numeric_columns=numeric_columns,
+                        **({**sticky, "top": "0"} if virtualized else {}),
+                    )
+                )
 
-            if rows is not None:
-                children.append(Tbody.create(rows=rows))
+            if rows is not None or columns is not None:
+                children.append(
+                    Tbody.create(
+                        rows=rows,
+                        columns=columns,
+                        virtualized=virtualized,
+                        row_height=row_height,
+                        estimate_row_height=estimate_row_height,
+                        overscan=overscan,
+                        memoize_rows=memoize_rows,
+                        row_key=row_key,
+                        numeric_columns=numeric_columns,
+                        rows_id=rows_id,
+                    )
+                )
 
             if footers is not None:
-                children.append(Tfoot.create(footers=footers))
-        return super().create(*children, **props)
+                children.append(
+                    Tfoot.create(
+                        footers=footers,
+                        numeric_columns=numeric_columns,
+                        **({**sticky, "bottom": "0"} if virtualized else {}),
+                    )
+                )
+        table = super().create(*children, **props)
+        if virtualized:
+            table = TableContainer.create(
+                table, max_height=max_height, overflow_y="auto"
+            )
+        if sortable or filter_text is not None:
+            # the view hooks must be rendered in the same component as the headers and rows.
+            table._memoization_mode = MemoizationMode(recursive=False)
+        return table
+
+    @classmethod
+    def from_dataframe(cls, df, **props) -> Component:
+        """Create a table component from a pandas or pyarrow frame.
+
+        The column names are used as headers and the numeric columns are right-aligned.
+        The frame is read one column at a time and sent to the browser in column-major
+        order, so no Python list is created per row.
+
+        Args:
+            df: A pandas DataFrame, or a pyarrow Table or RecordBatch.
+            **props: The properties of the table, as in Table.create.
+
+        Returns:
+            The table component.
+        """
+        columns, numeric_columns = _get_dataframe_columns(df)
+        props.setdefault("numeric_columns", numeric_columns)
+        return cls.create(columns=columns, **props)
+
+    @classmethod
+    def _create_view(
+        cls,
+        rows,
+        columns,
+        headers,
+        sortable: bool | Sequence[int | str],
+        filter_text: Var[str] | str | None,
+        filter_columns: Sequence[int | str] | None,
+        rows_id: str | None = None,
+    ) -> TableView:
+        """Create the client-side sorted and filtered view of the rows.
+
+        Args:
+            rows: The rows of the table.
+            columns: The cells of the table in column-major order, used instead of rows.
+            headers: The headers of the table.
+            sortable: The sortable columns, or True for every column.
+            filter_text: The text searched in the rows.
+            filter_columns: The columns searched by filter_text.
+            rows_id: The id the backend sends row deltas to.
+
+        Raises:
+            ValueError: If the rows are patched by row deltas.
+
+        Returns:
+            The view.
+        """
+        if rows_id is not None:
+            # the view caches the sort order of the rows until they are replaced.
+            msg = "table rows_id cannot be combined with sortable or filter_text"
+            raise ValueError(msg)
+        if columns is not None:
+            rows = Tbody.zip_columns(columns)
+        return TableView(
+            rows if rows is not None else [],
+            sortable=sortable
+            if isinstance(sortable, bool)
+            else cls._get_column_indexes(sortable, headers) or [],
+            filter_text=filter_text,
+            filter_columns=cls._get_column_indexes(filter_columns, headers),
+        )
+
+    @classmethod
+    def _get_column_indexes(
+        cls, columns: Sequence[int | str] | None, headers
+    ) -> list[int] | None:
+        """Get the indexes of columns given by index or header name.
+
+        Args:
+            columns: The indexes or header names of the columns.
+            headers: The headers of the table.
+
+        Returns:
+            The indexes of the columns, or None if no columns are given.
+        """
+        if columns is None:
+            return None
+        return [cls._get_column_index(column, headers) for column in columns]
+
+    @staticmethod
+    def _get_column_index(column: int | str, headers) -> int:
+        """Get the index of a column given by index or header name.
+
+        Args:
+            column: The index or header name of the column.
+            headers: The headers of the table.
+
+        Raises:
+            ValueError: If the column is not one of the headers.
+
+        Returns:
+            The index of the column.
+        """
+        if isinstance(column, int):
+            return column
+        if isinstance(headers, (list, tuple)) and column in headers:
+            return list(headers).index(column)
+        msg = f"table column {column!r} should be the index of a column or one of the literal headers"
+        raise ValueError(msg)
 
 
 class Thead(ChakraComponent):
@@ -70,12 +347,21 @@ class Thead(ChakraComponent):
     _invalid_children: ClassVar[list[str]] = ["Tbody", "Thead", "Tfoot"]
 
     @classmethod
-    def create(cls, *children, headers=None, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        headers=None,
+        view: TableView | None = None,
+        numeric_columns: Sequence[int] | None = None,
+        **props,
+    ) -> Component:
         """Create a table header component.
 
         Args:
             *children: The children of the component.
             headers (list, optional): List of headers. Defaults to None.
+            view: The client-side view sorted by clicking the headers. Defaults to None.
+            numeric_columns: The indexes of the columns whose headers are right-aligned as numbers. Defaults to None.
             **props: The properties of the component.
 
         Returns:
@@ -85,9 +371,69 @@ class Thead(ChakraComponent):
         if len(children) == 0:
             cls.validate_headers(headers)
 
-            children = [Tr.create(cell_type="header", cells=headers)]
+            if view is None:
+                children = [
+                    Tr.create(
+                        cell_type="header",
+                        cells=headers,
+                        numeric_columns=numeric_columns,
+                    )
+                ]
+            elif isinstance(headers, Var):
+                children = [
+                    Tr.create(
+                        Foreach.create(
+                            headers,
+                            lambda header, index: cls._create_sortable_header(
+                                header, index, view, numeric_columns
+                            ),
+                        )
+                    )
+                ]
+            else:
+                children = [
+                    Tr.create(
+                        *[
+                            cls._create_sortable_header(
+                                header, index, view, numeric_columns
+                            )
+                            if view.is_sortable(index)
+                            else Th.create(
+                                header, **_numeric_props(index, numeric_columns)
+                            )
+                            for index, header in enumerate(headers or [])
+                        ]
+                    )
+                ]
         return super().create(*children, **props)
 
+    @staticmethod
+    def _create_sortable_header(
+        header, index, view: TableView, numeric_columns: Sequence[int] | None = None
+    ) -> Component:
+        """Create a header cell sorting the view by its column when clicked.
+
+        Args:
+            header: The header.
+            index: The index of the column.
+            view: The view to sort.
+            numeric_columns: The indexes of the numeric columns.
+
+        Returns:
+            The header cell component.
+        """
+        return Th.create(
+            header,
+            view.indicator(index),
+            **_numeric_props(index, numeric_columns),
+            cursor="pointer",
+            user_select="none",
+            custom_attrs={
+                "aria-sort": view.aria_sort(index),
+                "onClick": view.on_click(index),
+            },
+        )
+
     @staticmethod
     def validate_headers(headers):
         """Type checking for table headers.
@@ -120,32 +466,186 @@ class Tbody(ChakraComponent):
     _invalid_children: ClassVar[list[str]] = ["Tbody", "Thead", "Tfoot", "Td", "Th"]
 
     @classmethod
-    def create(cls, *children, rows=None, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        rows=None,
+        columns=None,
+        virtualized: bool = False,
+        row_height: int = 40,
+        estimate_row_height: bool = False,
+        overscan: int = 10,
+        memoize_rows: bool = False,
+        row_key: int | None = None,
+        numeric_columns: Sequence[int] | None = None,
+        rows_id: str | None = None,
+        **props,
+    ) -> Component:
         """Create a table body component.
 
         Args:
             *children: The children of the component.
             rows (list[list], optional): The rows of the table body. Defaults to None.
+            columns (dict[str, list] | list[list], optional): The cells of the table body in column-major order, used instead of rows. Defaults to None.
+            virtualized: If true, only the rows visible in the nearest scrollable container are rendered.
+            row_height: The height of a row in pixels when virtualized.
+            estimate_row_height: If true, row_height is only an estimate and the actual height is measured from the rendered rows.
+            overscan: The number of rows rendered above and below the visible ones when virtualized.
+            memoize_rows: If true, rows from a Var are memoized and only re-render when one of their cells changes.
+            row_key: The index of the column holding a stable key for each row, used with memoize_rows. Defaults to the row index.
+            numeric_columns: The indexes of the columns whose cells are right-aligned as numbers. Defaults to None.
+            rows_id: An id the backend sends row deltas to, patching the rows in the browser. Defaults to None.
             **props: The properties of the component.
 
         Returns:
             Component: The table body component
         """
         if len(children) == 0:
+            if columns is not None:
+                rows = cls.zip_columns(columns)
             cls.validate_rows(rows) if rows is not None else None
 
-            if isinstance(rows, Var):
-                children = [
-                    Foreach.create(
-                        rows, lambda row: Tr.create(cell_type="data", cells=row)
+            def create_row(row):
+                if memoize_rows:
+                    return MemoizedTr.create(
+                        cells=row,
+                        key=row[row_key] if row_key is not None else None,
+                        numeric_columns=numeric_columns or [],
                     )
-                ]
+                return Tr.create(
+                    cell_type="data", cells=row, numeric_columns=numeric_columns
+                )
+
+            if rows_id is not None:
+                rows = PatchedRows(rows if rows is not None else [], rows_id).rows
+
+            if virtualized:
+                return cls._create_virtualized(
+                    rows if rows is not None else [],
+                    create_row,
+                    row_height=row_height,
+                    estimate_row_height=estimate_row_height,
+                    overscan=overscan,
+                    **props,
+                )
+
+            if isinstance(rows, Var) and rows_id is not None:
+                tbody = super().create(Foreach.create(rows, create_row), **props)
+                # the patched rows hooks must be rendered in the same component as the rows.
+                tbody._memoization_mode = MemoizationMode(recursive=False)
+                return tbody
+            if isinstance(rows, Var):
+                children = [Foreach.create(rows, create_row)]
             else:
                 children = [
-                    Tr.create(cell_type="data", cells=row) for row in rows or []
+                    Tr.create(
+                        cell_type="data", cells=row, numeric_columns=numeric_columns
+                    )
+                    for row in rows or []
                 ]
         return super().create(*children, **props)
 
+    @classmethod
+    def _create_virtualized(
+        cls,
+        rows,
+        create_row: Callable[[Var], Component],
+        row_height: int,
+        estimate_row_height: bool,
+        overscan: int,
+        **props,
+    ) -> Component:
+        """Create a table body that only renders the rows visible in its scroll container.
+
+        Args:
+            rows: The rows of the table body.
+            create_row: The function creating the component of a row.
+            row_height: The height of a row in pixels.
+            estimate_row_height: Whether to measure the actual row height.
+            overscan: The number of rows rendered above and below the visible ones.
+            **props: The properties of the component.
+
+        Returns:
+            The table body component.
+        """
+        window = VirtualWindow(
+            rows, item_height=row_height, overscan=overscan, measure=estimate_row_height
+        )
+        # the spacer rows keep the scroll height of the rows that are not rendered.
+        tbody = super().create(
+            Tr.create(height=window.space_before),
+            Foreach.create(window.items, create_row),
+            Tr.create(height=window.space_after),
+            ref=window.ref,
+            **props,
+        )
+        # the window hooks must be rendered in the same component as the ref.
+        tbody._memoization_mode = MemoizationMode(recursive=False)
+        return tbody
+
+    @staticmethod
+    def get_column_names(columns) -> Var | list | None:
+        """Get the names of the columns of a column-major table body.
+
+        Args:
+            columns: The columns of the table body.
+
+        Returns:
+            The column names, or None if the columns are not named.
+        """
+        if isinstance(columns, Var):
+            if types._issubclass(types.get_base_class(columns._var_type), Mapping):
+                return columns.to(dict).keys()
+            return None
+        if isinstance(columns, Mapping):
+            return list(columns)
+        return None
+
+    @staticmethod
+    def zip_columns(columns) -> Var:
+        """Convert column-major cells into rows, in the browser.
+
+        The columns are sent as parallel arrays, which avoids the per-row overhead of
+        serializing every row as its own array, and are zipped by the client.
+
+        Args:
+            columns: A dict of column name to values, or a list of columns. Columns may be
+                any sequence, including numpy arrays and pyarrow arrays.
+
+        Raises:
+            TypeError: If columns are not a dict or a list of columns.
+
+        Returns:
+            The rows var.
+        """
+        if not isinstance(columns, Var):
+            if isinstance(columns, Mapping):
+                # send the columns as a list, as JS objects put integer-like keys first
+                # and the headers follow the order of the dict.
+                columns = [_to_list(column) for column in columns.values()]
+            elif isinstance(columns, (list, tuple)):
+                columns = [_to_list(column) for column in columns]
+            else:
+                msg = f"table columns should be a dict or a list of columns. Got {type(columns)} instead"
+                raise TypeError(msg)
+            columns = Var.create(columns)
+        elif not types._issubclass(
+            types.get_base_class(columns._var_type), (Mapping, list, tuple)
+        ):
+            msg = f"table columns should be a dict or a list of columns. Got {columns._var_type} instead"
+            raise TypeError(msg)
+        # the values of a dict var follow the order of its keys, used as headers.
+        values = (
+            f"Object.values({columns!s})"
+            if types._issubclass(types.get_base_class(columns._var_type), Mapping)
+            else str(columns)
+        )
+        return Var(
+            _js_expr=f"((columns) => Array.from({{ length: columns[0]?.length ?? 0 }}, (_, index) => columns.map((column) => column[index])))({values})",
+            _var_type=list[list],
+            _var_data=columns._get_all_var_data(),
+        )
+
     @staticmethod
     def validate_rows(rows):
         """Type checking for table rows.
@@ -194,12 +694,19 @@ class Tfoot(ChakraComponent):
     _invalid_children: ClassVar[list[str]] = ["Tbody", "Thead", "Td", "Th", "Tfoot"]
 
     @classmethod
-    def create(cls, *children, footers=None, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        footers=None,
+        numeric_columns: Sequence[int] | None = None,
+        **props,
+    ) -> Component:
         """Create a table footer component.
 
         Args:
             *children: The children of the component.
             footers (list, optional): List of footers. Defaults to None.
+            numeric_columns: The indexes of the columns whose footers are right-aligned as numbers. Defaults to None.
             **props: The properties of the component.
 
         Returns:
@@ -207,7 +714,11 @@ class Tfoot(ChakraComponent):
         """
         if len(children) == 0:
             cls.validate_footers(footers)
-            children = [Tr.create(cell_type="header", cells=footers)]
+            children = [
+                Tr.create(
+                    cell_type="header", cells=footers, numeric_columns=numeric_columns
+                )
+            ]
         return super().create(*children, **props)
 
     @staticmethod
@@ -241,13 +752,21 @@ class Tr(ChakraComponent):
     _invalid_children: ClassVar[list[str]] = ["Tbody", "Thead", "Tfoot", "Tr"]
 
     @classmethod
-    def create(cls, *children, cell_type: str = "", cells=None, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        cell_type: str = "",
+        cells=None,
+        numeric_columns: Sequence[int] | None = None,
+        **props,
+    ) -> Component:
         """Create a table row component.
 
         Args:
             *children: The children of the component.
             cell_type: the type of cells in this table row. "header" or "data". Defaults to None.
             cells: The cells value to add in the table row. Defaults to None.
+            numeric_columns: The indexes of the cells that are right-aligned as numbers. Defaults to None.
             **props: The properties of the component.
 
         Returns:
@@ -256,13 +775,82 @@ class Tr(ChakraComponent):
         types = {"header": Th, "data": Td}
         cell_cls = types.get(cell_type)
         if len(children) == 0 and cell_cls:
-            if isinstance(cells, Var):
+            if isinstance(cells, Var) and numeric_columns:
+                children = [
+                    Foreach.create(
+                        cells,
+                        lambda cell, index: cell_cls.create(
+                            cell, **_numeric_props(index, numeric_columns)
+                        ),
+                    )
+                ]
+            elif isinstance(cells, Var):
                 children = [Foreach.create(cells, cell_cls.create)]
             else:
-                children = [cell_cls.create(cell) for cell in cells or []]
+                children = [
+                    cell_cls.create(cell, **_numeric_props(index, numeric_columns))
+                    for index, cell in enumerate(cells or [])
+                ]
         return super().create(*children, **props)
 
 
+class MemoizedTr(ChakraComponent):
+    """A table row of data cells that only re-renders when one of its cells changes."""
+
+    tag = "ChakraMemoizedTr"
+
+    # The row is defined in the page, not imported from chakra.
+    library = None
+
+    # The values of the cells in the row.
+    cells: Var[list]
+
+    # The indexes of the cells that are right-aligned as numbers.
+    numeric_columns: Var[list[int]]
+
+    def add_imports(self) -> ImportDict:
+        """Add imports for the memoized row.
+
+        Returns:
+            The import dict for the component.
+        """
+        return {
+            "react": ImportVar(tag="memo"),
+            ChakraComponent.library or "": [ImportVar(tag="Tr"), ImportVar(tag="Td")],
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the memoized row.
+
+        Every state update deserializes new row arrays, and the page renders new
+        numeric column arrays, so those are compared element by element instead of by
+        identity. The other props, such as styles and event handlers, are compared
+        shallowly.
+
+        Returns:
+            The custom code for the component.
+        """
+        return [
+            """const ChakraMemoizedTr = memo(
+    ({ cells, numericColumns, ...props }) =>
+        jsx(Tr, props, cells.map((cell, index) => jsx(Td, { key: index, isNumeric: numericColumns?.includes(index) }, cell))),
+    (prev, next) => {
+        const sameArray = (a, b) =>
+            a === b || (Array.isArray(a) && Array.isArray(b) && a.length === b.length && a.every((item, index) => Object.is(item, b[index])));
+        const { cells: prevCells, numericColumns: prevNumeric, ...prevProps } = prev;
+        const { cells: nextCells, numericColumns: nextNumeric, ...nextProps } = next;
+        const keys = Object.keys(prevProps);
+        return (
+            sameArray(prevCells, nextCells) &&
+            sameArray(prevNumeric, nextNumeric) &&
+            keys.length === Object.keys(nextProps).length &&
+            keys.every((key) => Object.hasOwn(nextProps, key) && Object.is(prevProps[key], nextProps[key]))
+        );
+    },
+);"""
+        ]
+
+
 class Th(ChakraComponent):
     """A table header cell component."""
 
@@ -300,3 +888,14 @@ class TableContainer(ChakraComponent):
     """The table container component renders a div that wraps the table component."""
 
     tag = "TableContainer"
+
+
+table = Table.create
+table_caption = TableCaption.create
+table_container = TableContainer.create
+tbody = Tbody.create
+td = Td.create
+tfoot = Tfoot.create
+th = Th.create
+thead = Thead.create
+tr = Tr.create
@@ -8,14 +8,17 @@ from typing import (
     Any,
 )
 
+from reflex.components.component import Component
 from reflex.components.core.breakpoints import Breakpoints
 from reflex.event import (
     EventType,
     PointerEventInfo,
 )
+from reflex.utils.imports import ImportDict
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.datadisplay.table_view import TableView
 
 class Table(ChakraComponent):
     @classmethod
@@ -26,6 +29,19 @@ class Table(ChakraComponent):
         headers=None,
         rows=None,
         footers=None,
+        columns=None,
+        virtualized: bool | None = False,
+        max_height: str | None = "60vh",
+        row_height: int | None = 40,
+        estimate_row_height: bool | None = False,
+        overscan: int | None = 10,
+        memoize_rows: bool | None = False,
+        row_key: int | None = None,
+        sortable: Sequence[int | str] | bool = False,
+        filter_text: Var[str] | str | None = None,
+        filter_columns: Sequence[int | str] | None = None,
+        numeric_columns: Sequence[int | str] | None = None,
+        rows_id: str | None = None,
         color_scheme: Var[str] | str | None = None,
         variant: Var[str] | str | None = None,
         size: Var[str] | str | None = None,
@@ -67,6 +83,19 @@ class Table(ChakraComponent):
             headers: The headers of the table component.
             rows: The rows of the table component.
             footers: The footers of the table component.
+            columns: The cells of the table component in column-major order, used instead of rows. When a dict of column name to values is given without headers, the names are used as headers.
+            virtualized: If true, only the rows visible in a scrollable container are rendered, and the headers and footers stick to its edges.
+            max_height: The height of the scrollable container of a virtualized table.
+            row_height: The height of a row in pixels in a virtualized table.
+            estimate_row_height: If true, row_height is only an estimate and the actual height is measured from the rendered rows.
+            overscan: The number of rows rendered above and below the visible ones in a virtualized table.
+            memoize_rows: If true, rows from a Var are memoized and only re-render when one of their cells changes.
+            row_key: The index of the column holding a stable key for each row, used with memoize_rows. Defaults to the row index.
+            sortable: The columns that are sorted in the browser when their header is clicked, as indexes or header names, or True for every column.
+            filter_text: Only the rows with a cell containing this text (case-insensitive) are shown. Filtering runs in the browser.
+            filter_columns: The columns searched by filter_text, as indexes or header names. Defaults to every column.
+            numeric_columns: The columns whose cells are right-aligned as numbers, as indexes or header names.
+            rows_id: An id the backend sends row deltas to, with append_table_rows, insert_table_rows, update_table_cell and delete_table_rows.
             color_scheme: The color scheme of the table
             variant: The variant of the table style to use
             size: The size of the table
@@ -84,12 +113,17 @@ class Table(ChakraComponent):
             The table component.
         """
 
+    @classmethod
+    def from_dataframe(cls, df, **props) -> Component: ...
+
 class Thead(ChakraComponent):
     @classmethod
     def create(
         cls,
         *children,
         headers=None,
+        view: TableView | None = None,
+        numeric_columns: Sequence[int] | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
         | Var[Mapping[str, Any]]
@@ -124,6 +158,8 @@ class Thead(ChakraComponent):
         Args:
             *children: The children of the component.
             headers (list, optional): List of headers. Defaults to None.
+            view: The client-side view sorted by clicking the headers. Defaults to None.
+            numeric_columns: The indexes of the columns whose headers are right-aligned as numbers. Defaults to None.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -146,6 +182,15 @@ class Tbody(ChakraComponent):
         cls,
         *children,
         rows=None,
+        columns=None,
+        virtualized: bool | None = False,
+        row_height: int | None = 40,
+        estimate_row_height: bool | None = False,
+        overscan: int | None = 10,
+        memoize_rows: bool | None = False,
+        row_key: int | None = None,
+        numeric_columns: Sequence[int] | None = None,
+        rows_id: str | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
         | Var[Mapping[str, Any]]
@@ -180,6 +225,15 @@ class Tbody(ChakraComponent):
         Args:
             *children: The children of the component.
             rows (list[list], optional): The rows of the table body. Defaults to None.
+            columns (dict[str, list] | list[list], optional): The cells of the table body in column-major order, used instead of rows. Defaults to None.
+            virtualized: If true, only the rows visible in the nearest scrollable container are rendered.
+            row_height: The height of a row in pixels when virtualized.
+            estimate_row_height: If true, row_height is only an estimate and the actual height is measured from the rendered rows.
+            overscan: The number of rows rendered above and below the visible ones when virtualized.
+            memoize_rows: If true, rows from a Var are memoized and only re-render when one of their cells changes.
+            row_key: The index of the column holding a stable key for each row, used with memoize_rows. Defaults to the row index.
+            numeric_columns: The indexes of the columns whose cells are right-aligned as numbers. Defaults to None.
+            rows_id: An id the backend sends row deltas to, patching the rows in the browser. Defaults to None.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -193,6 +247,10 @@ class Tbody(ChakraComponent):
             Component: The table body component
         """
 
+    @staticmethod
+    def get_column_names(columns) -> Var | list | None: ...
+    @staticmethod
+    def zip_columns(columns) -> Var: ...
     @staticmethod
     def validate_rows(rows): ...
 
@@ -202,6 +260,7 @@ class Tfoot(ChakraComponent):
         cls,
         *children,
         footers=None,
+        numeric_columns: Sequence[int] | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
         | Var[Mapping[str, Any]]
@@ -236,6 +295,7 @@ class Tfoot(ChakraComponent):
         Args:
             *children: The children of the component.
             footers (list, optional): List of footers. Defaults to None.
+            numeric_columns: The indexes of the columns whose footers are right-aligned as numbers. Defaults to None.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -259,6 +319,7 @@ class Tr(ChakraComponent):
         *children,
         cell_type: str | None = "",
         cells=None,
+        numeric_columns: Sequence[int] | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
         | Var[Mapping[str, Any]]
@@ -294,6 +355,7 @@ class Tr(ChakraComponent):
             *children: The children of the component.
             cell_type: the type of cells in this table row. "header" or "data". Defaults to None.
             cells: The cells value to add in the table row. Defaults to None.
+            numeric_columns: The indexes of the cells that are right-aligned as numbers. Defaults to None.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -307,6 +369,63 @@ class Tr(ChakraComponent):
             The table row component
         """
 
+class MemoizedTr(ChakraComponent):
+    def add_imports(self) -> ImportDict: ...
+    def add_custom_code(self) -> list[str]: ...
+    @classmethod
+    def create(
+        cls,
+        *children,
+        cells: Var[list] | list | None = None,
+        numeric_columns: Var[list[int]] | list[int] | None = None,
+        style: Sequence[Mapping[str, Any]]
+        | Mapping[str, Any]
+        | Var[Mapping[str, Any]]
+        | Breakpoints
+        | None = None,
+        key: Any | None = None,
+        id: Any | None = None,
+        ref: Var | None = None,
+        class_name: Any | None = None,
+        autofocus: bool | None = None,
+        custom_attrs: dict[str, Var | Any] | None = None,
+        on_blur: EventType[()] | None = None,
+        on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_focus: EventType[()] | None = None,
+        on_mount: EventType[()] | None = None,
+        on_mouse_down: EventType[()] | None = None,
+        on_mouse_enter: EventType[()] | None = None,
+        on_mouse_leave: EventType[()] | None = None,
+        on_mouse_move: EventType[()] | None = None,
+        on_mouse_out: EventType[()] | None = None,
+        on_mouse_over: EventType[()] | None = None,
+        on_mouse_up: EventType[()] | None = None,
+        on_scroll: EventType[()] | None = None,
+        on_scroll_end: EventType[()] | None = None,
+        on_unmount: EventType[()] | None = None,
+        **props,
+    ) -> MemoizedTr:
+        """Create a new Chakra component.
+
+        Args:
+            *children: The children of the component.
+            cells: The values of the cells in the row.
+            numeric_columns: The indexes of the cells that are right-aligned as numbers.
+            style: The style of the component.
+            key: A unique key for the component.
+            id: The id for the component.
+            ref: The Var to pass as the ref to the component.
+            class_name: The class name for the component.
+            autofocus: Whether the component should take the focus once the page is loaded
+            custom_attrs: custom attribute
+            **props: The properties of the component.
+
+        Returns:
+            A new Chakra component.
+        """
+
 class Th(ChakraComponent):
     @classmethod
     def create(
@@ -516,3 +635,13 @@ class TableContainer(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+table = Table.create
+table_caption = TableCaption.create
+table_container = TableContainer.create
+tbody = Tbody.create
+td = Td.create
+tfoot = Tfoot.create
+th = Th.create
+thead = Thead.create
+tr = Tr.create
@@ -0,0 +1,160 @@
+"""Incremental updates of table rows, sent from the backend as deltas."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from reflex.event import call_script
+from reflex.utils.format import json_dumps
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+from reflex.vars.sequence import ArrayVar
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from reflex.event import EventSpec
+
+
+def _event_name(rows_id: str) -> str:
+    return f"chakra-rows:{rows_id}"
+
+
+class PatchedRows:
+    """Table rows kept in the browser and patched in place by row deltas.
+
+    The rows start from a Var (or a literal list) and are copied once each time it
+    changes. The delta events returned by `append_table_rows`, `insert_table_rows`,
+    `update_table_cell` and `delete_table_rows` then patch the copy, so updating a
+    row only sends that row instead of the whole table.
+    """
+
+    def __init__(self, rows: Var | list | tuple, rows_id: str):
+        """Create the patched rows.
+
+        Args:
+            rows: The initial rows, either a Var or a literal list.
+            rows_id: The id the row delta events are sent to.
+        """
+        rows = Var.create(rows)
+        if not isinstance(rows, ArrayVar):
+            rows = rows.to(ArrayVar, rows._var_type)
+        name = f"rows_{get_unique_variable_name()}"
+        source, state = f"{name}_source", f"{name}_state"
+        hooks = [
+            f"const {source} = {rows!s};"
+            if rows._get_all_var_data()
+            else f"const {source} = useMemo(() => {rows!s}, []);",
+            # the rows are copied when the var changes, so patches never mutate the var.
+            f"const {state} = useRef(null);",
+            f"if ({state}.current?.source !== {source}) {state}.current = {{ source: {source}, rows: Array.from({source}) }};",
+            f"const [, set_{name}_version] = useState(0);",
+            f"""useEffect(() => {{
+    const patch = ({{ detail }}) => {{
+        const rows = {state}.current.rows;
+        for (const [op, ...args] of detail) {{
+            if (op === "append") {{
+                for (const row of args[0]) rows.push(row);
+            }} else if (op === "insert") {{
+                rows.splice(args[0], 0, ...args[1]);
+            }} else if (op === "update") {{
+                const [index, column, value] = args;
+                if (index < rows.length) {{
+                    // a new row array, so memoized rows see the change.
+                    rows[index] = Array.from(rows[index]);
+                    rows[index][column] = value;
+                }}
+            }} else if (op === "delete") {{
+                rows.splice(args[0], args[1] - args[0]);
+            }}
+        }}
+        set_{name}_version((version) => version + 1);
+    }};
+    window.addEventListener({json.dumps(_event_name(rows_id))}, patch);
+    return () => window.removeEventListener({json.dumps(_event_name(rows_id))}, patch);
+}}, []);""",
+        ]
+        self.rows = Var(
+            _js_expr=f"{state}.current.rows",
+            _var_type=list[list],
+            _var_data=VarData.merge(
+                rows._get_all_var_data(),
+                VarData(
+                    imports={"react": ["useEffect", "useMemo", "useRef", "useState"]},
+                    hooks=dict.fromkeys(hooks),
+                ),
+            ),
+        ).to(ArrayVar, list[list])
+
+
+def _patch_rows(rows_id: str, *ops: list) -> EventSpec:
+    """Send row deltas to the tables showing the rows with an id.
+
+    Args:
+        rows_id: The id of the rows.
+        *ops: The deltas, as an operation name followed by its arguments.
+
+    Returns:
+        The event patching the rows in the browser.
+    """
+    return call_script(
+        f"window.dispatchEvent(new CustomEvent({json.dumps(_event_name(rows_id))}, {{ detail: {json_dumps(list(ops))} }}))"
+    )
+
+
+def append_table_rows(rows_id: str, rows: Sequence[Sequence[Any]]) -> EventSpec:
+    """Append rows to the end of the rows of a table.
+
+    Args:
+        rows_id: The rows_id of the table.
+        rows: The rows to append.
+
+    Returns:
+        The event appending the rows in the browser.
+    """
+    return _patch_rows(rows_id, ["append", [list(row) for row in rows]])
+
+
+def insert_table_rows(
+    rows_id: str, index: int, rows: Sequence[Sequence[Any]]
+) -> EventSpec:
+    """Insert rows in the rows of a table.
+
+    Args:
+        rows_id: The rows_id of the table.
+        index: The index the first row is inserted at.
+        rows: The rows to insert.
+
+    Returns:
+        The event inserting the rows in the browser.
+    """
+    return _patch_rows(rows_id, ["insert", index, [list(row) for row in rows]])
+
+
+def update_table_cell(rows_id: str, row: int, column: int, value: Any) -> EventSpec:
+    """Update a cell of the rows of a table.
+
+    Args:
+        rows_id: The rows_id of the table.
+        row: The index of the row.
+        column: The index of the column.
+        value: The new value of the cell.
+
+    Returns:
+        The event updating the cell in the browser.
+    """
+    return _patch_rows(rows_id, ["update", row, column, value])
+
+
+def delete_table_rows(rows_id: str, start: int, end: int | None = None) -> EventSpec:
+    """Delete a range of the rows of a table.
+
+    Args:
+        rows_id: The rows_id of the table.
+        start: The index of the first deleted row.
+        end: The index after the last deleted row. Defaults to deleting only the first.
+
+    Returns:
+        The event deleting the rows in the browser.
+    """
+    return _patch_rows(rows_id, ["delete", start, start + 1 if end is None else end])
@@ -0,0 +1,201 @@
+"""Client-side sorting and filtering of table rows."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+from reflex.vars.sequence import ArrayVar
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class TableView:
+    """A sorted and filtered view of table rows, computed in the browser.
+
+    Rows are sorted and filtered over the rows already delivered to the browser, so
+    clicking a column header does not send an event to the backend. The sort order of
+    each column is computed once per rows update and cached, so switching between
+    columns, directions and multi-column sorts only compares integer ranks.
+    """
+
+    def __init__(
+        self,
+        rows: Var | list | tuple,
+        sortable: bool | Sequence[int] = True,
+        filter_text: Var | str | None = None,
+        filter_columns: Sequence[int] | None = None,
+    ):
+        """Create a view of the rows.
+
+        Args:
+            rows: The rows to sort and filter, either a Var or a literal list.
+            sortable: The indexes of the sortable columns, or True for every column.
+            filter_text: Only the rows with a cell containing this text (case-insensitive) are shown.
+            filter_columns: The indexes of the columns searched by filter_text. Defaults to every column.
+        """
+        rows = Var.create(rows)
+        if not isinstance(rows, ArrayVar):
+            rows = rows.to(ArrayVar, rows._var_type)
+        filter_text = Var.create(filter_text)
+
+        name = f"view_{get_unique_variable_name()}"
+        self._sort = f"{name}_sort"
+        self._toggle = f"{name}_toggle"
+        self._sortable = (
+            None if sortable is True else list(sortable) if sortable else []
+        )
+        rows_name, collator, orders, order, haystack = (
+            f"{name}_rows",
+            f"{name}_collator",
+            f"{name}_orders",
+            f"{name}_order",
+            f"{name}_haystack",
+        )
+        compare = f"""((a, b) => a == null ? (b == null ? 0 : 1) : b == null ? -1
+        : typeof a === "number" && typeof b === "number" ? a - b
+        : {collator}.compare(String(a), String(b)))"""
+        searched = (
+            "row"
+            if filter_columns is None
+            else f"{json.dumps(list(filter_columns))}.map((column) => row[column])"
+        )
+        hooks = [
+            f"const {rows_name} = {rows!s};"
+            if rows._get_all_var_data()
+            else f"const {rows_name} = useMemo(() => {rows!s}, []);",
+            f"const [{self._sort}, set_{self._sort}] = useState([]);",
+            f'const {collator} = useMemo(() => new Intl.Collator(undefined, {{ numeric: true, sensitivity: "base" }}), []);',
+            # the sort order and ranks of each column, cached until the rows change.
+            f"const {orders} = useMemo(() => new Map(), [{rows_name}]);",
+            f"""const {order} = (column) => {{
+    let cached = {orders}.get(column);
+    if (cached === undefined) {{
+        const compare = {compare};
+        const values = {rows_name}.map((row) => row[column]);
+        const order = Int32Array.from(values.keys()).sort((a, b) => compare(values[a], values[b]) || a - b);
+        const rank = new Int32Array(values.length);
+        order.forEach((index, position) => {{
+            const previous = order[position - 1];
+            // empty cells share the highest rank, to keep them last in both directions.
+            rank[index] = values[index] == null ? values.length
+                : position > 0 && compare(values[previous], values[index]) === 0 ? rank[previous] : position;
+        }});
+        cached = {{ order, rank }};
+        {orders}.set(column, cached);
+    }}
+    return cached;
+}};""",
+            f"const {haystack} = useRef(null);",
+            f"""const {name}_needle = String({filter_text!s} ?? "").trim().toLowerCase();""",
+            f"""const {name} = useMemo(() => {{
+    const rows = {rows_name};
+    const needle = {name}_needle;
+    let keep = null;
+    if (needle) {{
+        if ({haystack}.current?.rows !== rows) {{
+            {haystack}.current = {{ rows, text: rows.map((row) => {searched}.map((cell) => String(cell ?? "")).join("\\n").toLowerCase()) }};
+        }}
+        keep = {haystack}.current.text.map((text) => text.includes(needle));
+    }}
+    const sort = {self._sort};
+    if (sort.length === 0) return keep ? rows.filter((_, index) => keep[index]) : rows;
+    let indexes;
+    if (sort.length === 1 && !sort[0][1]) {{
+        indexes = Array.from({order}(sort[0][0]).order);
+    }} else {{
+        // tied rows keep their original order, whatever the direction.
+        const empty = rows.length;
+        const keys = sort.map(([column, descending]) => [{order}(column).rank, descending ? -1 : 1]);
+        indexes = [...rows.keys()].sort((a, b) => {{
+            for (const [rank, direction] of keys) {{
+                if (rank[a] === rank[b]) continue;
+                if (rank[a] === empty || rank[b] === empty) return rank[a] === empty ? 1 : -1;
+                return (rank[a] - rank[b]) * direction;
+            }}
+            return a - b;
+        }});
+    }}
+    if (keep) indexes = indexes.filter((index) => keep[index]);
+    return indexes.map((index) => rows[index]);
+}}, [{rows_name}, {self._sort}, {name}_needle]);""",
+            # a click sorts by a column, cycling ascending, descending and unsorted.
+            # with shift held, the column is added to the current sort instead.
+            f"""const {self._toggle} = (column, multi) => set_{self._sort}((sort) => {{
+    if ({json.dumps(self._sortable)}?.includes(column) === false) return sort;
+    const position = sort.findIndex(([key]) => key === column);
+    const current = sort[position];
+    const next = current === undefined ? [column, false] : current[1] ? null : [column, true];
+    if (!multi) return next ? [next] : [];
+    if (position < 0) return [...sort, next];
+    return next ? sort.map((key, index) => (index === position ? next : key)) : sort.filter((_, index) => index !== position);
+}});""",
+        ]
+        self._var_data = VarData.merge(
+            rows._get_all_var_data(),
+            filter_text._get_all_var_data(),
+            VarData(
+                imports={"react": ["useMemo", "useRef", "useState"]},
+                hooks=dict.fromkeys(hooks),
+            ),
+        )
+        self.rows = Var(
+            _js_expr=name, _var_type=list[list], _var_data=self._var_data
+        ).to(ArrayVar, list[list])
+
+    def _var(self, js_expr: str, var_type: type) -> Var:
+        return Var(_js_expr=js_expr, _var_type=var_type, _var_data=self._var_data)
+
+    def is_sortable(self, column: int) -> bool:
+        """Whether a column can be sorted.
+
+        Args:
+            column: The index of the column.
+
+        Returns:
+            True if the column is sortable.
+        """
+        return self._sortable is None or column in self._sortable
+
+    def on_click(self, column: Var | int) -> Var:
+        """The click handler of the header of a column.
+
+        Args:
+            column: The index of the column.
+
+        Returns:
+            The handler var.
+        """
+        return self._var(
+            f"((event) => {self._toggle}({column!s}, event.shiftKey))", object
+        )
+
+    def aria_sort(self, column: Var | int) -> Var:
+        """The aria-sort attribute of the header of a column.
+
+        Args:
+            column: The index of the column.
+
+        Returns:
+            The attribute var.
+        """
+        return self._var(
+            f'((key) => key === undefined ? "none" : key[1] ? "descending" : "ascending")({self._sort}.find(([key]) => key === {column!s}))',
+            str,
+        )
+
+    def indicator(self, column: Var | int) -> Var:
+        """The sort direction arrow of a column, numbered when sorting by several columns.
+
+        Args:
+            column: The index of the column.
+
+        Returns:
+            The indicator text var.
+        """
+        return self._var(
+            f'((position) => position < 0 ? "" : ({self._sort}[position][1] ? " ▼" : " ▲") + ({self._sort}.length > 1 ? position + 1 : ""))({self._sort}.findIndex(([key]) => key === {column!s}))',
+            str,
+        )
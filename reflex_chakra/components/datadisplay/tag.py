@@ -82,3 +82,10 @@ class Tag(ChakraComponent):
             x for x in (left_icon, label, right_icon, close_button) if x is not None
         ]
         return super().create(*children, **props)
+
+
+tag = Tag.create
+tag_close_button = TagCloseButton.create
+tag_label = TagLabel.create
+tag_left_icon = TagLeftIcon.create
+tag_right_icon = TagRightIcon.create
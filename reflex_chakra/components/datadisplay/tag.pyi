@@ -305,3 +305,9 @@ class Tag(ChakraComponent):
         Returns:
             The `create()` method returns a Tag object.
         """
+
+tag = Tag.create
+tag_close_button = TagCloseButton.create
+tag_label = TagLabel.create
+tag_left_icon = TagLeftIcon.create
+tag_right_icon = TagRightIcon.create
@@ -0,0 +1,85 @@
+"""Content rendered on the backend and loaded by the browser when first shown."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import ClassVar
+
+from reflex.components.base.fragment import Fragment
+from reflex.components.component import Component
+from reflex.components.core.cond import cond
+from reflex.components.dynamic import bundle_library, bundled_libraries
+from reflex.event import event
+from reflex.state import ComponentState
+from reflex.utils.format import format_library_name
+from reflex.vars.base import Field, computed_var, field
+
+from reflex_chakra.components import ChakraComponent
+
+# A function building the content, called on the backend when it is first shown.
+ContentRenderer = Callable[..., Component]
+
+
+class DeferredContent(ComponentState):
+    """Content built by a function the first time it is mounted in the browser.
+
+    The function is not called when the page is compiled, so the content is not part
+    of the page bundle. Once mounted, the browser asks the backend for the content,
+    which is rendered to a JavaScript module and evaluated by the browser, like a
+    chunk split from the page and loaded on demand.
+    """
+
+    # Whether the content was requested by the browser.
+    loaded: Field[bool] = field(False)
+
+    # The function building the content of this instance, set by get_component.
+    _render: ClassVar[ContentRenderer]
+
+    @event
+    def load(self):
+        """Build the content, on its first mount."""
+        self.loaded = True
+
+    # not cached, so the state never holds a component.
+    @computed_var(cache=False)
+    def content(self) -> Component:
+        """The content, once loaded.
+
+        Returns:
+            The component built by the function, or an empty fragment before it is loaded.
+        """
+        if not self.loaded:
+            return Fragment.create()
+        return type(self)._render()
+
+    @classmethod
+    def get_component(
+        cls,
+        *children,  # noqa: ARG003
+        render: ContentRenderer,
+        fallback: Component | None = None,
+        **props,
+    ) -> Component:
+        """Create the deferred content.
+
+        Args:
+            *children: Unused, the content comes from the function.
+            render: The function building the content.
+            fallback: The component shown while the content is loading.
+            **props: The properties of the fragment holding the content.
+
+        Returns:
+            The deferred content component.
+        """
+        cls._render = staticmethod(render)
+        # the loaded modules import chakra from the page, not from a CDN.
+        if format_library_name(ChakraComponent.library or "") not in bundled_libraries:
+            bundle_library(ChakraComponent.library or "")
+        return Fragment.create(
+            cond(cls.loaded, cls.content, fallback or Fragment.create()),
+            on_mount=cls.load,
+            **props,
+        )
+
+
+deferred_content = DeferredContent.create
@@ -1,31 +1,25 @@
 """Disclosure components."""
 
-from .accordion import (
-    Accordion,
-    AccordionButton,
-    AccordionIcon,
-    AccordionItem,
-    AccordionPanel,
-)
-from .tabs import Tab, TabList, TabPanel, TabPanels, Tabs
-from .transition import Collapse, Fade, ScaleFade, Slide, SlideFade
-from .visuallyhidden import VisuallyHidden
+from reflex.utils import lazy_loader
+
+_SUBMODULES: set[str] = {"accordion", "tabs", "transition", "visuallyhidden"}
 
-__all__ = [
-    "Accordion",
-    "AccordionButton",
-    "AccordionIcon",
-    "AccordionItem",
-    "AccordionPanel",
-    "Collapse",
-    "Fade",
-    "ScaleFade",
-    "Slide",
-    "SlideFade",
-    "Tab",
-    "TabList",
-    "TabPanel",
-    "TabPanels",
-    "Tabs",
-    "VisuallyHidden",
-]
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "accordion": [
+        "Accordion",
+        "AccordionButton",
+        "AccordionIcon",
+        "AccordionItem",
+        "AccordionPanel",
+        "LazyAccordionPanel",
+    ],
+    "tabs": ["DeferredTabPanel", "Tab", "TabList", "TabPanel", "TabPanels", "Tabs"],
+    "transition": ["Collapse", "Fade", "ScaleFade", "Slide", "SlideFade"],
+    "visuallyhidden": ["VisuallyHidden"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
@@ -0,0 +1,42 @@
+"""Stub file for reflex_chakra/components/disclosure/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import accordion, tabs, transition, visuallyhidden
+from .accordion import (
+    Accordion,
+    AccordionButton,
+    AccordionIcon,
+    AccordionItem,
+    AccordionPanel,
+    LazyAccordionPanel,
+)
+from .tabs import DeferredTabPanel, Tab, TabList, TabPanel, TabPanels, Tabs
+from .transition import Collapse, Fade, ScaleFade, Slide, SlideFade
+from .visuallyhidden import VisuallyHidden
+
+__all__ = [
+    "Accordion",
+    "AccordionButton",
+    "AccordionIcon",
+    "AccordionItem",
+    "AccordionPanel",
+    "Collapse",
+    "DeferredTabPanel",
+    "Fade",
+    "LazyAccordionPanel",
+    "ScaleFade",
+    "Slide",
+    "SlideFade",
+    "Tab",
+    "TabList",
+    "TabPanel",
+    "TabPanels",
+    "Tabs",
+    "VisuallyHidden",
+    "accordion",
+    "tabs",
+    "transition",
+    "visuallyhidden",
+]
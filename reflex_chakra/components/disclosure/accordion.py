@@ -1,9 +1,12 @@
 """Container to stack elements with spacing."""
 
 from reflex.components.component import Component
+from reflex.components.core.foreach import Foreach
+from reflex.utils.imports import ImportDict, ImportVar
 from reflex.vars.base import Var
 
-from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components import ChakraComponent, LiteralLazyBehavior
+from reflex_chakra.components.deferred import DeferredContent
 
 
 class Accordion(ChakraComponent):
@@ -34,40 +37,50 @@ class Accordion(ChakraComponent):
         icon_pos="right",
         allow_multiple: Var[bool] | None = None,
         allow_toggle: Var[bool] | None = None,
+        is_lazy: bool = False,
+        lazy_behavior: LiteralLazyBehavior | None = None,
         **props,
     ) -> Component:
         """Create an accordion component.
 
         Args:
             *children: The children of the component.
-            items: The items of the accordion component: list of tuples (label,panel)
+            items: The items of the accordion component: list of tuples (label,panel), or a Var of such a list rendered with a single foreach. A panel may be a function returning the panel content, which is only built and loaded when the panel is first expanded.
             icon_pos: The position of the arrow icon of the accordion. "right", "left" or None
             allow_multiple: The allow_multiple property of the accordion. (True or False)
             allow_toggle: The allow_toggle property of the accordion. (True or False)
+            is_lazy: If true, the content of the panels created from items is only mounted while they are expanded.
+            lazy_behavior: The lazy behavior of the panels created from items, as in AccordionPanel.
             **props: The properties of the component.
 
         Returns:
             The accordion component
         """
         if len(children) == 0:
-            children = []
-            if not items:
-                items = []
-            for label, panel in items:
+
+            def create_item(label, panel) -> Component:
                 if icon_pos == "right":
                     button = AccordionButton.create(label, AccordionIcon.create())
                 elif icon_pos == "left":
                     button = AccordionButton.create(AccordionIcon.create(), label)
                 else:
                     button = AccordionButton.create(label)
-
-                children.append(
-                    AccordionItem.create(
-                        button,
-                        AccordionPanel.create(panel),
-                    )
+                return AccordionItem.create(
+                    button,
+                    AccordionPanel.create(
+                        panel,
+                        is_lazy=is_lazy or None,
+                        lazy_behavior=lazy_behavior,
+                    ),
                 )
 
+            if isinstance(items, Var):
+                children = [
+                    Foreach.create(items, lambda item: create_item(item[0], item[1]))
+                ]
+            else:
+                children = [create_item(label, panel) for label, panel in items or []]
+
         # if allow_multiple is True, allow_toggle is implicitely used and does not need to be defined
         if allow_multiple:
             props.update({"allow_multiple": allow_multiple})
@@ -102,8 +115,101 @@ class AccordionPanel(ChakraComponent):
 
     tag = "AccordionPanel"
 
+    @classmethod
+    def create(
+        cls,
+        *children,
+        is_lazy: Var[bool] | bool | None = None,
+        lazy_behavior: Var[LiteralLazyBehavior] | LiteralLazyBehavior | None = None,
+        **props,
+    ) -> Component:
+        """Create an accordion panel component.
+
+        Args:
+            *children: The children of the component. A single function returning the content defers building and loading it until the panel is first expanded.
+            is_lazy: If true, the content of the panel is only mounted while it is expanded.
+            lazy_behavior: "unmount" unmounts the content when the panel collapses, "keepMounted" keeps it mounted once it was expanded. Implies is_lazy.
+            **props: The properties of the component.
+
+        Returns:
+            The accordion panel component.
+        """
+        if (
+            len(children) == 1
+            and callable(children[0])
+            and not isinstance(children[0], (Component, Var))
+        ):
+            children = (DeferredContent.create(render=children[0]),)
+            if is_lazy is None:
+                is_lazy = True
+        if is_lazy is not None or lazy_behavior is not None:
+            return LazyAccordionPanel.create(
+                *children,
+                is_lazy=is_lazy if is_lazy is not None else True,
+                lazy_behavior=lazy_behavior,
+                **props,
+            )
+        return super().create(*children, **props)
+
+
+class LazyAccordionPanel(ChakraComponent):
+    """An accordion panel whose content is only mounted while it is expanded."""
+
+    tag = "ChakraLazyAccordionPanel"
+
+    # The panel is defined in the page, not imported from chakra.
+    library = None
+
+    # Performance 🚀: If true, the content of the panel is not mounted while it is collapsed.
+    is_lazy: Var[bool]
+
+    # Performance 🚀: The lazy behavior of the content when collapsed. Only works when `isLazy={true}` - "unmount": The content is unmounted when the panel collapses. - "keepMounted": The content is initially unmounted, but stays mounted once the panel was expanded.
+    lazy_behavior: Var[LiteralLazyBehavior]
+
+    def add_imports(self) -> ImportDict:
+        """Add imports for the lazy panel.
+
+        Returns:
+            The import dict for the component.
+        """
+        return {
+            "react": ImportVar(tag="useRef"),
+            ChakraComponent.library or "": [
+                ImportVar(tag="AccordionPanel"),
+                ImportVar(tag="useAccordionItemState"),
+            ],
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the lazy panel.
+
+        With "unmount", the collapse transition unmounts the content once it ends, so
+        the panel still animates closed.
+
+        Returns:
+            The custom code for the component.
+        """
+        return [
+            """const ChakraLazyAccordionPanel = ({ isLazy = true, lazyBehavior = "unmount", motionProps, children, ...props }) => {
+    const { isOpen } = useAccordionItemState();
+    const wasOpen = useRef(false);
+    wasOpen.current ||= isOpen;
+    if (!isLazy) return jsx(AccordionPanel, { motionProps, ...props }, children);
+    if (lazyBehavior === "keepMounted") return jsx(AccordionPanel, { motionProps, ...props }, wasOpen.current ? children : null);
+    return jsx(AccordionPanel, { ...props, motionProps: { ...motionProps, unmountOnExit: true } }, children);
+};"""
+        ]
+
 
 class AccordionIcon(ChakraComponent):
     """A chevron-down icon that rotates based on the expanded/collapsed state."""
 
     tag = "AccordionIcon"
+
+
+accordion = Accordion.create
+accordion_button = AccordionButton.create
+accordion_icon = AccordionIcon.create
+accordion_item = AccordionItem.create
+accordion_panel = AccordionPanel.create
+lazy_accordion_panel = LazyAccordionPanel.create
@@ -6,6 +6,7 @@
 from collections.abc import Mapping, Sequence
 from typing import (
     Any,
+    Literal,
 )
 
 from reflex.components.core.breakpoints import Breakpoints
@@ -13,6 +14,7 @@ from reflex.event import (
     EventType,
     PointerEventInfo,
 )
+from reflex.utils.imports import ImportDict
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
@@ -26,6 +28,8 @@ class Accordion(ChakraComponent):
         icon_pos="right",
         allow_multiple: Var[bool] | bool | None = None,
         allow_toggle: Var[bool] | bool | None = None,
+        is_lazy: bool | None = False,
+        lazy_behavior: Literal["keepMounted", "unmount"] | None = None,
         default_index: Var[list[int] | None] | list[int] | None = None,
         index: Var[int | list[int]] | int | list[int] | None = None,
         reduce_motion: Var[bool] | bool | None = None,
@@ -62,10 +66,12 @@ class Accordion(ChakraComponent):
 
         Args:
             *children: The children of the component.
-            items: The items of the accordion component: list of tuples (label,panel)
+            items: The items of the accordion component: list of tuples (label,panel), or a Var of such a list rendered with a single foreach. A panel may be a function returning the panel content, which is only built and loaded when the panel is first expanded.
             icon_pos: The position of the arrow icon of the accordion. "right", "left" or None
             allow_multiple: The allow_multiple property of the accordion. (True or False)
             allow_toggle: The allow_toggle property of the accordion. (True or False)
+            is_lazy: If true, the content of the panels created from items is only mounted while they are expanded.
+            lazy_behavior: The lazy behavior of the panels created from items, as in AccordionPanel.
             default_index: The initial index(es) of the expanded accordion item(s).
             index: The index(es) of the expanded accordion item
             reduce_motion: If true, height animation and transitions will be disabled.
@@ -195,6 +201,10 @@ class AccordionPanel(ChakraComponent):
     def create(
         cls,
         *children,
+        is_lazy: Var[bool] | bool | None = None,
+        lazy_behavior: Literal["keepMounted", "unmount"]
+        | Var[Literal["keepMounted", "unmount"]]
+        | None = None,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
         | Var[Mapping[str, Any]]
@@ -224,10 +234,71 @@ class AccordionPanel(ChakraComponent):
         on_unmount: EventType[()] | None = None,
         **props,
     ) -> AccordionPanel:
+        """Create an accordion panel component.
+
+        Args:
+            *children: The children of the component. A single function returning the content defers building and loading it until the panel is first expanded.
+            is_lazy: If true, the content of the panel is only mounted while it is expanded.
+            lazy_behavior: "unmount" unmounts the content when the panel collapses, "keepMounted" keeps it mounted once it was expanded. Implies is_lazy.
+            style: The style of the component.
+            key: A unique key for the component.
+            id: The id for the component.
+            ref: The Var to pass as the ref to the component.
+            class_name: The class name for the component.
+            autofocus: Whether the component should take the focus once the page is loaded
+            custom_attrs: custom attribute
+            **props: The properties of the component.
+
+        Returns:
+            The accordion panel component.
+        """
+
+class LazyAccordionPanel(ChakraComponent):
+    def add_imports(self) -> ImportDict: ...
+    def add_custom_code(self) -> list[str]: ...
+    @classmethod
+    def create(
+        cls,
+        *children,
+        is_lazy: Var[bool] | bool | None = None,
+        lazy_behavior: Literal["keepMounted", "unmount"]
+        | Var[Literal["keepMounted", "unmount"]]
+        | None = None,
+        style: Sequence[Mapping[str, Any]]
+        | Mapping[str, Any]
+        | Var[Mapping[str, Any]]
+        | Breakpoints
+        | None = None,
+        key: Any | None = None,
+        id: Any | None = None,
+        ref: Var | None = None,
+        class_name: Any | None = None,
+        autofocus: bool | None = None,
+        custom_attrs: dict[str, Var | Any] | None = None,
+        on_blur: EventType[()] | None = None,
+        on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_focus: EventType[()] | None = None,
+        on_mount: EventType[()] | None = None,
+        on_mouse_down: EventType[()] | None = None,
+        on_mouse_enter: EventType[()] | None = None,
+        on_mouse_leave: EventType[()] | None = None,
+        on_mouse_move: EventType[()] | None = None,
+        on_mouse_out: EventType[()] | None = None,
+        on_mouse_over: EventType[()] | None = None,
+        on_mouse_up: EventType[()] | None = None,
+        on_scroll: EventType[()] | None = None,
+        on_scroll_end: EventType[()] | None = None,
+        on_unmount: EventType[()] | None = None,
+        **props,
+    ) -> LazyAccordionPanel:
         """Create a new Chakra component.
 
         Args:
             *children: The children of the component.
+            is_lazy: Performance 🚀: If true, the content of the panel is not mounted while it is collapsed.
+            lazy_behavior: Performance 🚀: The lazy behavior of the content when collapsed. Only works when `isLazy={true}` - "unmount": The content is unmounted when the panel collapses. - "keepMounted": The content is initially unmounted, but stays mounted once the panel was expanded.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -291,3 +362,10 @@ class AccordionIcon(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+accordion = Accordion.create
+accordion_button = AccordionButton.create
+accordion_icon = AccordionIcon.create
+accordion_item = AccordionItem.create
+accordion_panel = AccordionPanel.create
+lazy_accordion_panel = LazyAccordionPanel.create
@@ -3,6 +3,8 @@
 from typing import ClassVar
 
 from reflex.components.component import Component
+from reflex.components.core.foreach import Foreach
+from reflex.utils.imports import ImportDict, ImportVar
 from reflex.vars.base import Var
 
 from reflex_chakra.components import (
@@ -11,6 +13,11 @@ from reflex_chakra.components import (
     LiteralTabsVariant,
     LiteralTagAlign,
 )
+from reflex_chakra.components.deferred import DeferredContent
+
+
+def _is_panel_function(panel: object) -> bool:
+    return callable(panel) and not isinstance(panel, (Component, Var))
 
 
 class Tabs(ChakraComponent):
@@ -50,27 +57,40 @@ class Tabs(ChakraComponent):
 
     @classmethod
     def create(
-        cls, *children, items: list[tuple[str, str]] | None = None, **props
+        cls,
+        *children,
+        items: Var[list[tuple[str, str]]] | list[tuple[str, str]] | None = None,
+        prefetch: bool = False,
+        **props,
     ) -> Component:
         """Create a tab component.
 
         Args:
             *children: The children of the component.
-            items: The items for the tabs component, a list of tuple (label, panel)
+            items: The items for the tabs component, a list of tuple (label, panel), or a Var of such a list rendered with a single foreach. A panel may be a function returning the panel content, which is only built and loaded when the tab is first selected.
+            prefetch: If true, the panels created from functions in items are also loaded when the browser is idle after a tab next to them is selected.
             **props: The properties of the component.
 
         Returns:
             The tab component
         """
         if len(children) == 0:
-            tabs = []
-            panels = []
-            if not items:
-                items = []
-            for label, panel in items:
-                tabs.append(Tab.create(label))
-                panels.append(TabPanel.create(panel))
-            children = [TabList.create(*tabs), TabPanels.create(*panels)]
+            if isinstance(items, Var):
+                children = [
+                    TabList.create(
+                        Foreach.create(items, lambda item: Tab.create(item[0]))
+                    ),
+                    TabPanels.create(
+                        Foreach.create(items, lambda item: TabPanel.create(item[1]))
+                    ),
+                ]
+            else:
+                tabs = []
+                panels = []
+                for label, panel in items or []:
+                    tabs.append(Tab.create(label))
+                    panels.append(TabPanel.create(panel, prefetch=prefetch))
+                children = [TabList.create(*tabs), TabPanels.create(*panels)]
         return super().create(*children, **props)
 
 
@@ -109,6 +129,23 @@ class TabPanels(ChakraComponent):
 
     _valid_parents: ClassVar[list[str]] = ["Tabs"]
 
+    @classmethod
+    def create(cls, *children, **props) -> Component:
+        """Create a tab panels component.
+
+        Args:
+            *children: The tab panels.
+            **props: The properties of the component.
+
+        Returns:
+            The tab panels component.
+        """
+        # deferred panels compare their position with the selected tab to prefetch.
+        for index, child in enumerate(children):
+            if isinstance(child, DeferredTabPanel) and child.index is None:
+                child.index = Var.create(index)
+        return super().create(*children, **props)
+
 
 class TabPanel(ChakraComponent):
     """An element that contains the content associated with a tab."""
@@ -116,3 +153,91 @@ class TabPanel(ChakraComponent):
     tag = "TabPanel"
 
     _valid_parents: ClassVar[list[str]] = ["TabPanels"]
+
+    @classmethod
+    def create(cls, *children, prefetch: bool = False, **props) -> Component:
+        """Create a tab panel component.
+
+        Args:
+            *children: The children of the component. A single function returning the content defers building and loading it until the tab is first selected.
+            prefetch: If true and the content comes from a function, it is also loaded when the browser is idle after a tab next to this one is selected.
+            **props: The properties of the component.
+
+        Returns:
+            The tab panel component.
+        """
+        if len(children) == 1 and _is_panel_function(children[0]):
+            return DeferredTabPanel.create(
+                DeferredContent.create(render=children[0]),
+                prefetch=prefetch,
+                **props,
+            )
+        return super().create(*children, **props)
+
+
+class DeferredTabPanel(ChakraComponent):
+    """A tab panel whose content is only mounted once its tab was selected."""
+
+    tag = "ChakraDeferredTabPanel"
+
+    # The panel is defined in the page, not imported from chakra.
+    library = None
+
+    # The position of the panel in the tab panels, set by TabPanels.
+    index: Var[int]
+
+    # If true, the content is also mounted when the browser is idle after a tab next to this one is selected.
+    prefetch: Var[bool]
+
+    _valid_parents: ClassVar[list[str]] = ["TabPanels"]
+
+    def add_imports(self) -> ImportDict:
+        """Add imports for the deferred panel.
+
+        Returns:
+            The import dict for the component.
+        """
+        return {
+            "react": [ImportVar(tag="useEffect"), ImportVar(tag="useState")],
+            ChakraComponent.library or "": [
+                ImportVar(tag="TabPanel"),
+                ImportVar(tag="useTabsContext"),
+            ],
+        }
+
+    def add_custom_code(self) -> list[str]:
+        """Define the deferred panel.
+
+        TabPanels passes isSelected to each of its children, and the content stays
+        mounted once the tab was selected.
+
+        Returns:
+            The custom code for the component.
+        """
+        return [
+            """const ChakraDeferredTabPanel = ({ index, prefetch = false, isSelected, children, ...props }) => {
+    const { selectedIndex } = useTabsContext();
+    const [active, setActive] = useState(!!isSelected);
+    useEffect(() => {
+        if (active) return;
+        if (isSelected) {
+            setActive(true);
+            return;
+        }
+        if (!prefetch || index === undefined || Math.abs(selectedIndex - index) !== 1) return;
+        const requestIdle = window.requestIdleCallback ?? ((callback) => setTimeout(callback, 200));
+        const cancelIdle = window.cancelIdleCallback ?? clearTimeout;
+        const handle = requestIdle(() => setActive(true));
+        return () => cancelIdle(handle);
+    }, [active, isSelected, prefetch, index, selectedIndex]);
+    return jsx(TabPanel, { isSelected, ...props }, active ? children : null);
+};"""
+        ]
+
+
+tab = Tab.create
+tab_list = TabList.create
+tab_panel = TabPanel.create
+deferred_tab_panel = DeferredTabPanel.create
+tab_panels = TabPanels.create
+tabs = Tabs.create
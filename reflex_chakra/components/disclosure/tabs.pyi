@@ -14,6 +14,7 @@ from reflex.event import (
     EventType,
     PointerEventInfo,
 )
+from reflex.utils.imports import ImportDict
 from reflex.vars.base import Var
 
 from reflex_chakra.components import (
@@ -25,7 +26,8 @@ class Tabs(ChakraComponent):
     def create(
         cls,
         *children,
-        items: list[tuple[str, str]] | None = None,
+        items: Var[list[tuple[str, str]]] | list[tuple[str, str]] | None = None,
+        prefetch: bool | None = False,
         align: Literal["center", "end", "start"]
         | Var[Literal["center", "end", "start"]]
         | None = None,
@@ -133,7 +135,8 @@ class Tabs(ChakraComponent):
 
         Args:
             *children: The children of the component.
-            items: The items for the tabs component, a list of tuple (label, panel)
+            items: The items for the tabs component, a list of tuple (label, panel), or a Var of such a list rendered with a single foreach. A panel may be a function returning the panel content, which is only built and loaded when the tab is first selected.
+            prefetch: If true, the panels created from functions in items are also loaded when the browser is idle after a tab next to them is selected.
             align: The alignment of the tabs ("center" | "end" | "start").
             default_index: The initial index of the selected tab (in uncontrolled mode).
             id_: The id of the tab.
@@ -301,10 +304,10 @@ class TabPanels(ChakraComponent):
         on_unmount: EventType[()] | None = None,
         **props,
     ) -> TabPanels:
-        """Create a new Chakra component.
+        """Create a tab panels component.
 
         Args:
-            *children: The children of the component.
+            *children: The tab panels.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -315,7 +318,7 @@ class TabPanels(ChakraComponent):
             **props: The properties of the component.
 
         Returns:
-            A new Chakra component.
+            The tab panels component.
         """
 
 class TabPanel(ChakraComponent):
@@ -323,6 +326,7 @@ class TabPanel(ChakraComponent):
     def create(
         cls,
         *children,
+        prefetch: bool | None = False,
         style: Sequence[Mapping[str, Any]]
         | Mapping[str, Any]
         | Var[Mapping[str, Any]]
@@ -352,10 +356,68 @@ class TabPanel(ChakraComponent):
         on_unmount: EventType[()] | None = None,
         **props,
     ) -> TabPanel:
+        """Create a tab panel component.
+
+        Args:
+            *children: The children of the component. A single function returning the content defers building and loading it until the tab is first selected.
+            prefetch: If true and the content comes from a function, it is also loaded when the browser is idle after a tab next to this one is selected.
+            style: The style of the component.
+            key: A unique key for the component.
+            id: The id for the component.
+            ref: The Var to pass as the ref to the component.
+            class_name: The class name for the component.
+            autofocus: Whether the component should take the focus once the page is loaded
+            custom_attrs: custom attribute
+            **props: The properties of the component.
+
+        Returns:
+            The tab panel component.
+        """
+
+class DeferredTabPanel(ChakraComponent):
+    def add_imports(self) -> ImportDict: ...
+    def add_custom_code(self) -> list[str]: ...
+    @classmethod
+    def create(
+        cls,
+        *children,
+        index: Var[int] | int | None = None,
+        prefetch: Var[bool] | bool | None = None,
+        style: Sequence[Mapping[str, Any]]
+        | Mapping[str, Any]
+        | Var[Mapping[str, Any]]
+        | Breakpoints
+        | None = None,
+        key: Any | None = None,
+        id: Any | None = None,
+        ref: Var | None = None,
+        class_name: Any | None = None,
+        autofocus: bool | None = None,
+        custom_attrs: dict[str, Var | Any] | None = None,
+        on_blur: EventType[()] | None = None,
+        on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_focus: EventType[()] | None = None,
+        on_mount: EventType[()] | None = None,
+        on_mouse_down: EventType[()] | None = None,
+        on_mouse_enter: EventType[()] | None = None,
+        on_mouse_leave: EventType[()] | None = None,
+        on_mouse_move: EventType[()] | None = None,
+        on_mouse_out: EventType[()] | None = None,
+        on_mouse_over: EventType[()] | None = None,
+        on_mouse_up: EventType[()] | None = None,
+        on_scroll: EventType[()] | None = None,
+        on_scroll_end: EventType[()] | None = None,
+        on_unmount: EventType[()] | None = None,
+        **props,
+    ) -> DeferredTabPanel:
         """Create a new Chakra component.
 
         Args:
             *children: The children of the component.
+            index: The position of the panel in the tab panels, set by TabPanels.
+            prefetch: If true, the content is also mounted when the browser is idle after a tab next to this one is selected.
             style: The style of the component.
             key: A unique key for the component.
             id: The id for the component.
@@ -368,3 +430,10 @@ class TabPanel(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+tab = Tab.create
+tab_list = TabList.create
+tab_panel = TabPanel.create
+deferred_tab_panel = DeferredTabPanel.create
+tab_panels = TabPanels.create
+tabs = Tabs.create
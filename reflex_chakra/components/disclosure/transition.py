@@ -70,3 +70,10 @@ class Collapse(Transition):
 
     # The height you want the content in its collapsed state.
     startingHeight: Var[str | int]  # noqa: N815
+
+
+collapse = Collapse.create
+fade = Fade.create
+scale_fade = ScaleFade.create
+slide = Slide.create
+slide_fade = SlideFade.create
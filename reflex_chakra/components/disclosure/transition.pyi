@@ -364,3 +364,9 @@ class Collapse(Transition):
         Returns:
             A new Chakra component.
         """
+
+collapse = Collapse.create
+fade = Fade.create
+scale_fade = ScaleFade.create
+slide = Slide.create
+slide_fade = SlideFade.create
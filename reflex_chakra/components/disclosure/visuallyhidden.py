@@ -7,3 +7,6 @@ class VisuallyHidden(ChakraComponent):
     """A component that visually hides content while still allowing it to be read by screen readers."""
 
     tag = "VisuallyHidden"
+
+
+visually_hidden = VisuallyHidden.create
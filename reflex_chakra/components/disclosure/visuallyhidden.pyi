@@ -67,3 +67,5 @@ class VisuallyHidden(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+visually_hidden = VisuallyHidden.create
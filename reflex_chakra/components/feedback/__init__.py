@@ -1,21 +1,19 @@
 """Convenience functions to define core components."""
 
-from .alert import Alert, AlertDescription, AlertIcon, AlertTitle
-from .circularprogress import CircularProgress, CircularProgressLabel
-from .progress import Progress
-from .skeleton import Skeleton, SkeletonCircle, SkeletonText
-from .spinner import Spinner
+from reflex.utils import lazy_loader
 
-__all__ = [
-    "Alert",
-    "AlertDescription",
-    "AlertIcon",
-    "AlertTitle",
-    "CircularProgress",
-    "CircularProgressLabel",
-    "Progress",
-    "Skeleton",
-    "SkeletonCircle",
-    "SkeletonText",
-    "Spinner",
-]
+_SUBMODULES: set[str] = {"alert", "circularprogress", "progress", "skeleton", "spinner"}
+
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "alert": ["Alert", "AlertDescription", "AlertIcon", "AlertTitle"],
+    "circularprogress": ["CircularProgress", "CircularProgressLabel"],
+    "progress": ["Progress"],
+    "skeleton": ["Skeleton", "SkeletonCircle", "SkeletonText"],
+    "spinner": ["Spinner"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
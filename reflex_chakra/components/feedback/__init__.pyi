@@ -0,0 +1,30 @@
+"""Stub file for reflex_chakra/components/feedback/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import alert, circularprogress, progress, skeleton, spinner
+from .alert import Alert, AlertDescription, AlertIcon, AlertTitle
+from .circularprogress import CircularProgress, CircularProgressLabel
+from .progress import Progress
+from .skeleton import Skeleton, SkeletonCircle, SkeletonText
+from .spinner import Spinner
+
+__all__ = [
+    "Alert",
+    "AlertDescription",
+    "AlertIcon",
+    "AlertTitle",
+    "CircularProgress",
+    "CircularProgressLabel",
+    "Progress",
+    "Skeleton",
+    "SkeletonCircle",
+    "SkeletonText",
+    "Spinner",
+    "alert",
+    "circularprogress",
+    "progress",
+    "skeleton",
+    "spinner",
+]
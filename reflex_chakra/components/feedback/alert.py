@@ -67,3 +67,9 @@ class AlertDescription(ChakraComponent):
     """AlertDescription composes the Box component."""
 
     tag = "AlertDescription"
+
+
+alert = Alert.create
+alert_description = AlertDescription.create
+alert_icon = AlertIcon.create
+alert_title = AlertTitle.create
@@ -235,3 +235,8 @@ class AlertDescription(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+alert = Alert.create
+alert_description = AlertDescription.create
+alert_icon = AlertIcon.create
+alert_title = AlertTitle.create
@@ -65,3 +65,7 @@ class CircularProgressLabel(ChakraComponent):
     """Label of CircularProcess."""
 
     tag = "CircularProgressLabel"
+
+
+circular_progress = CircularProgress.create
+circular_progress_label = CircularProgressLabel.create
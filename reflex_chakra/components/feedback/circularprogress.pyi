@@ -140,3 +140,6 @@ class CircularProgressLabel(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+circular_progress = CircularProgress.create
+circular_progress_label = CircularProgressLabel.create
@@ -30,3 +30,6 @@ class Progress(ChakraComponent):
 
     # The color scheme of the progress bar.
     color_scheme: Var[str]
+
+
+progress = Progress.create
@@ -81,3 +81,5 @@ class Progress(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+progress = Progress.create
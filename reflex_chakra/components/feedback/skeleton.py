@@ -69,3 +69,8 @@ class SkeletonText(ChakraComponent):
 
     # Number is lines of text.
     no_of_lines: Var[int]
+
+
+skeleton = Skeleton.create
+skeleton_circle = SkeletonCircle.create
+skeleton_text = SkeletonText.create
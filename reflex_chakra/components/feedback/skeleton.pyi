@@ -201,3 +201,7 @@ class SkeletonText(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+skeleton = Skeleton.create
+skeleton_circle = SkeletonCircle.create
+skeleton_text = SkeletonText.create
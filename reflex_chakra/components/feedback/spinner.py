@@ -24,3 +24,6 @@ class Spinner(ChakraComponent):
 
     # "xs" | "sm" | "md" | "lg" | "xl"
     size: Var[LiteralSpinnerSize]
+
+
+spinner = Spinner.create
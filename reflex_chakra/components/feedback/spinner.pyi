@@ -80,3 +80,5 @@ class Spinner(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+spinner = Spinner.create
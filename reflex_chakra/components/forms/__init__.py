@@ -1,99 +1,86 @@
 """Convenience functions to define core components."""
 
-from reflex.components.el.elements.forms import Option
+from reflex.utils import lazy_loader
 
-from .button import Button, ButtonGroup
-from .checkbox import Checkbox, CheckboxGroup
-from .colormodeswitch import (
-    ColorModeButton,
-    ColorModeScript,
-    ColorModeSwitch,
-)
-from .date_picker import DatePicker
-from .date_time_picker import DateTimePicker
-from .editable import Editable, EditableInput, EditablePreview, EditableTextarea
-from .email import Email
-from .form import Form, FormControl, FormErrorMessage, FormHelperText, FormLabel
-from .iconbutton import IconButton
-from .input import (
-    Input,
-    InputGroup,
-    InputLeftAddon,
-    InputLeftElement,
-    InputRightAddon,
-    InputRightElement,
-)
-from .numberinput import (
-    NumberDecrementStepper,
-    NumberIncrementStepper,
-    NumberInput,
-    NumberInputField,
-    NumberInputStepper,
-)
-from .password import Password
-from .pininput import PinInput, PinInputField
-from .radio import Radio, RadioGroup
-from .rangeslider import (
-    RangeSlider,
-    RangeSliderFilledTrack,
-    RangeSliderThumb,
-    RangeSliderTrack,
-)
-from .select import Select
-from .slider import Slider, SliderFilledTrack, SliderMark, SliderThumb, SliderTrack
-from .switch import Switch
-from .textarea import TextArea
-from .time_picker import TimePicker
+_SUBMODULES: set[str] = {
+    "autocomplete",
+    "button",
+    "checkbox",
+    "coalesce",
+    "colormodeswitch",
+    "date_picker",
+    "date_time_picker",
+    "editable",
+    "email",
+    "form",
+    "iconbutton",
+    "input",
+    "numberinput",
+    "password",
+    "pininput",
+    "radio",
+    "rangeslider",
+    "select",
+    "slider",
+    "switch",
+    "textarea",
+    "time_picker",
+    "validation",
+    "virtual_select",
+}
+
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "autocomplete": ["Autocomplete"],
+    "button": ["Button", "ButtonGroup"],
+    "checkbox": ["Checkbox", "CheckboxGroup"],
+    "colormodeswitch": ["ColorModeButton", "ColorModeScript", "ColorModeSwitch"],
+    "date_picker": ["DatePicker"],
+    "date_time_picker": ["DateTimePicker"],
+    "editable": ["Editable", "EditableInput", "EditablePreview", "EditableTextarea"],
+    "email": ["Email"],
+    "form": ["Form", "FormControl", "FormErrorMessage", "FormHelperText", "FormLabel"],
+    "iconbutton": ["IconButton"],
+    "input": [
+        "Input",
+        "InputGroup",
+        "InputLeftAddon",
+        "InputLeftElement",
+        "InputRightAddon",
+        "InputRightElement",
+    ],
+    "numberinput": [
+        "NumberDecrementStepper",
+        "NumberIncrementStepper",
+        "NumberInput",
+        "NumberInputField",
+        "NumberInputStepper",
+    ],
+    "password": ["Password"],
+    "pininput": ["PinInput", "PinInputField"],
+    "radio": ["Radio", "RadioGroup"],
+    "rangeslider": [
+        "RangeSlider",
+        "RangeSliderFilledTrack",
+        "RangeSliderThumb",
+        "RangeSliderTrack",
+    ],
+    "select": ["Option", "Select"],
+    "slider": [
+        "Slider",
+        "SliderFilledTrack",
+        "SliderMark",
+        "SliderThumb",
+        "SliderTrack",
+    ],
+    "switch": ["Switch"],
+    "textarea": ["TextArea"],
+    "time_picker": ["TimePicker"],
+    "validation": ["ValidationRule"],
+    "virtual_select": ["VirtualSelect"],
+}
 
-__all__ = [
-    "Button",
-    "ButtonGroup",
-    "Checkbox",
-    "CheckboxGroup",
-    "ColorModeButton",
-    "ColorModeScript",
-    "ColorModeSwitch",
-    "DatePicker",
-    "DateTimePicker",
-    "Editable",
-    "EditableInput",
-    "EditablePreview",
-    "EditableTextarea",
-    "Email",
-    "Form",
-    "FormControl",
-    "FormErrorMessage",
-    "FormHelperText",
-    "FormLabel",
-    "IconButton",
-    "Input",
-    "InputGroup",
-    "InputLeftAddon",
-    "InputLeftElement",
-    "InputRightAddon",
-    "InputRightElement",
-    "NumberDecrementStepper",
-    "NumberIncrementStepper",
-    "NumberInput",
-    "NumberInputField",
-    "NumberInputStepper",
-    "Option",
-    "Password",
-    "PinInput",
-    "PinInputField",
-    "Radio",
-    "RadioGroup",
-    "RangeSlider",
-    "RangeSliderFilledTrack",
-    "RangeSliderThumb",
-    "RangeSliderTrack",
-    "Select",
-    "Slider",
-    "SliderFilledTrack",
-    "SliderMark",
-    "SliderThumb",
-    "SliderTrack",
-    "Switch",
-    "TextArea",
-    "TimePicker",
-]
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
@@ -0,0 +1,412 @@
+"""An input suggesting completions searched in the backend."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from reflex.components.component import Component
+from reflex.components.core.cond import cond
+from reflex.components.core.foreach import Foreach
+from reflex.constants import Hooks, Imports, MemoizationMode
+from reflex.event import EventChain, EventHandler, passthrough_event_spec
+from reflex.vars.base import LiteralVar, Var, VarData
+
+from reflex_chakra.components.forms.autocomplete_search import (
+    AutocompleteSearch,
+    SelectOptionsSource,
+)
+from reflex_chakra.components.forms.input import Input
+from reflex_chakra.components.layout.box import Box
+from reflex_chakra.components.overlay.popover import (
+    Popover,
+    PopoverAnchor,
+    PopoverContent,
+)
+from reflex_chakra.components.sources import hook_var, next_request, unique_names
+
+if TYPE_CHECKING:
+    from reflex_chakra.components import LiteralButtonSize, LiteralInputVariant
+
+
+class Autocomplete(Box):
+    """An input showing the suggestions of a backend search in a popover.
+
+    Queries are sent once typing pauses, and a query superseded by a newer one is
+    cancelled. The suggestions of each query are kept in an LRU cache in the browser,
+    so typing a query again does not send it. When the cached suggestions of a shorter
+    prefix of the query hold every match, the query is answered by filtering them in
+    the browser, which assumes the search matches case-insensitive substrings.
+    """
+
+    # Fired when a suggestion is selected, with its value.
+    on_select: EventHandler[passthrough_event_spec(str)]
+
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        search: SelectOptionsSource,
+        limit: int = 20,
+        default_value: str = "",
+        placeholder: Var | str | None = None,
+        name: Var | str | None = None,
+        is_disabled: Var | bool | None = None,
+        is_invalid: Var | bool | None = None,
+        variant: Var[LiteralInputVariant] | LiteralInputVariant | None = None,
+        size: Var[LiteralButtonSize] | LiteralButtonSize | None = None,
+        min_chars: int = 1,
+        debounce_ms: int = 250,
+        cache_size: int = 100,
+        loading_text: Var | str = "Searching...",
+        no_results_text: Var | str = "No results",
+        error_text: Var | str = "Search failed",
+        **props,
+    ) -> Component:
+        """Create an autocomplete component.
+
+        Suggestions are strings, or dicts with a value and a label.
+
+        Args:
+            search: A function called with a query, an offset and a limit that returns the matching suggestions in that range.
+            limit: The maximum number of suggestions shown.
+            default_value: The text initially in the input.
+            placeholder: The placeholder text.
+            name: The name of the form field holding the text of the input.
+            is_disabled: If true, the input will be disabled.
+            is_invalid: If true, the input will be invalid.
+            variant: "outline" | "filled" | "flushed" | "unstyled"
+            size: The size of the input.
+            min_chars: The number of characters to type before suggestions are searched.
+            debounce_ms: The milliseconds to wait after the last keystroke before sending the query.
+            cache_size: The number of queries whose suggestions are kept in the browser.
+            loading_text: The text shown while the first suggestions of a query are searched.
+            no_results_text: The text shown when no suggestion matches the query.
+            error_text: The text shown when the search of the query failed.
+            **props: The properties of the component.
+
+        Returns:
+            The autocomplete component.
+        """
+        return AutocompleteSearch.create(
+            search=search,
+            limit=limit,
+            create_autocomplete=functools.partial(
+                cls._create_autocomplete,
+                default_value=default_value,
+                placeholder=placeholder,
+                name=name,
+                is_disabled=is_disabled,
+                is_invalid=is_invalid,
+                variant=variant,
+                size=size,
+                min_chars=min_chars,
+                debounce_ms=debounce_ms,
+                cache_size=cache_size,
+                loading_text=loading_text,
+                no_results_text=no_results_text,
+                error_text=error_text,
+            ),
+            **props,
+        )
+
+    @classmethod
+    def _create_autocomplete(
+        cls,
+        *,
+        search_state: type[AutocompleteSearch],
+        default_value: str,
+        placeholder: Var | str | None,
+        name: Var | str | None,
+        is_disabled: Var | bool | None,
+        is_invalid: Var | bool | None,
+        variant: Var[LiteralInputVariant] | LiteralInputVariant | None,
+        size: Var[LiteralButtonSize] | LiteralButtonSize | None,
+        min_chars: int,
+        debounce_ms: int,
+        cache_size: int,
+        loading_text: Var | str,
+        no_results_text: Var | str,
+        error_text: Var | str,
+        **props,
+    ) -> Component:
+        """Create an autocomplete component with the state searching its suggestions.
+
+        Args:
+            search_state: The state searching the suggestions.
+            default_value: The text initially in the input.
+            placeholder: The placeholder text.
+            name: The name of the form field.
+            is_disabled: Whether the input is disabled.
+            is_invalid: Whether the input is invalid.
+            variant: The variant of the input.
+            size: The size of the input.
+            min_chars: The number of characters to type before suggestions are searched.
+            debounce_ms: The milliseconds to wait before sending the query.
+            cache_size: The number of queries kept in the cache.
+            loading_text: The text shown while searching.
+            no_results_text: The text shown when nothing matches.
+            error_text: The text shown when the search failed.
+            **props: The properties of the component.
+
+        Returns:
+            The autocomplete component.
+        """
+        component = super().create(**props)
+        on_select = component.event_triggers.pop("on_select", None)
+        send = (
+            f"({LiteralVar.create(on_select)!s})(option.value);"
+            if on_select is not None
+            else ""
+        )
+
+        (
+            query,
+            key,
+            is_open,
+            highlighted,
+            shown,
+            cache,
+            remember,
+            lookup,
+            request,
+            pending,
+            skip,
+            choose,
+        ) = unique_names(
+            "autocomplete",
+            "query",
+            "key",
+            "open",
+            "highlighted",
+            "shown",
+            "cache",
+            "remember",
+            "lookup",
+            "request",
+            "pending",
+            "skip",
+            "choose",
+        )
+        search = str(
+            Var.create(
+                EventChain.create(
+                    search_state.search,  # pyright: ignore[reportArgumentType]
+                    args_spec=lambda request, query: [request, query],
+                )
+            )
+        )
+        (
+            loaded_request,
+            loaded_query,
+            loaded_options,
+            loaded_complete,
+            loaded_error,
+        ) = (
+            str(search_state.loaded_request),
+            str(search_state.loaded_query),
+            str(search_state.loaded_options),
+            str(search_state.loaded_complete),
+            str(search_state.loaded_error),
+        )
+        hooks = [
+            f"const [{query}, set_{query}] = useState({LiteralVar.create(default_value)!s});",
+            f"const {key} = {query}.trim().toLowerCase();",
+            f"const [{is_open}, set_{is_open}] = useState(false);",
+            f"const [{highlighted}, set_{highlighted}] = useState(-1);",
+            f"const [{shown}, set_{shown}] = useState({{ key: null, options: [], loading: false, failed: false }});",
+            f"const {cache} = useRef(new Map());",
+            f"const {request} = useRef(0);",
+            f"const {pending} = useRef(null);",
+            f"const {skip} = useRef(false);",
+            f"""const {remember} = (key, entry) => {{
+    const cache = {cache}.current;
+    cache.delete(key);
+    cache.set(key, entry);
+    while (cache.size > {cache_size}) cache.delete(cache.keys().next().value);
+}};""",
+            f"""const {lookup} = (key) => {{
+    const entry = {cache}.current.get(key);
+    if (entry !== undefined) {{
+        {remember}(key, entry);
+        return entry;
+    }}
+    // the complete suggestions of a prefix hold every suggestion of the query.
+    for (let end = key.length - 1; end >= Math.max(1, {min_chars}); end--) {{
+        const prefix = {cache}.current.get(key.slice(0, end));
+        if (prefix?.complete) {{
+            const filtered = {{ options: prefix.options.filter((option) => option.label.toLowerCase().includes(key)), complete: true }};
+            {remember}(key, filtered);
+            return filtered;
+        }}
+    }}
+    return null;
+}};""",
+            f"""useEffect(() => {{
+    const key = {key};
+    if ({skip}.current) {{
+        {skip}.current = false;
+        return;
+    }}
+    if (key.length < {min_chars}) {{
+        set_{shown}({{ key, options: [], loading: false, failed: false }});
+        return;
+    }}
+    const cached = {lookup}(key);
+    if (cached !== null) {{
+        set_{shown}({{ key, options: cached.options, loading: false, failed: false }});
+        return;
+    }}
+    // keep the previous suggestions while the query is searched.
+    set_{shown}((shown) => ({{ ...shown, key, loading: true, failed: false }}));
+    const timer = setTimeout(() => {{
+        if ({pending}.current?.key === key) return;
+        {next_request(request)}
+        {pending}.current = {{ request: {request}.current, key }};
+        {search}({request}.current, {query}.trim());
+    }}, {debounce_ms});
+    return () => clearTimeout(timer);
+}}, [{key}]);""",
+            f"""useEffect(() => {{
+    if ({loaded_request} < 0) return;
+    const key = {loaded_query}.toLowerCase();
+    if ({pending}.current?.request === {loaded_request}) {pending}.current = null;
+    if ({loaded_error}) {{
+        // the query is not cached, so it is searched again when it is typed again.
+        set_{shown}((shown) => (shown.key === key ? {{ key, options: [], loading: false, failed: true }} : shown));
+        return;
+    }}
+    const options = {loaded_options}.map((option) => option !== null && typeof option === "object"
+        ? {{ value: String(option.value), label: String(option.label ?? option.value) }}
+        : {{ value: String(option), label: String(option) }});
+    {remember}(key, {{ options, complete: {loaded_complete} }});
+    set_{shown}((shown) => (shown.key === key ? {{ key, options, loading: false, failed: false }} : shown));
+}}, [{loaded_request}]);""",
+            f"useEffect(() => set_{highlighted}(-1), [{shown}]);",
+            f"""const {choose} = (option) => {{
+    // the label of a selected suggestion is not searched.
+    {skip}.current = option.label.trim().toLowerCase() !== {key};
+    set_{query}(option.label);
+    set_{is_open}(false);
+    {send}
+}};""",
+        ]
+        var_data = VarData.merge(
+            search_state.loaded_request._get_all_var_data(),
+            VarData(imports=Imports.EVENTS, hooks={Hooks.EVENTS: None}),
+            LiteralVar.create(on_select)._get_all_var_data()
+            if on_select is not None
+            else None,
+            VarData(
+                imports={"react": ["useEffect", "useRef", "useState"]},
+                hooks=dict.fromkeys(hooks),
+            ),
+        )
+
+        options = hook_var(var_data, f"{shown}.options", list[dict[str, str]])
+
+        def create_option(option: Var, position: Var) -> Component:
+            return Box.create(
+                option.to(dict)["label"],
+                padding_x="3",
+                padding_y="1.5",
+                cursor="pointer",
+                bg=cond(
+                    position == hook_var(var_data, highlighted, int), "gray.100", ""
+                ),
+                custom_attrs={
+                    "role": "option",
+                    "aria-selected": position == hook_var(var_data, highlighted, int),
+                    # keep the focus in the input, so selecting does not close the popover first.
+                    "onMouseDown": hook_var(
+                        var_data,
+                        f"((event) => {{ event.preventDefault(); {choose}({option!s}); }})",
+                    ),
+                    "onMouseEnter": hook_var(
+                        var_data, f"(() => set_{highlighted}({position!s}))"
+                    ),
+                },
+            )
+
+        on_key_down = hook_var(
+            var_data,
+            f"""((event) => {{
+    const options = {shown}.options;
+    if (event.key === "ArrowDown" || event.key === "ArrowUp") {{
+        event.preventDefault();
+        set_{is_open}(true);
+        set_{highlighted}((highlighted) => Math.min(options.length - 1, Math.max(0, highlighted + (event.key === "ArrowDown" ? 1 : -1))));
+    }} else if (event.key === "Enter" && {is_open} && options[{highlighted}] !== undefined) {{
+        event.preventDefault();
+        {choose}(options[{highlighted}]);
+    }} else if (event.key === "Escape") {{
+        set_{is_open}(false);
+    }}
+}})""",
+        )
+        field = Input.create(
+            placeholder=placeholder,
+            name=name,
+            is_disabled=is_disabled,
+            is_invalid=is_invalid,
+            variant=variant,
+            size=size,
+            custom_attrs={
+                "autoComplete": "off",
+                "role": "combobox",
+                "aria-expanded": hook_var(var_data, is_open, bool),
+                "value": hook_var(var_data, query, str),
+                "onChange": hook_var(
+                    var_data,
+                    f"((event) => {{ set_{query}(event.target.value); set_{is_open}(true); }})",
+                ),
+                "onFocus": hook_var(var_data, f"(() => set_{is_open}(true))"),
+                "onBlur": hook_var(var_data, f"(() => set_{is_open}(false))"),
+                "onKeyDown": on_key_down,
+            },
+        )
+        empty = hook_var(var_data, f"{shown}.options.length === 0", bool)
+        popover = Popover.create(
+            PopoverAnchor.create(field),
+            PopoverContent.create(
+                Foreach.create(options, create_option),
+                cond(
+                    empty,
+                    Box.create(
+                        cond(
+                            hook_var(var_data, f"{shown}.loading", bool),
+                            loading_text,
+                            cond(
+                                hook_var(var_data, f"{shown}.failed", bool),
+                                error_text,
+                                no_results_text,
+                            ),
+                        ),
+                        padding_x="3",
+                        padding_y="1.5",
+                        color="gray.500",
+                    ),
+                ),
+                width="100%",
+                padding_y="1",
+                custom_attrs={"role": "listbox"},
+            ),
+            is_open=hook_var(
+                var_data, f"({is_open} && {key}.length >= {min_chars})", bool
+            ),
+            auto_focus=False,
+            close_on_blur=False,
+            return_focus_on_close=False,
+            match_width=True,
+            placement="bottom-start",
+            custom_attrs={
+                "onClose": hook_var(var_data, f"(() => set_{is_open}(false))")
+            },
+        )
+        component.children = [popover]
+        return component
+
+
+autocomplete = Autocomplete.create
@@ -0,0 +1,118 @@
+"""Stub file for reflex_chakra/components/forms/autocomplete.py"""
+
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+from collections.abc import Mapping, Sequence
+from typing import (
+    Any,
+    Literal,
+)
+
+from reflex.components.core.breakpoints import Breakpoints
+from reflex.event import (
+    EventType,
+    PointerEventInfo,
+)
+from reflex.vars.base import Var
+
+from reflex_chakra.components.forms.autocomplete_search import (
+    SelectOptionsSource,
+)
+from reflex_chakra.components.layout.box import Box
+
+class Autocomplete(Box):
+    @classmethod
+    def create(
+        cls,
+        *children,
+        search: SelectOptionsSource | None,
+        limit: int | None = 20,
+        default_value: str | None = "",
+        placeholder: Var | str | None = None,
+        name: Var | str | None = None,
+        is_disabled: Var | bool | None = None,
+        is_invalid: Var | bool | None = None,
+        variant: Literal["filled", "flushed", "outline", "unstyled"]
+        | Var[Literal["filled", "flushed", "outline", "unstyled"]]
+        | None = None,
+        size: Literal["lg", "md", "sm", "xs"]
+        | Var[Literal["lg", "md", "sm", "xs"]]
+        | None = None,
+        min_chars: int | None = 1,
+        debounce_ms: int | None = 250,
+        cache_size: int | None = 100,
+        loading_text: Var | str = "Searching...",
+        no_results_text: Var | str = "No results",
+        error_text: Var | str = "Search failed",
+        element: Var[str] | str | None = None,
+        src: Var[str] | str | None = None,
+        alt: Var[str] | str | None = None,
+        style: Sequence[Mapping[str, Any]]
+        | Mapping[str, Any]
+        | Var[Mapping[str, Any]]
+        | Breakpoints
+        | None = None,
+        key: Any | None = None,
+        id: Any | None = None,
+        ref: Var | None = None,
+        class_name: Any | None = None,
+        autofocus: bool | None = None,
+        custom_attrs: dict[str, Var | Any] | None = None,
+        on_blur: EventType[()] | None = None,
+        on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_focus: EventType[()] | None = None,
+        on_mount: EventType[()] | None = None,
+        on_mouse_down: EventType[()] | None = None,
+        on_mouse_enter: EventType[()] | None = None,
+        on_mouse_leave: EventType[()] | None = None,
+        on_mouse_move: EventType[()] | None = None,
+        on_mouse_out: EventType[()] | None = None,
+        on_mouse_over: EventType[()] | None = None,
+        on_mouse_up: EventType[()] | None = None,
+        on_scroll: EventType[()] | None = None,
+        on_scroll_end: EventType[()] | None = None,
+        on_select: EventType[()] | EventType[str] | None = None,
+        on_unmount: EventType[()] | None = None,
+        **props,
+    ) -> Autocomplete:
+        """Create an autocomplete component.
+
+        Suggestions are strings, or dicts with a value and a label.
+
+        Args:
+            search: A function called with a query, an offset and a limit that returns the matching suggestions in that range.
+            limit: The maximum number of suggestions shown.
+            default_value: The text initially in the input.
+            placeholder: The placeholder text.
+            name: The name of the form field holding the text of the input.
+            is_disabled: If true, the input will be disabled.
+            is_invalid: If true, the input will be invalid.
+            variant: "outline" | "filled" | "flushed" | "unstyled"
+            size: The size of the input.
+            min_chars: The number of characters to type before suggestions are searched.
+            debounce_ms: The milliseconds to wait after the last keystroke before sending the query.
+            cache_size: The number of queries whose suggestions are kept in the browser.
+            loading_text: The text shown while the first suggestions of a query are searched.
+            no_results_text: The text shown when no suggestion matches the query.
+            error_text: The text shown when the search of the query failed.
+            on_select: Fired when a suggestion is selected, with its value.
+            element: The type element to render. You can specify an image, video, or any other HTML element such as iframe.
+            src: The source of the content.
+            alt: The alt text of the content.
+            style: The style of the component.
+            key: A unique key for the component.
+            id: The id for the component.
+            ref: The Var to pass as the ref to the component.
+            class_name: The class name for the component.
+            autofocus: Whether the component should take the focus once the page is loaded
+            custom_attrs: custom attribute
+            **props: The properties of the component.
+
+        Returns:
+            The autocomplete component.
+        """
+
+autocomplete = Autocomplete.create
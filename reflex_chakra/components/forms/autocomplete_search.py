@@ -0,0 +1,112 @@
+"""The backend search of an autocomplete."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from reflex.event import event
+from reflex.state import ComponentState
+from reflex.vars.base import Field, field
+
+# the state annotations are evaluated at runtime.
+from reflex_chakra.components.forms.virtual_select_options import (
+    SelectOptionsSource,  # noqa: TC001
+)
+from reflex_chakra.components.sources import fetch_items
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from reflex.components.component import Component
+
+
+class AutocompleteSearch(ComponentState):
+    """The suggestions of an autocomplete, searched by a backend function.
+
+    Each query sent by the browser carries a request id, which only grows. A query
+    superseded by a newer one is cancelled: it is skipped if it has not started yet,
+    and its suggestions are dropped instead of being sent if they arrive too late.
+    """
+
+    # The id of the request the loaded suggestions answer.
+    loaded_request: Field[int] = field(-1)
+
+    # The query the loaded suggestions answer.
+    loaded_query: Field[str] = field("")
+
+    # The loaded suggestions.
+    loaded_options: Field[list] = field(default_factory=list)
+
+    # Whether the loaded suggestions are every match of the query, not only the first ones.
+    loaded_complete: Field[bool] = field(False)
+
+    # Whether the search raised for the loaded query.
+    loaded_error: Field[bool] = field(False)
+
+    # The id of the latest request received.
+    _latest_request: int = 0
+
+    # The search function and suggestion limit of this instance, set by get_component.
+    _search: ClassVar[SelectOptionsSource]
+    _limit: ClassVar[int]
+
+    @event(background=True)
+    async def search(self, request: int, query: str):
+        """Search the suggestions matching a query.
+
+        Args:
+            request: The id of the request.
+            query: The text typed in the input.
+        """
+        cls = type(self)
+        async with self:
+            if request < self._latest_request:
+                return
+            self._latest_request = request
+        try:
+            options, complete = await fetch_items(
+                cls._search, query, 0, limit=cls._limit
+            )
+        except Exception:
+            # answer the request, so the browser stops waiting for it.
+            async with self:
+                if request >= self._latest_request:
+                    self.loaded_options = []
+                    self.loaded_complete = False
+                    self.loaded_error = True
+                    self.loaded_query = query
+                    self.loaded_request = request
+            raise
+        async with self:
+            if request < self._latest_request:
+                return
+            self.loaded_options = options
+            self.loaded_complete = complete
+            self.loaded_error = False
+            self.loaded_query = query
+            self.loaded_request = request
+
+    @classmethod
+    def get_component(
+        cls,
+        *children,  # noqa: ARG003
+        search: SelectOptionsSource,
+        limit: int = 20,
+        create_autocomplete: Callable[..., Component],
+        **props,
+    ) -> Component:
+        """Create an autocomplete searching its suggestions with a function.
+
+        Args:
+            *children: Unused, the suggestions come from the search function.
+            search: A function called with a query, an offset and a limit that returns the matching suggestions in that range.
+            limit: The maximum number of suggestions shown.
+            create_autocomplete: The function creating the autocomplete from this state.
+            **props: The properties of the autocomplete, as in Autocomplete.create.
+
+        Returns:
+            The autocomplete component.
+        """
+        cls._search = staticmethod(search)
+        cls._limit = limit
+        return create_autocomplete(search_state=cls, **props)
@@ -82,3 +82,7 @@ class ButtonGroup(ChakraComponent):
 
     # "ghost" | "outline" | "solid" | "link" | "unstyled"
     variant: Var[LiteralButtonVariant]
+
+
+button = Button.create
+button_group = ButtonGroup.create
@@ -209,3 +209,6 @@ class ButtonGroup(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+button = Button.create
+button_group = ButtonGroup.create
@@ -76,3 +76,7 @@ class CheckboxGroup(ChakraComponent):
 
     # If true, input elements will receive checked attribute instead of isChecked. This assumes, you're using native radio inputs
     is_native: Var[bool]
+
+
+checkbox = Checkbox.create
+checkbox_group = CheckboxGroup.create
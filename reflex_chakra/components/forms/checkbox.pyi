@@ -197,3 +197,6 @@ class CheckboxGroup(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+checkbox = Checkbox.create
+checkbox_group = CheckboxGroup.create
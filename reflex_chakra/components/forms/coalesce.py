@@ -0,0 +1,132 @@
+"""Client-side coalescing of the on_change events of form controls."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+from reflex.utils import format
+from reflex.vars.base import LiteralVar, Var, VarData, get_unique_variable_name
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from reflex.components.component import Component
+
+# When on_change is sent while the value changes: on every change ("live", at most
+# once per throttle_ms if set), once per animation frame ("raf"), or only when the
+# change ends ("end").
+LiteralEmit = Literal["live", "raf", "end"]
+
+
+def coalesce_on_change(
+    component: Component,
+    value: Var | None = None,
+    *,
+    debounce_ms: int | Var[int] | None = None,
+    throttle_ms: int | Var[int] | None = None,
+    emit: LiteralEmit = "live",
+    flush_on: Sequence[str] = (),
+):
+    """Send the on_change events of a component less often, from the browser.
+
+    Changes are applied to a copy of the value kept in the browser, so the control
+    stays responsive, and only the latest change is sent when the debounce timeout
+    or the throttle interval elapses, on the next animation frame, or when one of the
+    flush_on triggers fires (for example when a drag ends or the control loses focus).
+    The pending change is also sent when the component unmounts. The handlers of the
+    flush_on triggers run after the pending change is sent, so they see the final value.
+
+    Args:
+        component: The component, created with an on_change handler.
+        value: The value of the component, kept in the browser while changes are pending.
+        debounce_ms: Send a change once no other change happened for this many milliseconds.
+        throttle_ms: Send at most one change per this many milliseconds, with emit="live".
+        emit: When changes are sent, if debounce_ms is not set.
+        flush_on: The event triggers sending the pending change.
+    """
+    name = f"coalesce_{get_unique_variable_name()}"
+    on_change = LiteralVar.create(component.event_triggers.pop("on_change"))
+    value_name, pending, cancel, last, send, flush = (
+        f"{name}_value",
+        f"{name}_pending",
+        f"{name}_cancel",
+        f"{name}_last",
+        f"{name}_send",
+        f"{name}_flush",
+    )
+    if debounce_ms is not None:
+        schedule = f"""{cancel}.current?.();
+    const timer = setTimeout({flush}, {Var.create(debounce_ms)!s});
+    {cancel}.current = () => clearTimeout(timer);"""
+    elif emit == "raf":
+        schedule = f"""if ({cancel}.current === null) {{
+        const frame = requestAnimationFrame({flush});
+        {cancel}.current = () => cancelAnimationFrame(frame);
+    }}"""
+    elif emit == "end":
+        schedule = ""
+    elif throttle_ms is not None:
+        schedule = f"""if ({cancel}.current === null) {{
+        const timer = setTimeout({flush}, Math.max(0, {last}.current + {Var.create(throttle_ms)!s} - Date.now()));
+        {cancel}.current = () => clearTimeout(timer);
+    }}"""
+    else:
+        schedule = f"{flush}();"
+
+    hooks = [
+        f"const {pending} = useRef(null);",
+        f"const {cancel} = useRef(null);",
+        f"const {last} = useRef(0);",
+        f"const {send} = useRef(null);",
+        f"{send}.current = {on_change!s};",
+        f"""const {flush} = () => {{
+    {cancel}.current?.();
+    {cancel}.current = null;
+    const args = {pending}.current;
+    if (args === null) return;
+    {pending}.current = null;
+    {last}.current = Date.now();
+    {send}.current(...args);
+}};""",
+        f"useEffect(() => () => {flush}(), []);",
+    ]
+    if value is not None:
+        hooks[:0] = [f"const [{value_name}, set_{value_name}] = useState({value!s});"]
+        # follow the value from the backend, unless a newer value is still pending.
+        hooks.append(
+            f"""useEffect(() => {{
+    if ({pending}.current === null) set_{value_name}({value!s});
+}}, [{value!s}]);"""
+        )
+    var_data = VarData.merge(
+        value._get_all_var_data() if value is not None else None,
+        on_change._get_all_var_data(),
+        VarData(
+            imports={"react": ["useEffect", "useRef", "useState"]},
+            hooks=dict.fromkeys(hooks),
+        ),
+    )
+    if value is not None:
+        component.custom_attrs["value"] = Var(
+            _js_expr=value_name, _var_type=value._var_type, _var_data=var_data
+        )
+        component.value = None  # pyright: ignore[reportAttributeAccessIssue]
+    component.custom_attrs["onChange"] = Var(
+        _js_expr=f"""((...args) => {{
+    {"" if value is None else f"set_{value_name}(args[0]);"}
+    {pending}.current = args;
+    {schedule}
+}})""",
+        _var_type=object,
+        _var_data=var_data,
+    )
+    for trigger in flush_on:
+        chain = component.event_triggers.pop(trigger, None)
+        handler = LiteralVar.create(chain) if chain is not None else None
+        component.custom_attrs[format.to_camel_case(trigger)] = Var(
+            _js_expr=f"((...args) => {{ {flush}(); {'' if handler is None else f'({handler!s})(...args);'} }})",
+            _var_type=object,
+            _var_data=VarData.merge(
+                var_data, handler._get_all_var_data() if handler is not None else None
+            ),
+        )
@@ -17,6 +17,8 @@ rx.text(
 
 from __future__ import annotations
 
+from functools import cache
+
 from reflex.components.component import BaseComponent
 from reflex.components.core.cond import color_mode_cond
 from reflex.style import LIGHT_COLOR_MODE, color_mode, toggle_color_mode
@@ -27,8 +29,22 @@ from reflex_chakra.components.media.icon import Icon
 from .button import Button
 from .switch import Switch
 
-DEFAULT_LIGHT_ICON: Icon = Icon.create(tag="sun")
-DEFAULT_DARK_ICON: Icon = Icon.create(tag="moon")
+# created on first access by __getattr__, so importing this module creates no components.
+DEFAULT_LIGHT_ICON: Icon
+DEFAULT_DARK_ICON: Icon
+
+
+@cache
+def _get_default_icon(tag: str) -> Icon:
+    """Get a default color mode icon, created on first use.
+
+    Args:
+        tag: The icon tag, "sun" or "moon".
+
+    Returns:
+        The icon component.
+    """
+    return Icon.create(tag=tag)
 
 
 def color_mode_icon(
@@ -45,8 +61,8 @@ def color_mode_icon(
         The conditionally rendered component
     """
     return color_mode_cond(
-        light=light_component or DEFAULT_LIGHT_ICON,
-        dark=dark_component or DEFAULT_DARK_ICON,
+        light=light_component or _get_default_icon("sun"),
+        dark=dark_component or _get_default_icon("moon"),
     )
 
 
@@ -98,3 +114,16 @@ class ColorModeScript(ChakraComponent):
 
     tag = "ColorModeScript"
     initialColorMode = LIGHT_COLOR_MODE  # noqa: N815
+
+
+color_mode_button = ColorModeButton.create
+color_mode_switch = ColorModeSwitch.create
+
+
+def __getattr__(name: str):
+    if name == "DEFAULT_LIGHT_ICON":
+        return _get_default_icon("sun")
+    if name == "DEFAULT_DARK_ICON":
+        return _get_default_icon("moon")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -325,3 +325,6 @@ class ColorModeScript(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+color_mode_button = ColorModeButton.create
+color_mode_switch = ColorModeSwitch.create
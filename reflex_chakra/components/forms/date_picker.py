@@ -10,3 +10,6 @@ class DatePicker(Input):
 
     # The type of input.
     type_: Var[str] = Var.create("date")
+
+
+date_picker = DatePicker.create
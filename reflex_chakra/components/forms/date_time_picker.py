@@ -10,3 +10,6 @@ class DateTimePicker(Input):
 
     # The type of input.
     type_: Var[str] = Var.create("datetime-local")
+
+
+date_time_picker = DateTimePicker.create
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from reflex.components.component import Component
+from reflex.components.core.debounce import DEFAULT_DEBOUNCE_TIMEOUT
 from reflex.event import EventHandler
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.forms.coalesce import coalesce_on_change
 
 
 class Editable(ChakraComponent):
@@ -49,6 +52,35 @@ class Editable(ChakraComponent):
     # Fired when the Editable is canceled.
     on_cancel: EventHandler[lambda e0: [e0]]
 
+    @classmethod
+    def create(
+        cls, *children, debounce_timeout: int | Var[int] | None = None, **props
+    ) -> Component:
+        """Create an Editable component.
+
+        Args:
+            *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
+            **props: The properties of the component.
+
+        Returns:
+            The component.
+        """
+        component = super().create(*children, **props)
+        if props.get("value") is not None and props.get("on_change") is not None:
+            # debounce the value like a controlled Input or TextArea to avoid typing jank.
+            # the pending value is sent right away when the editable is submitted or
+            # canceled, which includes losing focus with submit_on_blur.
+            coalesce_on_change(
+                component,
+                Var.create(props["value"]),
+                debounce_ms=debounce_timeout
+                if debounce_timeout is not None
+                else DEFAULT_DEBOUNCE_TIMEOUT,
+                flush_on=("on_submit", "on_cancel"),
+            )
+        return component
+
 
 class EditableInput(ChakraComponent):
     """The edit view of the component. It shows when you click or focus on the text."""
@@ -66,3 +98,9 @@ class EditablePreview(ChakraComponent):
     """The read-only view of the component."""
 
     tag = "EditablePreview"
+
+
+editable = Editable.create
+editable_input = EditableInput.create
+editable_preview = EditablePreview.create
+editable_textarea = EditableTextarea.create
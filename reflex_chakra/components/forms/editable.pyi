@@ -22,6 +22,7 @@ class Editable(ChakraComponent):
     def create(
         cls,
         *children,
+        debounce_timeout: Var[int] | int | None = None,
         is_disabled: Var[bool] | bool | None = None,
         is_preview_focusable: Var[bool] | bool | None = None,
         placeholder: Var[str] | str | None = None,
@@ -63,10 +64,11 @@ class Editable(ChakraComponent):
         on_unmount: EventType[()] | None = None,
         **props,
     ) -> Editable:
-        """Create a new Chakra component.
+        """Create an Editable component.
 
         Args:
             *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
             is_disabled: If true, the Editable will be disabled.
             is_preview_focusable: If true, the read only view, has a tabIndex set to 0 so it can receive focus via the keyboard or click.
             placeholder: The placeholder text when the value is empty.
@@ -89,7 +91,7 @@ class Editable(ChakraComponent):
             **props: The properties of the component.
 
         Returns:
-            A new Chakra component.
+            The component.
         """
 
 class EditableInput(ChakraComponent):
@@ -244,3 +246,8 @@ class EditablePreview(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+editable = Editable.create
+editable_input = EditableInput.create
+editable_preview = EditablePreview.create
+editable_textarea = EditableTextarea.create
@@ -10,3 +10,6 @@ class Email(Input):
 
     # The type of input.
     type_: Var[str] = Var.create("email")
+
+
+email = Email.create
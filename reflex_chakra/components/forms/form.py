@@ -2,11 +2,63 @@
 
 from __future__ import annotations
 
-from reflex.components.component import Component
+import json
+
+from reflex.components.component import Component, field
+from reflex.components.core.cond import cond
+from reflex.components.el.elements.forms import FORM_DATA
 from reflex.components.el.elements.forms import Form as HTMLForm
-from reflex.vars.base import Var
+from reflex.components.tags.tag import Tag
+from reflex.constants import EventTriggers, MemoizationMode
+from reflex.event import EventChain
+from reflex.utils import console
+from reflex.vars.base import LiteralVar, Var
+from reflex.vars.sequence import LiteralStringVar
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.forms.numberinput import NumberInput
+from reflex_chakra.components.forms.pininput import PinInput
+from reflex_chakra.components.forms.rangeslider import RangeSlider
+from reflex_chakra.components.forms.slider import Slider
+from reflex_chakra.components.forms.validation import FieldValidation, ValidationRule
+
+# the submit handler of a client_only form, collecting every field in one payload.
+HANDLE_CLIENT_ONLY_SUBMIT_JS = """
+    const handleSubmit_{handle_submit_unique_name} = useCallback((ev) => {{
+        const $form = ev.target
+        ev.preventDefault()
+        const {form_data} = {{}};
+        for (const [key, value] of new FormData($form).entries()) {{
+            {form_data}[key] = key in {form_data} ? [].concat({form_data}[key], value) : value;
+        }}
+        // checkboxes and switches with the default value are sent as booleans, even when unchecked.
+        for (const element of $form.elements) {{
+            if (element.type === "checkbox" && element.name && ["true", "on"].includes(element.value) && !Array.isArray({form_data}[element.name])) {{
+                {form_data}[element.name] = element.checked;
+            }}
+        }}
+        // the fields of pin inputs and range sliders are named `${{name}}-${{index}}`.
+        for (const name of {indexed_fields}) {{
+            const values = [];
+            for (let index = 0; `${{name}}-${{index}}` in {form_data}; index++) {{
+                values.push({form_data}[`${{name}}-${{index}}`]);
+                delete {form_data}[`${{name}}-${{index}}`];
+            }}
+            if (values.length > 0) {form_data}[name] = values;
+        }}
+        const toNumber = (value) => (value === "" ? null : Number(value));
+        for (const name of {numeric_fields}) {{
+            if (name in {form_data}) {form_data}[name] = Array.isArray({form_data}[name]) ? {form_data}[name].map(toNumber) : toNumber({form_data}[name]);
+        }}
+        Object.assign({form_data}, {field_ref_mapping});
+
+        ({on_submit_event_chain}(ev));
+
+        if ({reset_on_submit}) {{
+            $form.reset()
+        }}
+    }})
+    """
 
 
 class Form(ChakraComponent, HTMLForm):
@@ -17,6 +69,116 @@ class Form(ChakraComponent, HTMLForm):
     # What the form renders to.
     as_: Var[str] = Var.create("form")
 
+    # The names of the indexed and numeric fields of a client_only form.
+    _client_only_fields: dict[str, list[str]] | None = field(
+        default=None, is_javascript_property=False
+    )
+
+    # The on_submit handler of a client_only form, called by its own submit handler.
+    _client_only_on_submit: EventChain | None = field(
+        default=None, is_javascript_property=False
+    )
+
+    @classmethod
+    def create(cls, *children, client_only: bool = False, **props) -> Component:
+        """Create a form component.
+
+        Args:
+            *children: The children of the form.
+            client_only: If true, the fields keep their values in the browser until the form is submitted, and on_submit receives every field in one dict: checkboxes and switches as booleans, repeated names, pin inputs and range sliders as lists, and sliders and number inputs as numbers.
+            **props: The properties of the form.
+
+        Returns:
+            The form component.
+        """
+        form = super().create(*children, **props)
+        if client_only:
+            form._client_only_fields = cls._get_client_only_fields(form)  # pyright: ignore[reportAttributeAccessIssue]
+            # replace the submit handler of the HTML form.
+            form._client_only_on_submit = form.event_triggers.pop(  # pyright: ignore[reportAttributeAccessIssue]
+                EventTriggers.ON_SUBMIT
+            )
+        return form
+
+    @staticmethod
+    def _get_client_only_fields(form: Component) -> dict[str, list[str]]:
+        """Find the fields of a client_only form whose submitted values are converted.
+
+        Fields sending on_change are reported, as they send an event per change.
+
+        Args:
+            form: The form.
+
+        Returns:
+            The names of the indexed fields and of the numeric fields.
+        """
+        fields = {"indexed": [], "numeric": []}
+        controlled = set()
+        stack = list(form.children)
+        while stack:
+            component = stack.pop()
+            if not isinstance(component, Component):
+                continue
+            stack.extend(component.children)
+            if EventTriggers.ON_CHANGE in component.event_triggers:
+                controlled.add(type(component).__name__)
+            name = getattr(component, "name", None)
+            if not isinstance(name, LiteralStringVar):
+                continue
+            name = name._var_value
+            if isinstance(component, (PinInput, RangeSlider)):
+                fields["indexed"].append(name)
+            if isinstance(component, (NumberInput, RangeSlider, Slider)):
+                fields["numeric"].append(name)
+        if controlled:
+            console.warn(
+                "fields with on_change in a client_only form send an event on every "
+                f"change ({', '.join(sorted(controlled))}). Use default_value and name "
+                "to only send the form on submit."
+            )
+        return fields
+
+    def add_hooks(self) -> list[str | Var]:
+        """Add the submit handler of a client_only form.
+
+        Returns:
+            The hooks for the form.
+        """
+        if self._client_only_fields is None or self._client_only_on_submit is None:
+            return []
+        on_submit = LiteralVar.create(self._client_only_on_submit)
+        return [
+            Var(
+                _js_expr=HANDLE_CLIENT_ONLY_SUBMIT_JS.format(
+                    handle_submit_unique_name=self.handle_submit_unique_name,  # pyright: ignore[reportAttributeAccessIssue]
+                    form_data=str(FORM_DATA),
+                    indexed_fields=json.dumps(
+                        sorted(self._client_only_fields["indexed"])
+                    ),
+                    numeric_fields=json.dumps(
+                        sorted(self._client_only_fields["numeric"])
+                    ),
+                    field_ref_mapping=str(LiteralVar.create(self._get_form_refs())),  # pyright: ignore[reportAttributeAccessIssue]
+                    on_submit_event_chain=str(on_submit),
+                    reset_on_submit=self.reset_on_submit,  # pyright: ignore[reportAttributeAccessIssue]
+                ),
+                _var_data=on_submit._get_all_var_data(),
+            )
+        ]
+
+    def _render(self) -> Tag:
+        render_tag = super()._render()
+        if self._client_only_on_submit is not None:
+            render_tag.add_props(
+                **{
+                    EventTriggers.ON_SUBMIT: Var(
+                        _js_expr=f"handleSubmit_{self.handle_submit_unique_name}",  # pyright: ignore[reportAttributeAccessIssue]
+                        _var_type=EventChain,
+                    )
+                }
+            )
+        return render_tag
+
 
 class FormControl(ChakraComponent):
     """Provide context to form components."""
@@ -46,6 +208,7 @@ class FormControl(ChakraComponent):
         input=None,
         help_text=None,
         error_message=None,
+        rules: list[ValidationRule] | None = None,
         **props,
     ) -> Component:
         """Create a form control component.
@@ -56,6 +219,7 @@ class FormControl(ChakraComponent):
             input: The input of the form control.
             help_text: The help text of the form control.
             error_message: The error message of the form control.
+            rules: The validation rules of the input, checked in the browser. The form control is marked invalid with the error of the first failing rule, and its form cannot be submitted until every rule passes.
             **props: The properties of the form control.
 
         Raises:
@@ -64,6 +228,7 @@ class FormControl(ChakraComponent):
         Returns:
             The form control component.
         """
+        validation = FieldValidation(rules) if rules else None
         if len(children) == 0:
             children = []
 
@@ -78,10 +243,29 @@ class FormControl(ChakraComponent):
             if help_text:
                 children.append(FormHelperText.create(*help_text))
 
-            if error_message:
+            if error_message and validation is None:
                 children.append(FormErrorMessage.create(*error_message))
 
-        return super().create(*children, **props)
+        if validation is None:
+            return super().create(*children, **props)
+
+        is_invalid = props.pop("is_invalid", None)
+        control = super().create(
+            *children,
+            FormErrorMessage.create(
+                validation.error
+                if not error_message
+                else cond(validation.is_invalid, validation.error, error_message)
+            ),
+            is_invalid=validation.is_invalid
+            if is_invalid is None
+            else validation.is_invalid | is_invalid,
+            **props,
+        )
+        control.custom_attrs["ref"] = validation.ref
+        # the validation hooks must be rendered in the same component as the error.
+        control._memoization_mode = MemoizationMode(recursive=False)
+        return control
 
 
 class FormHelperText(ChakraComponent):
@@ -103,3 +287,10 @@ class FormErrorMessage(ChakraComponent):
     """A form error message component."""
 
     tag = "FormErrorMessage"
+
+
+form = Form.create
+form_control = FormControl.create
+form_error_message = FormErrorMessage.create
+form_helper_text = FormHelperText.create
+form_label = FormLabel.create
@@ -12,19 +12,26 @@ from typing import (
 from reflex.components.core.breakpoints import Breakpoints
 from reflex.components.el.elements.forms import Form as HTMLForm
 from reflex.event import (
+    EventChain,
     EventType,
     PointerEventInfo,
 )
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.forms.validation import ValidationRule
+
+HANDLE_CLIENT_ONLY_SUBMIT_JS = ...
 
 class Form(ChakraComponent, HTMLForm):
     @classmethod
     def create(
         cls,
         *children,
+        client_only: bool | None = False,
         as_: Var[str] | str | None = None,
+        _client_only_fields: dict[str, list[str]] | None = None,
+        _client_only_on_submit: EventChain | None = None,
         accept: Var[str] | str | None = None,
         accept_charset: Var[str] | str | None = None,
         action: Var[str] | str | None = None,
@@ -247,11 +254,14 @@ class Form(ChakraComponent, HTMLForm):
         on_unmount: EventType[()] | None = None,
         **props,
     ) -> Form:
-        """Create a new Chakra component.
+        """Create a form component.
 
         Args:
-            *children: The children of the component.
+            *children: The children of the form.
+            client_only: If true, the fields keep their values in the browser until the form is submitted, and on_submit receives every field in one dict: checkboxes and switches as booleans, repeated names, pin inputs and range sliders as lists, and sliders and number inputs as numbers.
             as_: What the form renders to.
+            _client_only_fields: The names of the indexed and numeric fields of a client_only form.
+            _client_only_on_submit: The on_submit handler of a client_only form, called by its own submit handler.
             accept: MIME types the server accepts for file upload
             accept_charset: Character encodings to be used for form submission
             action: URL where the form's data should be submitted
@@ -287,12 +297,14 @@ class Form(ChakraComponent, HTMLForm):
             class_name: The class name for the component.
             autofocus: Whether the component should take the focus once the page is loaded
             custom_attrs: custom attribute
-            **props: The properties of the component.
+            **props: The properties of the form.
 
         Returns:
-            A new Chakra component.
+            The form component.
         """
 
+    def add_hooks(self) -> list[str | Var]: ...
+
 class FormControl(ChakraComponent):
     @classmethod
     def create(
@@ -302,6 +314,7 @@ class FormControl(ChakraComponent):
         input=None,
         help_text=None,
         error_message=None,
+        rules: list[ValidationRule] | None = None,
         is_disabled: Var[bool] | bool | None = None,
         is_invalid: Var[bool] | bool | None = None,
         is_read_only: Var[bool] | bool | None = None,
@@ -343,6 +356,7 @@ class FormControl(ChakraComponent):
             input: The input of the form control.
             help_text: The help text of the form control.
             error_message: The error message of the form control.
+            rules: The validation rules of the input, checked in the browser. The form control is marked invalid with the error of the first failing rule, and its form cannot be submitted until every rule passes.
             is_disabled: If true, the form control will be disabled.
             is_invalid: If true, the form control will be invalid.
             is_read_only: If true, the form control will be readonly
@@ -517,3 +531,9 @@ class FormErrorMessage(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+form = Form.create
+form_control = FormControl.create
+form_error_message = FormErrorMessage.create
+form_helper_text = FormHelperText.create
+form_label = FormLabel.create
@@ -35,3 +35,6 @@ class IconButton(Text):
 
     # Replace the spinner component when isLoading is set to true
     spinner: Var[str]
+
+
+icon_button = IconButton.create
@@ -88,3 +88,5 @@ class IconButton(Text):
         Returns:
             A new Chakra component.
         """
+
+icon_button = IconButton.create
@@ -74,11 +74,14 @@ class Input(ChakraComponent):
     on_key_up: EventHandler[lambda e0: [e0.key]]
 
     @classmethod
-    def create(cls, *children, **props) -> Component:
+    def create(
+        cls, *children, debounce_timeout: int | Var[int] | None = None, **props
+    ) -> Component:
         """Create an Input component.
 
         Args:
             *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
             **props: The properties of the component.
 
         Returns:
@@ -86,7 +89,9 @@ class Input(ChakraComponent):
         """
         if props.get("value") is not None and props.get("on_change") is not None:
             # create a debounced input if the user requests full control to avoid typing jank
-            return DebounceInput.create(super().create(*children, **props))
+            return DebounceInput.create(
+                super().create(*children, **props), debounce_timeout=debounce_timeout
+            )
         return super().create(*children, **props)
 
 
@@ -120,3 +125,11 @@ class InputRightElement(ChakraComponent):
     """The InputRightElement component is a component that is used to add an element to the right of an input."""
 
     tag = "InputRightElement"
+
+
+input = Input.create
+input_group = InputGroup.create
+input_left_addon = InputLeftAddon.create
+input_left_element = InputLeftElement.create
+input_right_addon = InputRightAddon.create
+input_right_element = InputRightElement.create
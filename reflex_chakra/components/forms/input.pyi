@@ -25,6 +25,7 @@ class Input(ChakraComponent):
     def create(
         cls,
         *children,
+        debounce_timeout: Var[int] | int | None = None,
         value: Var[str] | str | None = None,
         default_value: Var[str] | str | None = None,
         placeholder: Var[str] | str | None = None,
@@ -128,6 +129,7 @@ class Input(ChakraComponent):
 
         Args:
             *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
             value: State var to bind the input.
             default_value: The default value of the input.
             placeholder: The placeholder text.
@@ -413,3 +415,10 @@ class InputRightElement(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+input = Input.create
+input_group = InputGroup.create
+input_left_addon = InputLeftAddon.create
+input_left_element = InputLeftElement.create
+input_right_addon = InputRightAddon.create
+input_right_element = InputRightElement.create
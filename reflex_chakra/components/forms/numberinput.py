@@ -11,6 +11,7 @@ from reflex_chakra.components import (
     LiteralButtonSize,
     LiteralInputVariant,
 )
+from reflex_chakra.components.forms.coalesce import LiteralEmit, coalesce_on_change
 
 
 class NumberInput(ChakraComponent):
@@ -79,13 +80,21 @@ class NumberInput(ChakraComponent):
     on_change: EventHandler[lambda e0: [e0]]
 
     @classmethod
-    def create(cls, *children, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        throttle_ms: int | Var[int] | None = None,
+        emit: LiteralEmit = "live",
+        **props,
+    ) -> Component:
         """Create a number input component.
 
         If no children are provided, a default stepper will be used.
 
         Args:
             *children: The children of the component.
+            throttle_ms: Send on_change at most once per this many milliseconds while the value changes.
+            emit: When on_change is sent while the value changes: on every change ("live"), once per animation frame ("raf") or only when the input loses focus ("end").
             **props: The props of the component.
 
         Returns:
@@ -102,7 +111,20 @@ class NumberInput(ChakraComponent):
                     NumberDecrementStepper.create(),
                 ),
             ]
-        return super().create(*children, **props)
+        component = super().create(*children, **props)
+        if props.get("on_change") is not None and (
+            throttle_ms is not None or emit != "live"
+        ):
+            # coalesce the changes in the browser, the final value is always sent
+            # when the input loses focus.
+            coalesce_on_change(
+                component,
+                Var.create(props["value"]) if props.get("value") is not None else None,
+                throttle_ms=throttle_ms,
+                emit=emit,
+                flush_on=("on_blur",),
+            )
+        return component
 
 
 class NumberInputField(ChakraComponent):
@@ -127,3 +149,10 @@ class NumberDecrementStepper(ChakraComponent):
     """The button to decrement the value of the input."""
 
     tag = "NumberDecrementStepper"
+
+
+number_decrement_stepper = NumberDecrementStepper.create
+number_increment_stepper = NumberIncrementStepper.create
+number_input = NumberInput.create
+number_input_field = NumberInputField.create
+number_input_stepper = NumberInputStepper.create
@@ -26,6 +26,8 @@ class NumberInput(ChakraComponent):
     def create(
         cls,
         *children,
+        throttle_ms: Var[int] | int | None = None,
+        emit: Literal["end", "live", "raf"] | None = "live",
         value: Number | Var[Number] | None = None,
         allow_mouse_wheel: Var[bool] | bool | None = None,
         clamped_value_on_blur: Var[bool] | bool | None = None,
@@ -84,6 +86,8 @@ class NumberInput(ChakraComponent):
 
         Args:
             *children: The children of the component.
+            throttle_ms: Send on_change at most once per this many milliseconds while the value changes.
+            emit: When on_change is sent while the value changes: on every change ("live"), once per animation frame ("raf") or only when the input loses focus ("end").
             value: State var to bind the input.
             allow_mouse_wheel: If true, the input's value will change based on mouse wheel.
             clamped_value_on_blur: This controls the value update when you blur out of the input. - If true and the value is greater than max, the value will be reset to max - Else, the value remains the same.
@@ -319,3 +323,9 @@ class NumberDecrementStepper(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+number_decrement_stepper = NumberDecrementStepper.create
+number_increment_stepper = NumberIncrementStepper.create
+number_input = NumberInput.create
+number_input_field = NumberInputField.create
+number_input_stepper = NumberInputStepper.create
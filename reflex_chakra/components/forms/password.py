@@ -10,3 +10,6 @@ class Password(Input):
 
     # The type of input.
     type_: Var[str] = Var.create("password")
+
+
+password = Password.create
@@ -203,3 +203,7 @@ class PinInputField(ChakraComponent):
         if self.id:
             return format.format_array_ref(self.id, self.index)
         return None
+
+
+pin_input = PinInput.create
+pin_input_field = PinInputField.create
@@ -166,3 +166,6 @@ class PinInputField(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+pin_input = PinInput.create
+pin_input_field = PinInputField.create
@@ -102,3 +102,7 @@ class Radio(Text):
                 raise ValueError(msg)
             props["value"] = children[0]
         return super().create(*children, **props)
+
+
+radio = Radio.create
+radio_group = RadioGroup.create
@@ -151,3 +151,6 @@ class Radio(Text):
         Returns:
             The radio component.
         """
+
+radio = Radio.create
+radio_group = RadioGroup.create
@@ -8,6 +8,7 @@ from reflex.utils import format
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent, LiteralChakraDirection
+from reflex_chakra.components.forms.coalesce import LiteralEmit, coalesce_on_change
 
 
 class RangeSlider(ChakraComponent):
@@ -82,13 +83,21 @@ class RangeSlider(ChakraComponent):
         return None
 
     @classmethod
-    def create(cls, *children, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        throttle_ms: int | Var[int] | None = None,
+        emit: LiteralEmit = "live",
+        **props,
+    ) -> Component:
         """Create a RangeSlider component.
 
         If no children are provided, a default RangeSlider will be created.
 
         Args:
             *children: The children of the component.
+            throttle_ms: Send on_change at most once per this many milliseconds while the value changes.
+            emit: When on_change is sent while the value changes: on every change ("live"), once per animation frame ("raf") or only when the change ends ("end").
             **props: The properties of the component.
 
         Returns:
@@ -112,7 +121,20 @@ class RangeSlider(ChakraComponent):
                     RangeSliderThumb.create(index=0),
                     RangeSliderThumb.create(index=1),
                 ]
-        return super().create(*children, **props)
+        component = super().create(*children, **props)
+        if props.get("on_change") is not None and (
+            throttle_ms is not None or emit != "live"
+        ):
+            # coalesce the changes in the browser, the final value is always sent
+            # before on_change_end.
+            coalesce_on_change(
+                component,
+                Var.create(props["value"]) if props.get("value") is not None else None,
+                throttle_ms=throttle_ms,
+                emit=emit,
+                flush_on=("on_change_end",),
+            )
+        return component
 
 
 class RangeSliderTrack(ChakraComponent):
@@ -148,3 +170,9 @@ class RangeSliderThumb(ChakraComponent):
         if self.id:
             return format.format_array_ref(self.id, self.index)
         return None
+
+
+range_slider = RangeSlider.create
+range_slider_filled_track = RangeSliderFilledTrack.create
+range_slider_thumb = RangeSliderThumb.create
+range_slider_track = RangeSliderTrack.create
@@ -17,6 +17,7 @@ from reflex.event import (
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.forms.coalesce import LiteralEmit
 
 class RangeSlider(ChakraComponent):
     def get_ref(self): ...
@@ -24,6 +25,8 @@ class RangeSlider(ChakraComponent):
     def create(
         cls,
         *children,
+        throttle_ms: Var[int] | int | None = None,
+        emit: LiteralEmit | None = "live",
         value: Var[list[int]] | list[int] | None = None,
         default_value: Var[list[int]] | list[int] | None = None,
         direction: Literal["ltr", "rtl"] | Var[Literal["ltr", "rtl"]] | None = None,
@@ -73,6 +76,8 @@ class RangeSlider(ChakraComponent):
 
         Args:
             *children: The children of the component.
+            throttle_ms: Send on_change at most once per this many milliseconds while the value changes.
+            emit: When on_change is sent while the value changes: on every change ("live"), once per animation frame ("raf") or only when the change ends ("end").
             value: State var to bind the input.
             default_value: The default values.
             direction: The writing mode ("ltr" | "rtl")
@@ -255,3 +260,8 @@ class RangeSliderThumb(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+range_slider = RangeSlider.create
+range_slider_filled_track = RangeSliderFilledTrack.create
+range_slider_thumb = RangeSliderThumb.create
+range_slider_track = RangeSliderTrack.create
@@ -74,3 +74,7 @@ class Select(ChakraComponent):
         ):
             children = [Foreach.create(children[0], lambda item: Option.create(item))]
         return super().create(*children, **props)
+
+
+option = Option.create
+select = Select.create
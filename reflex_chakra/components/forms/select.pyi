@@ -10,6 +10,7 @@ from typing import (
 )
 
 from reflex.components.core.breakpoints import Breakpoints
+from reflex.components.el import Option
 from reflex.event import (
     EventType,
     PointerEventInfo,
@@ -97,3 +98,6 @@ class Select(ChakraComponent):
         Returns:
             The component.
         """
+
+option = Option.create
+select = Select.create
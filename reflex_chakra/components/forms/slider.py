@@ -9,6 +9,7 @@ from reflex.event import EventHandler
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent, LiteralChakraDirection
+from reflex_chakra.components.forms.coalesce import LiteralEmit, coalesce_on_change
 
 LiteralLayout = Literal["horizontal", "vertical"]
 
@@ -82,13 +83,21 @@ class Slider(ChakraComponent):
     on_change_end: EventHandler[lambda e0: [e0]]
 
     @classmethod
-    def create(cls, *children, **props) -> Component:
+    def create(
+        cls,
+        *children,
+        throttle_ms: int | Var[int] | None = None,
+        emit: LiteralEmit = "live",
+        **props,
+    ) -> Component:
         """Create a slider component.
 
         If no children are provided, a default slider will be created.
 
         Args:
             *children: The children of the component.
+            throttle_ms: Send on_change at most once per this many milliseconds while the value changes.
+            emit: When on_change is sent while the value changes: on every change ("live"), once per animation frame ("raf") or only when the change ends ("end").
             **props: The properties of the component.
 
         Returns:
@@ -101,7 +110,20 @@ class Slider(ChakraComponent):
                 ),
                 SliderThumb.create(),
             ]
-        return super().create(*children, **props)
+        component = super().create(*children, **props)
+        if props.get("on_change") is not None and (
+            throttle_ms is not None or emit != "live"
+        ):
+            # coalesce the changes in the browser, the final value is always sent
+            # before on_change_end.
+            coalesce_on_change(
+                component,
+                Var.create(props["value"]) if props.get("value") is not None else None,
+                throttle_ms=throttle_ms,
+                emit=emit,
+                flush_on=("on_change_end",),
+            )
+        return component
 
 
 class SliderTrack(ChakraComponent):
@@ -129,3 +151,10 @@ class SliderMark(ChakraComponent):
     """The label or mark that shows names for specific slider values."""
 
     tag = "SliderMark"
+
+
+slider = Slider.create
+slider_filled_track = SliderFilledTrack.create
+slider_mark = SliderMark.create
+slider_thumb = SliderThumb.create
+slider_track = SliderTrack.create
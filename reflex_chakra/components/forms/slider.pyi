@@ -18,6 +18,7 @@ from reflex.event import (
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent
+from reflex_chakra.components.forms.coalesce import LiteralEmit
 
 LiteralLayout: TypeAlias = Literal["horizontal", "vertical"]
 
@@ -26,6 +27,8 @@ class Slider(ChakraComponent):
     def create(
         cls,
         *children,
+        throttle_ms: Var[int] | int | None = None,
+        emit: LiteralEmit | None = "live",
         value: Var[int] | int | None = None,
         color_scheme: Var[str] | str | None = None,
         default_value: Var[int] | int | None = None,
@@ -84,6 +87,8 @@ class Slider(ChakraComponent):
 
         Args:
             *children: The children of the component.
+            throttle_ms: Send on_change at most once per this many milliseconds while the value changes.
+            emit: When on_change is sent while the value changes: on every change ("live"), once per animation frame ("raf") or only when the change ends ("end").
             value: State var to bind the input.
             color_scheme: The color scheme.
             default_value: The placeholder text.
@@ -323,3 +328,9 @@ class SliderMark(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+slider = Slider.create
+slider_filled_track = SliderFilledTrack.create
+slider_mark = SliderMark.create
+slider_thumb = SliderThumb.create
+slider_track = SliderTrack.create
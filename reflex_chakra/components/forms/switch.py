@@ -48,3 +48,6 @@ class Switch(ChakraComponent):
 
     # Fired when the switch value changes
     on_change: EventHandler[lambda e0: [e0.target.checked]]
+
+
+switch = Switch.create
@@ -136,3 +136,5 @@ class Switch(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+switch = Switch.create
@@ -64,17 +64,29 @@ class TextArea(ChakraComponent):
     on_key_up: EventHandler[lambda e0: [e0.key]]
 
     @classmethod
-    def create(cls, *children, **props) -> Component:
-        """Create an Input component.
+    def create(
+        cls, *children, debounce_timeout: int | Var[int] | None = None, **props
+    ) -> Component:
+        """Create a TextArea component.
 
         Args:
             *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
             **props: The properties of the component.
 
         Returns:
             The component.
         """
         if props.get("value") is not None and props.get("on_change") is not None:
-            # create a debounced input if the user requests full control to avoid typing jank
-            return DebounceInput.create(super().create(*children, **props))
+            # create a debounced input if the user requests full control to avoid typing jank.
+            # pending changes are sent on blur, and not on Enter, which adds a new line.
+            return DebounceInput.create(
+                super().create(*children, **props),
+                debounce_timeout=debounce_timeout,
+                force_notify_by_enter=False,
+                force_notify_on_blur=True,
+            )
         return super().create(*children, **props)
+
+
+text_area = TextArea.create
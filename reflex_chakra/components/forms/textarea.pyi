@@ -23,6 +23,7 @@ class TextArea(ChakraComponent):
     def create(
         cls,
         *children,
+        debounce_timeout: Var[int] | int | None = None,
         value: Var[str] | str | None = None,
         default_value: Var[str] | str | None = None,
         placeholder: Var[str] | str | None = None,
@@ -68,10 +69,11 @@ class TextArea(ChakraComponent):
         on_unmount: EventType[()] | None = None,
         **props,
     ) -> TextArea:
-        """Create an Input component.
+        """Create a TextArea component.
 
         Args:
             *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
             value: State var to bind the input.
             default_value: The default value of the textarea.
             placeholder: The placeholder text.
@@ -100,3 +102,5 @@ class TextArea(ChakraComponent):
         Returns:
             The component.
         """
+
+text_area = TextArea.create
@@ -10,3 +10,6 @@ class TimePicker(Input):
 
     # The type of input.
     type_: Var[str] = Var.create("time")
+
+
+time_picker = TimePicker.create
@@ -23,6 +23,7 @@ class TimePicker(Input):
     def create(
         cls,
         *children,
+        debounce_timeout: Var[int] | int | None = None,
         type_: Var[str] | str | None = None,
         value: Var[str] | str | None = None,
         default_value: Var[str] | str | None = None,
@@ -76,6 +77,7 @@ class TimePicker(Input):
 
         Args:
             *children: The children of the component.
+            debounce_timeout: The milliseconds to wait after the last keystroke before sending on_change, when value and on_change are set. Defaults to 300.
             type_: The type of input.
             value: State var to bind the input.
             default_value: The default value of the input.
@@ -106,3 +108,5 @@ class TimePicker(Input):
         Returns:
             The component.
         """
+
+time_picker = TimePicker.create
@@ -0,0 +1,254 @@
+"""Client-side validation rules of form controls."""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import TYPE_CHECKING
+
+from reflex.vars.base import LiteralVar, Var, VarData, get_unique_variable_name
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class ValidationRule:
+    """A validation rule of a form control, checked in the browser.
+
+    A rule is a JavaScript expression that is true when the value of the field is
+    valid, where `value` is the value of the field (a string, or a boolean for
+    checkboxes and switches) and `values(name)` the value of another field of the form.
+    Apart from `required`, the rules accept empty fields, so optional fields can be
+    left blank.
+    """
+
+    def __init__(self, check: str, message: str):
+        """Create a rule.
+
+        Args:
+            check: The JavaScript expression that is true when the value is valid.
+            message: The error message shown when the value is not valid.
+        """
+        self.check = check
+        self.message = message
+
+    @classmethod
+    def _optional(cls, check: str, message: str) -> ValidationRule:
+        return cls(f'value === "" || ({check})', message)
+
+    @classmethod
+    def required(cls, message: str = "This field is required.") -> ValidationRule:
+        """The field must be filled in, or checked.
+
+        Args:
+            message: The error message.
+
+        Returns:
+            The rule.
+        """
+        return cls('value !== false && String(value).trim() !== ""', message)
+
+    @classmethod
+    def min_length(cls, length: int, message: str | None = None) -> ValidationRule:
+        """The field must have at least a number of characters.
+
+        Args:
+            length: The minimum number of characters.
+            message: The error message.
+
+        Returns:
+            The rule.
+        """
+        return cls._optional(
+            f"value.length >= {length}",
+            message or f"Enter at least {length} characters.",
+        )
+
+    @classmethod
+    def max_length(cls, length: int, message: str | None = None) -> ValidationRule:
+        """The field must have at most a number of characters.
+
+        Args:
+            length: The maximum number of characters.
+            message: The error message.
+
+        Returns:
+            The rule.
+        """
+        return cls._optional(
+            f"value.length <= {length}",
+            message or f"Enter at most {length} characters.",
+        )
+
+    @classmethod
+    def pattern(
+        cls, pattern: str, message: str = "Enter a valid value."
+    ) -> ValidationRule:
+        """The whole value must match a regular expression.
+
+        Args:
+            pattern: The JavaScript regular expression.
+            message: The error message.
+
+        Returns:
+            The rule.
+        """
+        return cls._optional(
+            f"new RegExp({json.dumps(f'^(?:{pattern})$')}, 'u').test(value)", message
+        )
+
+    @classmethod
+    def number_range(
+        cls,
+        min_: float | None = None,
+        max_: float | None = None,
+        message: str | None = None,
+    ) -> ValidationRule:
+        """The field must be a number, optionally within a range.
+
+        Args:
+            min_: The minimum value.
+            max_: The maximum value.
+            message: The error message.
+
+        Raises:
+            ValueError: If a bound is not a finite number.
+
+        Returns:
+            The rule.
+        """
+        for bound in (min_, max_):
+            if bound is not None and not math.isfinite(bound):
+                msg = f"number range bounds should be finite numbers. Got {bound!r}"
+                raise ValueError(msg)
+        checks = ["!Number.isNaN(Number(value))"]
+        if min_ is not None:
+            checks.append(f"Number(value) >= {LiteralVar.create(min_)!s}")
+        if max_ is not None:
+            checks.append(f"Number(value) <= {LiteralVar.create(max_)!s}")
+        if message is None:
+            message = (
+                f"Enter a number between {min_} and {max_}."
+                if min_ is not None and max_ is not None
+                else f"Enter a number of at least {min_}."
+                if min_ is not None
+                else f"Enter a number of at most {max_}."
+                if max_ is not None
+                else "Enter a number."
+            )
+        return cls._optional(" && ".join(checks), message)
+
+    @classmethod
+    def equals_field(
+        cls, name: str, message: str = "The values do not match."
+    ) -> ValidationRule:
+        """The field must have the same value as another field of the form.
+
+        Args:
+            name: The name of the other field.
+            message: The error message.
+
+        Returns:
+            The rule.
+        """
+        return cls(f"value === values({json.dumps(name)})", message)
+
+
+class FieldValidation:
+    """The validation state of a form control, tracked in the browser.
+
+    The first field of the control is checked against the rules whenever a field of
+    its form changes, and its custom validity is set to the first error, so the
+    browser does not submit the form while a rule fails. The error is only shown
+    once the field lost focus or the form was submitted, so users are not told a
+    field is invalid before they are done typing.
+    """
+
+    def __init__(self, rules: Sequence[ValidationRule]):
+        """Track the validation of a form control.
+
+        Args:
+            rules: The rules, checked in order.
+        """
+        name = f"validation_{get_unique_variable_name()}"
+        self._ref = f"{name}_ref"
+        self._error = f"{name}_error"
+        checks = "\n".join(
+            f"            if (!({rule.check})) return {json.dumps(rule.message)};"
+            for rule in rules
+        )
+        hooks = [
+            f"const {self._ref} = useRef(null);",
+            f"const [{self._error}, set_{self._error}] = useState(null);",
+            f"""useEffect(() => {{
+    const node = {self._ref}.current;
+    if (!node) return;
+    const scope = node.closest("form") ?? node;
+    let touched = false;
+    const validate = () => {{
+        const field = node.querySelector("input:not([type=hidden]), textarea, select");
+        if (!field) return null;
+        const value = field.type === "checkbox" ? field.checked : field.value;
+        const values = (name) => field.form?.elements.namedItem(name)?.value;
+        const error = (() => {{
+{checks}
+            return null;
+        }})();
+        field.setCustomValidity(error ?? "");
+        return error;
+    }};
+    const update = () => {{
+        const error = validate();
+        if (touched) set_{self._error}(error);
+    }};
+    const touch = () => {{
+        touched = true;
+        update();
+    }};
+    validate();
+    scope.addEventListener("input", update);
+    scope.addEventListener("change", update);
+    node.addEventListener("focusout", touch);
+    node.addEventListener("invalid", touch, true);
+    return () => {{
+        scope.removeEventListener("input", update);
+        scope.removeEventListener("change", update);
+        node.removeEventListener("focusout", touch);
+        node.removeEventListener("invalid", touch, true);
+    }};
+}}, []);""",
+        ]
+        self._var_data = VarData(
+            imports={"react": ["useEffect", "useRef", "useState"]},
+            hooks=dict.fromkeys(hooks),
+        )
+
+    def _var(self, js_expr: str, var_type: type) -> Var:
+        return Var(_js_expr=js_expr, _var_type=var_type, _var_data=self._var_data)
+
+    @property
+    def ref(self) -> Var:
+        """The ref of the form control element.
+
+        Returns:
+            The ref var.
+        """
+        return self._var(self._ref, object)
+
+    @property
+    def error(self) -> Var:
+        """The error message of the first failing rule, or null once the value is valid.
+
+        Returns:
+            The error message var.
+        """
+        return self._var(self._error, str)
+
+    @property
+    def is_invalid(self) -> Var:
+        """Whether an error is shown.
+
+        Returns:
+            The boolean var.
+        """
+        return self._var(f"({self._error} !== null)", bool)
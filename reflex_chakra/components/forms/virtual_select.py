@@ -0,0 +1,508 @@
+"""A searchable select that only renders the visible options."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from reflex.components import el
+from reflex.components.component import Component
+from reflex.components.core.cond import cond
+from reflex.components.core.foreach import Foreach
+from reflex.constants import Hooks, Imports, MemoizationMode
+from reflex.event import EventChain, EventHandler, passthrough_event_spec
+from reflex.vars.base import LiteralVar, Var, VarData
+from reflex.vars.sequence import ArrayVar
+
+from reflex_chakra.components.forms.input import Input
+from reflex_chakra.components.forms.virtual_select_options import (
+    SelectOptionsSource,
+    VirtualSelectOptions,
+)
+from reflex_chakra.components.layout.box import Box
+from reflex_chakra.components.sources import hook_var, next_request, unique_names
+from reflex_chakra.components.virtualization import VirtualWindow
+
+if TYPE_CHECKING:
+    from reflex_chakra.components import LiteralButtonSize, LiteralInputVariant
+
+
+class VirtualSelect(Box):
+    """A select with a search field, rendering only the visible options.
+
+    Typing in the field filters the options in the browser, against a lowercase index
+    of their labels built once per options update. The options are rendered in a
+    scrollable list that only holds the visible ones, so a select can offer tens of
+    thousands of options. With a source, the options are instead fetched from the
+    backend one page at a time as the list is scrolled, and the query is sent once
+    typing pauses.
+    """
+
+    # Fired when an option is selected, with its value.
+    on_change: EventHandler[passthrough_event_spec(str)]
+
+    _memoization_mode = MemoizationMode(recursive=False)
+
+    @classmethod
+    def create(
+        cls,
+        options: Var | list | tuple | None = None,
+        *,
+        source: SelectOptionsSource | None = None,
+        page_size: int = 50,
+        value: Var | str | None = None,
+        default_value: str | None = None,
+        placeholder: Var | str | None = None,
+        name: Var | str | None = None,
+        is_disabled: Var | bool | None = None,
+        is_invalid: Var | bool | None = None,
+        variant: Var[LiteralInputVariant] | LiteralInputVariant | None = None,
+        size: Var[LiteralButtonSize] | LiteralButtonSize | None = None,
+        no_options_text: Var | str = "No options",
+        error_text: Var | str = "Could not load the options",
+        item_height: int = 36,
+        max_height: str = "300px",
+        overscan: int = 10,
+        debounce_ms: int = 250,
+        **props,
+    ) -> Component:
+        """Create a virtual select component.
+
+        Options are strings, or dicts with a value and a label.
+
+        Args:
+            options: The options, either a Var or a literal list.
+            source: A function called with a query, an offset and a limit that returns the matching options in that range, used instead of options.
+            page_size: The number of options fetched per request from the source.
+            value: The value of the selected option, to control the select.
+            default_value: The value initially selected.
+            placeholder: The placeholder text.
+            name: The name of the form field holding the value.
+            is_disabled: If true, the select will be disabled.
+            is_invalid: If true, the select will be invalid.
+            variant: "outline" | "filled" | "flushed" | "unstyled"
+            size: The size of the select.
+            no_options_text: The text shown when no option matches the query.
+            error_text: The text shown while a page of options that failed to load from the source waits to be requested again.
+            item_height: The height of an option in pixels.
+            max_height: The height of the list of options.
+            overscan: The number of options rendered above and below the visible ones.
+            debounce_ms: The milliseconds to wait after the last keystroke before sending the query to the source.
+            **props: The properties of the component.
+
+        Returns:
+            The virtual select component.
+        """
+        create_select = functools.partial(
+            cls._create_select,
+            value=value,
+            default_value=default_value,
+            placeholder=placeholder,
+            name=name,
+            is_disabled=is_disabled,
+            is_invalid=is_invalid,
+            variant=variant,
+            size=size,
+            no_options_text=no_options_text,
+            error_text=error_text,
+            item_height=item_height,
+            max_height=max_height,
+            overscan=overscan,
+            debounce_ms=debounce_ms,
+        )
+        if source is not None:
+            return VirtualSelectOptions.create(
+                source=source,
+                page_size=page_size,
+                create_select=create_select,
+                **props,
+            )
+        return create_select(options=options if options is not None else [], **props)
+
+    @classmethod
+    def _create_select(
+        cls,
+        *,
+        options: Var | list | tuple | None = None,
+        options_state: type[VirtualSelectOptions] | None = None,
+        value: Var | str | None,
+        default_value: str | None,
+        placeholder: Var | str | None,
+        name: Var | str | None,
+        is_disabled: Var | bool | None,
+        is_invalid: Var | bool | None,
+        variant: Var[LiteralInputVariant] | LiteralInputVariant | None,
+        size: Var[LiteralButtonSize] | LiteralButtonSize | None,
+        no_options_text: Var | str,
+        error_text: Var | str,
+        item_height: int,
+        max_height: str,
+        overscan: int,
+        debounce_ms: int,
+        **props,
+    ) -> Component:
+        """Create a virtual select component, with its options or the state loading them.
+
+        Args:
+            options: The options, either a Var or a literal list.
+            options_state: The state loading the options from a source, used instead of options.
+            value: The value of the selected option.
+            default_value: The value initially selected.
+            placeholder: The placeholder text.
+            name: The name of the form field.
+            is_disabled: Whether the select is disabled.
+            is_invalid: Whether the select is invalid.
+            variant: The variant of the field.
+            size: The size of the field.
+            no_options_text: The text shown when no option matches the query.
+            error_text: The text shown when a page of options failed to load.
+            item_height: The height of an option in pixels.
+            max_height: The height of the list of options.
+            overscan: The number of options rendered above and below the visible ones.
+            debounce_ms: The milliseconds to wait before sending the query to the source.
+            **props: The properties of the component.
+
+        Returns:
+            The virtual select component.
+        """
+        component = super().create(**props)
+        on_change = component.event_triggers.pop("on_change", None)
+        send = (
+            f"({LiteralVar.create(on_change)!s})(option.value);"
+            if on_change is not None
+            else ""
+        )
+
+        (
+            source,
+            all_options,
+            index,
+            query,
+            filtered,
+            is_open,
+            highlighted,
+            selected,
+            scroller,
+            choose,
+            find,
+            results,
+            request,
+            load,
+            version,
+        ) = unique_names(
+            "vselect",
+            "source",
+            "options",
+            "index",
+            "query",
+            "filtered",
+            "open",
+            "highlighted",
+            "selected",
+            "scroller",
+            "choose",
+            "find",
+            "results",
+            "request",
+            "load",
+            "version",
+        )
+        value = Var.create(value if value is not None else default_value)
+        var_datas = [value._get_all_var_data()]
+
+        hooks = [
+            f'const [{query}, set_{query}] = useState("");',
+            f"const [{is_open}, set_{is_open}] = useState(false);",
+            f"const [{highlighted}, set_{highlighted}] = useState(0);",
+            f"const {scroller} = useRef(null);",
+        ]
+        if options_state is None:
+            options = Var.create(options)
+            var_datas.append(options._get_all_var_data())
+            hooks.append(
+                f"const {source} = {options!s};"
+                if options._get_all_var_data()
+                else f"const {source} = useMemo(() => {options!s}, []);"
+            )
+        else:
+            load_chain = str(
+                Var.create(
+                    EventChain.create(
+                        options_state.load_options,  # pyright: ignore[reportArgumentType]
+                        args_spec=lambda request, query, offset: [
+                            request,
+                            query,
+                            offset,
+                        ],
+                    )
+                )
+            )
+            (
+                loaded_request,
+                loaded_offset,
+                loaded_options,
+                loaded_done,
+                loaded_error,
+            ) = (
+                str(options_state.loaded_request),
+                str(options_state.loaded_offset),
+                str(options_state.loaded_options),
+                str(options_state.loaded_done),
+                str(options_state.loaded_error),
+            )
+            var_datas += [
+                options_state.loaded_request._get_all_var_data(),
+                VarData(imports=Imports.EVENTS, hooks={Hooks.EVENTS: None}),
+            ]
+            hooks += [
+                f"const {request} = useRef(0);",
+                f"const {results} = useRef({{ request: 0, query: null, options: [], done: false, loading: false, failed: false, failures: 0, retryAt: 0 }});",
+                f"const [{version}, set_{version}] = useState(0);",
+                f"""const {load} = (offset) => {{
+    const results = {results}.current;
+    if (results.loading || Date.now() < results.retryAt || (offset > 0 && results.done)) return;
+    results.loading = true;
+    {load_chain}(results.request, results.query, offset);
+}};""",
+                # a new query is a new request, which cancels the pending ones.
+                f"""useEffect(() => {{
+    const timer = setTimeout(() => {{
+        {next_request(request)}
+        {results}.current = {{ request: {request}.current, query: {query}, options: [], done: false, loading: false, failed: false, failures: 0, retryAt: 0 }};
+        {load}(0);
+        set_{version}((version) => version + 1);
+    }}, {query} ? {debounce_ms} : 0);
+    return () => clearTimeout(timer);
+}}, [{query}]);""",
+                f"""useEffect(() => {{
+    const results = {results}.current;
+    if ({loaded_request} !== results.request || {loaded_offset} !== results.options.length) return;
+    results.loading = false;
+    if ({loaded_error}) {{
+        // request the page again later, as a new request, waiting longer after each failure.
+        results.failed = true;
+        results.failures += 1;
+        const delay = Math.min(30000, 1000 * 2 ** (results.failures - 1));
+        results.retryAt = Date.now() + delay;
+        setTimeout(() => {{
+            if (results !== {results}.current) return;
+            {next_request(request)}
+            results.request = {request}.current;
+            results.retryAt = 0;
+            {load}(results.options.length);
+        }}, delay);
+        set_{version}((version) => version + 1);
+        return;
+    }}
+    results.failed = false;
+    results.failures = 0;
+    results.options = results.options.concat({loaded_options});
+    results.done = {loaded_done};
+    set_{version}((version) => version + 1);
+}}, [{loaded_request}, {loaded_offset}, {loaded_options}, {loaded_error}]);""",
+                f"const {source} = {results}.current.options;",
+            ]
+        hooks += [
+            f"""const {all_options} = useMemo(() => {source}.map((option) => option !== null && typeof option === "object"
+    ? {{ value: String(option.value), label: String(option.label ?? option.value) }}
+    : {{ value: String(option), label: String(option) }}), [{source}]);""",
+        ]
+        if options_state is None:
+            hooks += [
+                f"const {index} = useMemo(() => {all_options}.map((option) => option.label.toLowerCase()), [{all_options}]);",
+                f"const {query}_needle = {query}.trim().toLowerCase();",
+                f"""const {filtered} = useMemo(() => {{
+    const needle = {query}_needle;
+    if (!needle) return {all_options};
+    const filtered = [];
+    {index}.forEach((label, position) => {{
+        if (label.includes(needle)) filtered.push({all_options}[position]);
+    }});
+    return filtered;
+}}, [{all_options}, {index}, {query}_needle]);""",
+            ]
+        else:
+            # the source filters the options, so they are shown as loaded.
+            hooks.append(f"const {filtered} = {all_options};")
+        hooks += [
+            f"""const {find} = (value) => value == null || value === ""
+    ? null
+    : {all_options}.find((option) => option.value === String(value)) ?? {{ value: String(value), label: String(value) }};""",
+            f"const [{selected}, set_{selected}] = useState(() => {find}({value!s}));",
+            f"""useEffect(() => {{
+    set_{selected}((selected) => (selected?.value ?? "") === String({value!s} ?? "") ? selected : {find}({value!s}));
+}}, [{value!s}]);""",
+            f"""const {choose} = (option) => {{
+    set_{selected}(option);
+    set_{is_open}(false);
+    set_{query}("");
+    {send}
+}};""",
+            f"""useEffect(() => {{
+    set_{highlighted}(0);
+    if ({scroller}.current) {scroller}.current.scrollTop = 0;
+}}, [{filtered}]);""",
+        ]
+        var_data = VarData.merge(
+            *var_datas,
+            LiteralVar.create(on_change)._get_all_var_data()
+            if on_change is not None
+            else None,
+            VarData(
+                imports={"react": ["useEffect", "useMemo", "useRef", "useState"]},
+                hooks=dict.fromkeys(hooks),
+            ),
+        )
+
+        window = VirtualWindow(
+            hook_var(var_data, filtered, list[dict[str, str]]).to(
+                ArrayVar, list[dict[str, str]]
+            ),
+            item_height=item_height,
+            overscan=overscan,
+        )
+        list_ref = window.ref
+        if options_state is not None:
+            # load the next page once the window reaches the end of the loaded options.
+            list_ref = Var(
+                _js_expr=str(window.ref),
+                _var_type=object,
+                _var_data=VarData.merge(
+                    window.ref._get_all_var_data(),
+                    VarData(
+                        hooks={
+                            f"""useEffect(() => {{
+    const length = {filtered}.length;
+    if (length > 0 && {window.end!s} >= length) {load}(length);
+}}, [{window.end!s}, {filtered}.length]);""": None
+                        }
+                    ),
+                ),
+            )
+
+        on_key_down = hook_var(
+            var_data,
+            f"""((event) => {{
+    const options = {filtered};
+    if (event.key === "ArrowDown" || event.key === "ArrowUp") {{
+        event.preventDefault();
+        set_{is_open}(true);
+        const next = Math.min(options.length - 1, Math.max(0, {highlighted} + (event.key === "ArrowDown" ? 1 : -1)));
+        set_{highlighted}(next);
+        const list = {scroller}.current;
+        if (list) {{
+            const top = next * {item_height};
+            if (top < list.scrollTop) list.scrollTop = top;
+            else if (top + {item_height} > list.scrollTop + list.clientHeight) list.scrollTop = top + {item_height} - list.clientHeight;
+        }}
+    }} else if (event.key === "Enter" && {is_open} && options[{highlighted}] !== undefined) {{
+        event.preventDefault();
+        {choose}(options[{highlighted}]);
+    }} else if (event.key === "Escape") {{
+        set_{is_open}(false);
+        set_{query}("");
+    }}
+}})""",
+        )
+
+        def create_option(option: Var, position: Var) -> Component:
+            option_index = window.start + position.to(int)
+            return Box.create(
+                option.to(dict)["label"],
+                height=f"{item_height}px",
+                line_height=f"{item_height}px",
+                padding_x="3",
+                overflow="hidden",
+                white_space="nowrap",
+                text_overflow="ellipsis",
+                cursor="pointer",
+                bg=cond(
+                    option_index == hook_var(var_data, highlighted, int), "gray.100", ""
+                ),
+                custom_attrs={
+                    "role": "option",
+                    "aria-selected": option.to(dict)["value"]
+                    == hook_var(var_data, f"{selected}?.value", str),
+                    # keep the focus in the field, so selecting does not close the list first.
+                    "onMouseDown": hook_var(
+                        var_data,
+                        f"((event) => {{ event.preventDefault(); {choose}({option!s}); }})",
+                    ),
+                    "onMouseEnter": hook_var(
+                        var_data, f"(() => set_{highlighted}({option_index!s}))"
+                    ),
+                },
+            )
+
+        field = Input.create(
+            placeholder=placeholder,
+            is_disabled=is_disabled,
+            is_invalid=is_invalid,
+            variant=variant,
+            size=size,
+            custom_attrs={
+                "autoComplete": "off",
+                "role": "combobox",
+                "value": hook_var(
+                    var_data, f'({is_open} ? {query} : ({selected}?.label ?? ""))', str
+                ),
+                "aria-expanded": hook_var(var_data, is_open, bool),
+                "onChange": hook_var(
+                    var_data,
+                    f"((event) => {{ set_{query}(event.target.value); set_{is_open}(true); }})",
+                ),
+                "onFocus": hook_var(var_data, f"(() => set_{is_open}(true))"),
+                "onBlur": hook_var(
+                    var_data, f'(() => {{ set_{is_open}(false); set_{query}(""); }})'
+                ),
+                "onKeyDown": on_key_down,
+            },
+        )
+        status = cond(
+            hook_var(var_data, f"{filtered}.length === 0", bool),
+            Box.create(no_options_text, padding_x="3", padding_y="2", color="gray.500"),
+        )
+        if options_state is not None:
+            status = cond(
+                hook_var(var_data, f"{results}.current.failed", bool),
+                Box.create(error_text, padding_x="3", padding_y="2", color="red.500"),
+                status,
+            )
+        listbox = Box.create(
+            Box.create(
+                Box.create(height=window.space_before),
+                Foreach.create(window.items, create_option),
+                Box.create(height=window.space_after),
+                custom_attrs={"ref": list_ref},
+            ),
+            status,
+            position="absolute",
+            top="100%",
+            left="0",
+            right="0",
+            z_index="dropdown",
+            margin_top="1",
+            max_height=max_height,
+            overflow_y="auto",
+            bg="chakra-body-bg",
+            border_width="1px",
+            border_radius="md",
+            box_shadow="md",
+            # the list stays mounted while closed, so the window keeps tracking it.
+            visibility=cond(hook_var(var_data, is_open, bool), "visible", "hidden"),
+            custom_attrs={"ref": hook_var(var_data, scroller), "role": "listbox"},
+        )
+        component.children = [field, listbox]
+        if name is not None:
+            component.children.append(
+                el.Input.create(
+                    type="hidden",
+                    name=name,
+                    value=hook_var(var_data, f'({selected}?.value ?? "")', str),
+                )
+            )
+        component.style.setdefault("position", "relative")
+        return component
+
+
+virtual_select = VirtualSelect.create
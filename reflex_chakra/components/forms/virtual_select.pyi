@@ -0,0 +1,118 @@
+"""Stub file for reflex_chakra/components/forms/virtual_select.py"""
+
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+from collections.abc import Callable, Mapping, Sequence
+from typing import (
+    Any,
+    Literal,
+)
+
+from reflex.components.core.breakpoints import Breakpoints
+from reflex.event import (
+    EventType,
+    PointerEventInfo,
+)
+from reflex.vars.base import Var
+
+from reflex_chakra.components.layout.box import Box
+
+class VirtualSelect(Box):
+    @classmethod
+    def create(
+        cls,
+        *children,
+        source: Callable[[str, int, int], Any] | None = None,
+        page_size: int | None = 50,
+        value: Var | str | None = None,
+        default_value: str | None = None,
+        placeholder: Var | str | None = None,
+        name: Var | str | None = None,
+        is_disabled: Var | bool | None = None,
+        is_invalid: Var | bool | None = None,
+        variant: Literal["filled", "flushed", "outline", "unstyled"]
+        | Var[Literal["filled", "flushed", "outline", "unstyled"]]
+        | None = None,
+        size: Literal["lg", "md", "sm", "xs"]
+        | Var[Literal["lg", "md", "sm", "xs"]]
+        | None = None,
+        no_options_text: Var | str = "No options",
+        error_text: Var | str = "Could not load the options",
+        item_height: int | None = 36,
+        max_height: str | None = "300px",
+        overscan: int | None = 10,
+        debounce_ms: int | None = 250,
+        element: Var[str] | str | None = None,
+        src: Var[str] | str | None = None,
+        alt: Var[str] | str | None = None,
+        style: Sequence[Mapping[str, Any]]
+        | Mapping[str, Any]
+        | Var[Mapping[str, Any]]
+        | Breakpoints
+        | None = None,
+        key: Any | None = None,
+        id: Any | None = None,
+        ref: Var | None = None,
+        class_name: Any | None = None,
+        autofocus: bool | None = None,
+        custom_attrs: dict[str, Var | Any] | None = None,
+        on_blur: EventType[()] | None = None,
+        on_change: EventType[()] | EventType[str] | None = None,
+        on_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_context_menu: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_double_click: EventType[()] | EventType[PointerEventInfo] | None = None,
+        on_focus: EventType[()] | None = None,
+        on_mount: EventType[()] | None = None,
+        on_mouse_down: EventType[()] | None = None,
+        on_mouse_enter: EventType[()] | None = None,
+        on_mouse_leave: EventType[()] | None = None,
+        on_mouse_move: EventType[()] | None = None,
+        on_mouse_out: EventType[()] | None = None,
+        on_mouse_over: EventType[()] | None = None,
+        on_mouse_up: EventType[()] | None = None,
+        on_scroll: EventType[()] | None = None,
+        on_scroll_end: EventType[()] | None = None,
+        on_unmount: EventType[()] | None = None,
+        **props,
+    ) -> VirtualSelect:
+        """Create a virtual select component.
+
+        Options are strings, or dicts with a value and a label.
+
+        Args:
+            options: The options, either a Var or a literal list.
+            source: A function called with a query, an offset and a limit that returns the matching options in that range, used instead of options.
+            page_size: The number of options fetched per request from the source.
+            value: The value of the selected option, to control the select.
+            default_value: The value initially selected.
+            placeholder: The placeholder text.
+            name: The name of the form field holding the value.
+            is_disabled: If true, the select will be disabled.
+            is_invalid: If true, the select will be invalid.
+            variant: "outline" | "filled" | "flushed" | "unstyled"
+            size: The size of the select.
+            no_options_text: The text shown when no option matches the query.
+            error_text: The text shown while a page of options that failed to load from the source waits to be requested again.
+            item_height: The height of an option in pixels.
+            max_height: The height of the list of options.
+            overscan: The number of options rendered above and below the visible ones.
+            debounce_ms: The milliseconds to wait after the last keystroke before sending the query to the source.
+            on_change: Fired when an option is selected, with its value.
+            element: The type element to render. You can specify an image, video, or any other HTML element such as iframe.
+            src: The source of the content.
+            alt: The alt text of the content.
+            style: The style of the component.
+            key: A unique key for the component.
+            id: The id for the component.
+            ref: The Var to pass as the ref to the component.
+            class_name: The class name for the component.
+            autofocus: Whether the component should take the focus once the page is loaded
+            custom_attrs: custom attribute
+            **props: The properties of the component.
+
+        Returns:
+            The virtual select component.
+        """
+
+virtual_select = VirtualSelect.create
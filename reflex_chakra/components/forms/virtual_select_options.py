@@ -0,0 +1,110 @@
+"""The options of a virtual select, loaded from a backend source."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from reflex.components.component import Component
+from reflex.event import event
+from reflex.state import ComponentState
+from reflex.vars.base import Field, field
+
+from reflex_chakra.components.sources import fetch_items
+
+# An options source returns the options matching a query in [offset, offset + limit).
+# It may be sync or async, and return a list, any iterable or an async iterable.
+SelectOptionsSource = Callable[[str, int, int], Any]
+
+
+class VirtualSelectOptions(ComponentState):
+    """The options of a virtual select, loaded one page at a time from a source.
+
+    Each query sent by the browser carries a request id, which only grows. A request
+    overtaken by a newer one is cancelled: it is skipped if it has not started yet,
+    and its options are dropped instead of being sent if they arrive too late.
+    """
+
+    # The id of the request the loaded options answer.
+    loaded_request: Field[int] = field(-1)
+
+    # The offset of the loaded options in the options matching the query.
+    loaded_offset: Field[int] = field(0)
+
+    # The last loaded page of options.
+    loaded_options: Field[list] = field(default_factory=list)
+
+    # Whether the loaded page is the last one.
+    loaded_done: Field[bool] = field(False)
+
+    # Whether the source raised while loading the requested page.
+    loaded_error: Field[bool] = field(False)
+
+    # The id of the latest request received.
+    _latest_request: int = 0
+
+    # The options source and page size of this instance, set by get_component.
+    _source: ClassVar[SelectOptionsSource]
+    _page_size: ClassVar[int]
+
+    @event(background=True)
+    async def load_options(self, request: int, query: str, offset: int):
+        """Fetch a page of the options matching a query.
+
+        Args:
+            request: The id of the request.
+            query: The text typed in the select.
+            offset: The index of the first option.
+        """
+        cls = type(self)
+        async with self:
+            if request < self._latest_request:
+                return
+            self._latest_request = request
+        try:
+            options, done = await fetch_items(
+                cls._source, query, offset, limit=cls._page_size
+            )
+        except Exception:
+            # answer the request, so the browser can request the page again.
+            async with self:
+                if request >= self._latest_request:
+                    self.loaded_options = []
+                    self.loaded_done = False
+                    self.loaded_error = True
+                    self.loaded_offset = offset
+                    self.loaded_request = request
+            raise
+        async with self:
+            if request < self._latest_request:
+                return
+            self.loaded_options = options
+            self.loaded_done = done
+            self.loaded_error = False
+            self.loaded_offset = offset
+            self.loaded_request = request
+
+    @classmethod
+    def get_component(
+        cls,
+        *children,  # noqa: ARG003
+        source: SelectOptionsSource,
+        page_size: int = 50,
+        create_select: Callable[..., Component],
+        **props,
+    ) -> Component:
+        """Create a virtual select loading its options from a source.
+
+        Args:
+            *children: Unused, the options come from the source.
+            source: A function called with a query, an offset and a limit that returns the matching options in that range.
+            page_size: The number of options fetched per request.
+            create_select: The function creating the select from this state.
+            **props: The properties of the select, as in VirtualSelect.create.
+
+        Returns:
+            The virtual select component.
+        """
+        cls._source = staticmethod(source)
+        cls._page_size = page_size
+        return create_select(options_state=cls, **props)
@@ -1,35 +1,35 @@
 """Convenience functions to define layout components."""
 
-from .aspect_ratio import AspectRatio
-from .box import Box
-from .card import Card, CardBody, CardFooter, CardHeader
-from .center import Center, Circle, Square
-from .container import Container
-from .flex import Flex
-from .grid import Grid, GridItem, ResponsiveGrid
-from .spacer import Spacer
-from .stack import Hstack, Stack, Vstack
-from .wrap import Wrap, WrapItem
+from reflex.utils import lazy_loader
 
-__all__ = [
-    "AspectRatio",
-    "Box",
-    "Card",
-    "CardBody",
-    "CardFooter",
-    "CardHeader",
-    "Center",
-    "Circle",
-    "Container",
-    "Flex",
-    "Grid",
-    "GridItem",
-    "Hstack",
-    "ResponsiveGrid",
-    "Spacer",
-    "Square",
-    "Stack",
-    "Vstack",
-    "Wrap",
-    "WrapItem",
-]
+_SUBMODULES: set[str] = {
+    "aspect_ratio",
+    "box",
+    "card",
+    "center",
+    "container",
+    "flex",
+    "grid",
+    "spacer",
+    "stack",
+    "wrap",
+}
+
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "aspect_ratio": ["AspectRatio"],
+    "box": ["Box"],
+    "card": ["Card", "CardBody", "CardFooter", "CardHeader"],
+    "center": ["Center", "Circle", "Square"],
+    "container": ["Container"],
+    "flex": ["Flex"],
+    "grid": ["Grid", "GridItem", "ResponsiveGrid"],
+    "spacer": ["Spacer"],
+    "stack": ["Hstack", "Stack", "Vstack"],
+    "wrap": ["Wrap", "WrapItem"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
@@ -0,0 +1,60 @@
+"""Stub file for reflex_chakra/components/layout/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import (
+    aspect_ratio,
+    box,
+    card,
+    center,
+    container,
+    flex,
+    grid,
+    spacer,
+    stack,
+    wrap,
+)
+from .aspect_ratio import AspectRatio
+from .box import Box
+from .card import Card, CardBody, CardFooter, CardHeader
+from .center import Center, Circle, Square
+from .container import Container
+from .flex import Flex
+from .grid import Grid, GridItem, ResponsiveGrid
+from .spacer import Spacer
+from .stack import Hstack, Stack, Vstack
+from .wrap import Wrap, WrapItem
+
+__all__ = [
+    "AspectRatio",
+    "Box",
+    "Card",
+    "CardBody",
+    "CardFooter",
+    "CardHeader",
+    "Center",
+    "Circle",
+    "Container",
+    "Flex",
+    "Grid",
+    "GridItem",
+    "Hstack",
+    "ResponsiveGrid",
+    "Spacer",
+    "Square",
+    "Stack",
+    "Vstack",
+    "Wrap",
+    "WrapItem",
+    "aspect_ratio",
+    "box",
+    "card",
+    "center",
+    "container",
+    "flex",
+    "grid",
+    "spacer",
+    "stack",
+    "wrap",
+]
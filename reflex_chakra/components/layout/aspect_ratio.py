@@ -12,3 +12,6 @@ class AspectRatio(ChakraComponent):
 
     # The aspect ratio of the Box
     ratio: Var[float]
+
+
+aspect_ratio = AspectRatio.create
@@ -69,3 +69,5 @@ class AspectRatio(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+aspect_ratio = AspectRatio.create
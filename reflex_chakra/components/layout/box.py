@@ -30,3 +30,6 @@ class Box(ChakraComponent):
                 }
             )
         )
+
+
+box = Box.create
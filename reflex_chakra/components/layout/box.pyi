@@ -73,3 +73,5 @@ class Box(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+box = Box.create
@@ -98,3 +98,9 @@ class Card(ChakraComponent):
                 children.append(component_class.create(param))
 
         return super().create(*children, **props)
+
+
+card = Card.create
+card_body = CardBody.create
+card_footer = CardFooter.create
+card_header = CardHeader.create
@@ -277,3 +277,8 @@ class Card(ChakraComponent):
         Returns:
             The `create()` method returns a Card object.
         """
+
+card = Card.create
+card_body = CardBody.create
+card_footer = CardFooter.create
+card_header = CardHeader.create
@@ -19,3 +19,8 @@ class Circle(ChakraComponent):
     """A square container with round border-radius."""
 
     tag = "Circle"
+
+
+center = Center.create
+circle = Circle.create
+square = Square.create
@@ -169,3 +169,7 @@ class Circle(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+center = Center.create
+circle = Circle.create
+square = Square.create
@@ -12,3 +12,6 @@ class Container(ChakraComponent):
 
     # If true, container will center its children regardless of their width.
     center_content: Var[bool]
+
+
+container = Container.create
@@ -69,3 +69,5 @@ class Container(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+container = Container.create
@@ -30,3 +30,6 @@ class Flex(ChakraComponent):
 
     # Shorthand for flexShrink style prop
     shrink: Var[str]
+
+
+flex = Flex.create
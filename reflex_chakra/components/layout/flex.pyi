@@ -81,3 +81,5 @@ class Flex(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+flex = Flex.create
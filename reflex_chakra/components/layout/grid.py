@@ -122,3 +122,8 @@ class ResponsiveGrid(ChakraComponent):
     # Shorthand prop for gridTemplateRows.
     # Learn more _[here](https://developer.mozilla.org/en-US/docs/Web/CSS/grid-template-rows)_
     template_rows: Var[str]
+
+
+grid = Grid.create
+grid_item = GridItem.create
+responsive_grid = ResponsiveGrid.create
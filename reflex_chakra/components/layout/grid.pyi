@@ -223,3 +223,7 @@ class ResponsiveGrid(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+grid = Grid.create
+grid_item = GridItem.create
+responsive_grid = ResponsiveGrid.create
@@ -7,3 +7,6 @@ class Spacer(ChakraComponent):
     """A flexible space component."""
 
     tag = "Spacer"
+
+
+spacer = Spacer.create
@@ -67,3 +67,5 @@ class Spacer(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+spacer = Spacer.create
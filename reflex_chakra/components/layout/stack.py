@@ -45,3 +45,8 @@ class Vstack(Stack):
     """Stack items vertically."""
 
     tag = "VStack"
+
+
+hstack = Hstack.create
+stack = Stack.create
+vstack = Vstack.create
@@ -227,3 +227,7 @@ class Vstack(Stack):
         Returns:
             A new Chakra component.
         """
+
+hstack = Hstack.create
+stack = Stack.create
+vstack = Vstack.create
@@ -56,3 +56,7 @@ class WrapItem(ChakraComponent):
     """Item of the Wrap component."""
 
     tag = "WrapItem"
+
+
+wrap = Wrap.create
+wrap_item = WrapItem.create
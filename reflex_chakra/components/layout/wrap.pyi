@@ -134,3 +134,6 @@ class WrapItem(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+wrap = Wrap.create
+wrap_item = WrapItem.create
@@ -1,13 +1,17 @@
 """Media components."""
 
-from .avatar import Avatar, AvatarBadge, AvatarGroup
-from .icon import Icon
-from .image import Image
-
-__all__ = [
-    "Avatar",
-    "AvatarBadge",
-    "AvatarGroup",
-    "Icon",
-    "Image",
-]
+from reflex.utils import lazy_loader
+
+_SUBMODULES: set[str] = {"avatar", "icon", "image"}
+
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "avatar": ["Avatar", "AvatarBadge", "AvatarGroup"],
+    "icon": ["Icon"],
+    "image": ["Image"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
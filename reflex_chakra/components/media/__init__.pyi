@@ -0,0 +1,20 @@
+"""Stub file for reflex_chakra/components/media/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import avatar, icon, image
+from .avatar import Avatar, AvatarBadge, AvatarGroup
+from .icon import Icon
+from .image import Image
+
+__all__ = [
+    "Avatar",
+    "AvatarBadge",
+    "AvatarGroup",
+    "Icon",
+    "Image",
+    "avatar",
+    "icon",
+    "image",
+]
@@ -57,3 +57,8 @@ class AvatarGroup(ChakraComponent):
 
     # The space between the avatars in the group.
     spacing: Var[int]
+
+
+avatar = Avatar.create
+avatar_badge = AvatarBadge.create
+avatar_group = AvatarGroup.create
@@ -194,3 +194,7 @@ class AvatarGroup(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+avatar = Avatar.create
+avatar_badge = AvatarBadge.create
+avatar_group = AvatarGroup.create
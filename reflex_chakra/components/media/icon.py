@@ -1,5 +1,8 @@
 """An icon component."""
 
+import difflib
+
+from reflex.components.component import Component
 from reflex.utils import format
 
 from reflex_chakra.components.base import ChakraComponent
@@ -11,6 +14,30 @@ class ChakraIconComponent(ChakraComponent):
     library = "@chakra-ui/icons@2.0.19"
 
 
+def get_icon_names(component: Component) -> list[str]:
+    """Get the icons imported by a component tree, e.g. the icons of a page.
+
+    Each icon is imported on its own from @chakra-ui/icons, so these are the only icons
+    the page bundle pulls from the library.
+
+    Args:
+        component: The root of the component tree.
+
+    Returns:
+        The sorted names of the icons, e.g. `["arrow_back", "sun"]`.
+    """
+    icon_imports = component._get_all_imports().get(
+        ChakraIconComponent.library or "", []
+    )
+    return sorted(
+        {
+            _ICON_NAMES_BY_TAG[imp.tag]
+            for imp in icon_imports
+            if imp.tag in _ICON_NAMES_BY_TAG
+        }
+    )
+
+
 class Icon(ChakraIconComponent):
     """An image icon."""
 
@@ -39,13 +66,49 @@ class Icon(ChakraIconComponent):
         if "tag" not in props:
             msg = "Missing 'tag' keyword-argument for Icon"
             raise AttributeError(msg)
-        if not isinstance(props["tag"], str) or props["tag"].lower() not in ICON_LIST:
-            msg = f"Invalid icon tag: {props['tag']}. Please use one of the following: {sorted(ICON_LIST)}"
+        tag = props["tag"]
+        if not isinstance(tag, str) or tag.lower() not in ICON_NAMES:
+            msg = f"Invalid icon tag: {tag}.{_suggest_icons(tag)} Please use one of the following: {_SORTED_ICON_LIST}"
             raise ValueError(msg)
-        props["tag"] = format.to_title_case(props["tag"]) + "Icon"
+        props["tag"] = ICON_TAGS[tag.lower()]
         return super().create(*children, **props)
 
 
+def _compact_icon_name(name: str) -> str:
+    """Normalize an icon name for fuzzy matching.
+
+    Args:
+        name: The icon name, e.g. `arrow_back`, `ArrowBack` or `ArrowBackIcon`.
+
+    Returns:
+        The lowercase name without separators or `Icon` suffix, e.g. `arrowback`.
+    """
+    name = name.lower().replace("_", "").replace("-", "").replace(" ", "")
+    return name.removesuffix("icon") or name
+
+
+def _suggest_icons(tag) -> str:
+    """Suggest the icons closest to an invalid tag.
+
+    Args:
+        tag: The invalid tag.
+
+    Returns:
+        A sentence naming the closest icons, or an empty string.
+    """
+    if not isinstance(tag, str):
+        return ""
+    compact = _compact_icon_name(tag)
+    if compact in _ICON_SUGGESTIONS:
+        matches = [_ICON_SUGGESTIONS[compact]]
+    else:
+        matches = [
+            _ICON_SUGGESTIONS[match]
+            for match in difflib.get_close_matches(compact, _ICON_SUGGESTIONS, n=3)
+        ]
+    return f" Did you mean {', '.join(map(repr, matches))}?" if matches else ""
+
+
 # List of all icons.
 ICON_LIST: list[str] = [
     "add",
@@ -107,3 +170,23 @@ ICON_LIST: list[str] = [
     "warning",
     "warning_two",
 ]
+
+# The icon names, for membership checks.
+ICON_NAMES: frozenset[str] = frozenset(ICON_LIST)
+
+# The @chakra-ui/icons export of each icon name, e.g. `arrow_back` -> `ArrowBackIcon`.
+ICON_TAGS: dict[str, str] = {
+    name: format.to_title_case(name) + "Icon" for name in ICON_LIST
+}
+
+# The icon names by their compact form, to suggest icons for invalid tags.
+_ICON_SUGGESTIONS: dict[str, str] = {
+    _compact_icon_name(name): name for name in ICON_LIST
+}
+
+_SORTED_ICON_LIST: list[str] = sorted(ICON_LIST)
+
+_ICON_NAMES_BY_TAG: dict[str, str] = {tag: name for name, tag in ICON_TAGS.items()}
+
+
+icon = Icon.create
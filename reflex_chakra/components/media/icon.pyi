@@ -8,6 +8,7 @@ from typing import (
     Any,
 )
 
+from reflex.components.component import Component
 from reflex.components.core.breakpoints import Breakpoints
 from reflex.event import (
     EventType,
@@ -68,6 +69,8 @@ class ChakraIconComponent(ChakraComponent):
             A new Chakra component.
         """
 
+def get_icon_names(component: Component) -> list[str]: ...
+
 class Icon(ChakraIconComponent):
     @classmethod
     def create(
@@ -126,3 +129,6 @@ class Icon(ChakraIconComponent):
         """
 
 ICON_LIST: list[str]
+ICON_NAMES: frozenset[str]
+ICON_TAGS: dict[str, str]
+icon = Icon.create
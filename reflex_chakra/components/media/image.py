@@ -57,3 +57,6 @@ class Image(ChakraComponent):
 
     # Fired when the image is loaded.
     on_load: EventHandler[no_args_event_spec]
+
+
+image = Image.create
@@ -95,3 +95,5 @@ class Image(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+image = Image.create
@@ -1,35 +1,33 @@
 """Navigation components."""
 
-from .breadcrumb import Breadcrumb, BreadcrumbItem, BreadcrumbLink, BreadcrumbSeparator
-from .link import Link
-from .linkoverlay import LinkBox, LinkOverlay
-from .stepper import (
-    Step,
-    StepDescription,
-    StepIcon,
-    StepIndicator,
-    StepNumber,
-    Stepper,
-    StepSeparator,
-    StepStatus,
-    StepTitle,
-)
+from reflex.utils import lazy_loader
+
+_SUBMODULES: set[str] = {"breadcrumb", "link", "linkoverlay", "stepper"}
 
-__all__ = [
-    "Breadcrumb",
-    "BreadcrumbItem",
-    "BreadcrumbLink",
-    "BreadcrumbSeparator",
-    "Link",
-    "LinkBox",
-    "LinkOverlay",
-    "Step",
-    "StepDescription",
-    "StepIcon",
-    "StepIndicator",
-    "StepNumber",
-    "StepSeparator",
-    "StepStatus",
-    "StepTitle",
-    "Stepper",
-]
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "breadcrumb": [
+        "Breadcrumb",
+        "BreadcrumbItem",
+        "BreadcrumbLink",
+        "BreadcrumbSeparator",
+    ],
+    "link": ["Link"],
+    "linkoverlay": ["LinkBox", "LinkOverlay"],
+    "stepper": [
+        "Step",
+        "StepDescription",
+        "StepIcon",
+        "StepIndicator",
+        "StepNumber",
+        "StepSeparator",
+        "StepStatus",
+        "StepTitle",
+        "Stepper",
+    ],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
@@ -0,0 +1,43 @@
+"""Stub file for reflex_chakra/components/navigation/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import breadcrumb, link, linkoverlay, stepper
+from .breadcrumb import Breadcrumb, BreadcrumbItem, BreadcrumbLink, BreadcrumbSeparator
+from .link import Link
+from .linkoverlay import LinkBox, LinkOverlay
+from .stepper import (
+    Step,
+    StepDescription,
+    StepIcon,
+    StepIndicator,
+    StepNumber,
+    Stepper,
+    StepSeparator,
+    StepStatus,
+    StepTitle,
+)
+
+__all__ = [
+    "Breadcrumb",
+    "BreadcrumbItem",
+    "BreadcrumbLink",
+    "BreadcrumbSeparator",
+    "Link",
+    "LinkBox",
+    "LinkOverlay",
+    "Step",
+    "StepDescription",
+    "StepIcon",
+    "StepIndicator",
+    "StepNumber",
+    "StepSeparator",
+    "StepStatus",
+    "StepTitle",
+    "Stepper",
+    "breadcrumb",
+    "link",
+    "linkoverlay",
+    "stepper",
+]
@@ -97,3 +97,9 @@ class BreadcrumbLink(Link):
 
     # Is the current page of the breadcrumb.
     is_current_page: Var[bool]
+
+
+breadcrumb = Breadcrumb.create
+breadcrumb_item = BreadcrumbItem.create
+breadcrumb_link = BreadcrumbLink.create
+breadcrumb_separator = BreadcrumbSeparator.create
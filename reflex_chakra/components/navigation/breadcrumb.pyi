@@ -257,3 +257,8 @@ class BreadcrumbLink(Link):
         Returns:
             Component: The link component
         """
+
+breadcrumb = Breadcrumb.create
+breadcrumb_item = BreadcrumbItem.create
+breadcrumb_link = BreadcrumbLink.create
+breadcrumb_separator = BreadcrumbSeparator.create
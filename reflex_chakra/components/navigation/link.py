@@ -60,3 +60,6 @@ class Link(ChakraComponent):
             # Don't use a NextLink if there is no href.
             props["as_"] = ""
         return super().create(*children, **props)
+
+
+link = Link.create
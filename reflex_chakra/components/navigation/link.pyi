@@ -83,3 +83,5 @@ class Link(ChakraComponent):
         Returns:
             Component: The link component
         """
+
+link = Link.create
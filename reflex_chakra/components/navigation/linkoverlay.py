@@ -21,3 +21,7 @@ class LinkBox(ChakraComponent):
     """The LinkBox lifts any nested links to the top using z-index to ensure proper keyboard navigation between links."""
 
     tag = "LinkBox"
+
+
+link_box = LinkBox.create
+link_overlay = LinkOverlay.create
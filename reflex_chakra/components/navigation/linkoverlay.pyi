@@ -122,3 +122,6 @@ class LinkBox(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+link_box = LinkBox.create
+link_overlay = LinkOverlay.create
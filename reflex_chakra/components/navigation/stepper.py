@@ -3,6 +3,7 @@
 from typing import Literal
 
 from reflex.components.component import Component
+from reflex.components.core.foreach import Foreach
 from reflex.vars.base import Var
 
 from reflex_chakra.components import ChakraComponent, LiteralColorScheme
@@ -29,29 +30,38 @@ class Stepper(ChakraComponent):
     size: Var[str]
 
     @classmethod
-    def create(cls, *children, items: list[tuple] | None = None, **props) -> Component:
+    def create(
+        cls, *children, items: Var[list[tuple]] | list[tuple] | None = None, **props
+    ) -> Component:
         """Create a Stepper component.
 
         If the kw-args `items` is provided and is a list, they will be added as children.
 
         Args:
             *children: The children of the component.
-            items (list): The child components for each step.
+            items (list): The child components for each step: tuples (indicator, layout, separator), or a Var of such a list rendered with a single foreach.
             **props: The properties of the component.
 
         Returns:
             The stepper component.
         """
         if len(children) == 0:
-            children = []
-            for indicator, layout, separator in items or []:
-                children.append(
-                    Step.create(
-                        StepIndicator.create(indicator),
-                        layout,
-                        StepSeparator.create(separator),
-                    )
+
+            def create_step(indicator, layout, separator) -> Component:
+                return Step.create(
+                    StepIndicator.create(indicator),
+                    layout,
+                    StepSeparator.create(separator),
                 )
+
+            if isinstance(items, Var):
+                children = [
+                    Foreach.create(
+                        items, lambda item: create_step(item[0], item[1], item[2])
+                    )
+                ]
+            else:
+                children = [create_step(*item) for item in items or []]
         return super().create(*children, **props)
 
 
@@ -110,3 +120,14 @@ class StepTitle(ChakraComponent):
     """The title text for a step component."""
 
     tag = "StepTitle"
+
+
+step = Step.create
+step_description = StepDescription.create
+step_icon = StepIcon.create
+step_indicator = StepIndicator.create
+step_number = StepNumber.create
+step_separator = StepSeparator.create
+step_status = StepStatus.create
+step_title = StepTitle.create
+stepper = Stepper.create
@@ -23,7 +23,7 @@ class Stepper(ChakraComponent):
     def create(
         cls,
         *children,
-        items: list[tuple] | None = None,
+        items: Var[list[tuple]] | list[tuple] | None = None,
         orientation: Literal["horizontal", "vertical"]
         | Var[Literal["horizontal", "vertical"]]
         | None = None,
@@ -109,7 +109,7 @@ class Stepper(ChakraComponent):
 
         Args:
             *children: The children of the component.
-            items (list): The child components for each step.
+            items (list): The child components for each step: tuples (indicator, layout, separator), or a Var of such a list rendered with a single foreach.
             orientation: The orientation of Stepper: 'vertical' | 'horizontal'. Default: 'horizontal'
             colorScheme: The color scheme to use for the stepper; default is blue.
             index: The index of the current step.
@@ -540,3 +540,13 @@ class StepTitle(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+step = Step.create
+step_description = StepDescription.create
+step_icon = StepIcon.create
+step_indicator = StepIndicator.create
+step_number = StepNumber.create
+step_separator = StepSeparator.create
+step_status = StepStatus.create
+step_title = StepTitle.create
+stepper = Stepper.create
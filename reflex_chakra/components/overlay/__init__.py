@@ -1,91 +1,62 @@
 """Overlay components."""
 
-from .alertdialog import (
-    AlertDialog,
-    AlertDialogBody,
-    AlertDialogContent,
-    AlertDialogFooter,
-    AlertDialogHeader,
-    AlertDialogOverlay,
-)
-from .drawer import (
-    Drawer,
-    DrawerBody,
-    DrawerCloseButton,
-    DrawerContent,
-    DrawerFooter,
-    DrawerHeader,
-    DrawerOverlay,
-)
-from .menu import (
-    Menu,
-    MenuButton,
-    MenuDivider,
-    MenuGroup,
-    MenuItem,
-    MenuItemOption,
-    MenuList,
-    MenuOptionGroup,
-)
-from .modal import (
-    Modal,
-    ModalBody,
-    ModalCloseButton,
-    ModalContent,
-    ModalFooter,
-    ModalHeader,
-    ModalOverlay,
-)
-from .popover import (
-    Popover,
-    PopoverAnchor,
-    PopoverArrow,
-    PopoverBody,
-    PopoverCloseButton,
-    PopoverContent,
-    PopoverFooter,
-    PopoverHeader,
-    PopoverTrigger,
-)
-from .tooltip import Tooltip
+from reflex.utils import lazy_loader
+
+_SUBMODULES: set[str] = {"alertdialog", "drawer", "menu", "modal", "popover", "tooltip"}
 
-__all__ = [
-    "AlertDialog",
-    "AlertDialogBody",
-    "AlertDialogContent",
-    "AlertDialogFooter",
-    "AlertDialogHeader",
-    "AlertDialogOverlay",
-    "Drawer",
-    "DrawerBody",
-    "DrawerCloseButton",
-    "DrawerContent",
-    "DrawerFooter",
-    "DrawerHeader",
-    "DrawerOverlay",
-    "Menu",
-    "MenuButton",
-    "MenuDivider",
-    "MenuGroup",
-    "MenuItem",
-    "MenuItemOption",
-    "MenuList",
-    "MenuOptionGroup",
-    "Modal",
-    "ModalBody",
-    "ModalCloseButton",
-    "ModalContent",
-    "ModalFooter",
-    "ModalHeader",
-    "ModalOverlay",
-    "Popover",
-    "PopoverAnchor",
-    "PopoverArrow",
-    "PopoverBody",
-    "PopoverCloseButton",
-    "PopoverContent",
-    "PopoverFooter",
-    "PopoverHeader",
-    "PopoverTrigger",
-    "Tooltip",
-]
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "alertdialog": [
+        "AlertDialog",
+        "AlertDialogBody",
+        "AlertDialogContent",
+        "AlertDialogFooter",
+        "AlertDialogHeader",
+        "AlertDialogOverlay",
+    ],
+    "drawer": [
+        "Drawer",
+        "DrawerBody",
+        "DrawerCloseButton",
+        "DrawerContent",
+        "DrawerFooter",
+        "DrawerHeader",
+        "DrawerOverlay",
+    ],
+    "menu": [
+        "Menu",
+        "MenuButton",
+        "MenuDivider",
+        "MenuGroup",
+        "MenuItem",
+        "MenuItemOption",
+        "MenuList",
+        "MenuOptionGroup",
+    ],
+    "modal": [
+        "Modal",
+        "ModalBody",
+        "ModalCloseButton",
+        "ModalContent",
+        "ModalFooter",
+        "ModalHeader",
+        "ModalOverlay",
+    ],
+    "popover": [
+        "Popover",
+        "PopoverAnchor",
+        "PopoverArrow",
+        "PopoverBody",
+        "PopoverCloseButton",
+        "PopoverContent",
+        "PopoverFooter",
+        "PopoverHeader",
+        "PopoverTrigger",
+    ],
+    "tooltip": ["Tooltip"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
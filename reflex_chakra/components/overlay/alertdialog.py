@@ -151,3 +151,11 @@ class AlertDialogCloseButton(ChakraComponent):
     """The button that closes the dialog."""
 
     tag = "AlertDialogCloseButton"
+
+
+alert_dialog = AlertDialog.create
+alert_dialog_body = AlertDialogBody.create
+alert_dialog_content = AlertDialogContent.create
+alert_dialog_footer = AlertDialogFooter.create
+alert_dialog_header = AlertDialogHeader.create
+alert_dialog_overlay = AlertDialogOverlay.create
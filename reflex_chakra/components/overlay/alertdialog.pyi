@@ -423,3 +423,10 @@ class AlertDialogCloseButton(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+alert_dialog = AlertDialog.create
+alert_dialog_body = AlertDialogBody.create
+alert_dialog_content = AlertDialogContent.create
+alert_dialog_footer = AlertDialogFooter.create
+alert_dialog_header = AlertDialogHeader.create
+alert_dialog_overlay = AlertDialogOverlay.create
@@ -166,3 +166,12 @@ class DrawerCloseButton(ChakraComponent):
     """Drawer close button."""
 
     tag = "DrawerCloseButton"
+
+
+drawer = Drawer.create
+drawer_body = DrawerBody.create
+drawer_close_button = DrawerCloseButton.create
+drawer_content = DrawerContent.create
+drawer_footer = DrawerFooter.create
+drawer_header = DrawerHeader.create
+drawer_overlay = DrawerOverlay.create
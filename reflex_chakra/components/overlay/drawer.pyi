@@ -473,3 +473,11 @@ class DrawerCloseButton(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+drawer = Drawer.create
+drawer_body = DrawerBody.create
+drawer_close_button = DrawerCloseButton.create
+drawer_content = DrawerContent.create
+drawer_footer = DrawerFooter.create
+drawer_header = DrawerHeader.create
+drawer_overlay = DrawerOverlay.create
@@ -224,3 +224,13 @@ class MenuDivider(ChakraComponent):
     """A visual separator for menu items and groups."""
 
     tag = "MenuDivider"
+
+
+menu = Menu.create
+menu_button = MenuButton.create
+menu_divider = MenuDivider.create
+menu_group = MenuGroup.create
+menu_item = MenuItem.create
+menu_item_option = MenuItemOption.create
+menu_list = MenuList.create
+menu_option_group = MenuOptionGroup.create
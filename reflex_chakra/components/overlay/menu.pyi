@@ -510,3 +510,12 @@ class MenuDivider(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+menu = Menu.create
+menu_button = MenuButton.create
+menu_divider = MenuDivider.create
+menu_group = MenuGroup.create
+menu_item = MenuItem.create
+menu_item_option = MenuItemOption.create
+menu_list = MenuList.create
+menu_option_group = MenuOptionGroup.create
@@ -164,3 +164,12 @@ class ModalCloseButton(ChakraComponent):
     """The button that closes the modal."""
 
     tag = "ModalCloseButton"
+
+
+modal = Modal.create
+modal_body = ModalBody.create
+modal_close_button = ModalCloseButton.create
+modal_content = ModalContent.create
+modal_footer = ModalFooter.create
+modal_header = ModalHeader.create
+modal_overlay = ModalOverlay.create
@@ -425,3 +425,11 @@ class ModalCloseButton(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+modal = Modal.create
+modal_body = ModalBody.create
+modal_close_button = ModalCloseButton.create
+modal_content = ModalContent.create
+modal_footer = ModalFooter.create
+modal_header = ModalHeader.create
+modal_overlay = ModalOverlay.create
@@ -182,3 +182,14 @@ class PopoverTrigger(ChakraComponent):
     """Used to wrap the reference (or trigger) element."""
 
     tag = "PopoverTrigger"
+
+
+popover = Popover.create
+popover_anchor = PopoverAnchor.create
+popover_arrow = PopoverArrow.create
+popover_body = PopoverBody.create
+popover_close_button = PopoverCloseButton.create
+popover_content = PopoverContent.create
+popover_footer = PopoverFooter.create
+popover_header = PopoverHeader.create
+popover_trigger = PopoverTrigger.create
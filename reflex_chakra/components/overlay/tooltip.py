@@ -69,3 +69,6 @@ class Tooltip(ChakraComponent):
 
     # Fired when the tooltip is opened.
     on_open: EventHandler[no_args_event_spec]
+
+
+tooltip = Tooltip.create
@@ -106,3 +106,5 @@ class Tooltip(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+tooltip = Tooltip.create
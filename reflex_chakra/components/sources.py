@@ -0,0 +1,90 @@
+"""Helpers shared by the components fed from a backend source."""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
+from typing import Any
+
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+
+
+async def fetch_items(
+    source: Callable[..., Any], *args: Any, limit: int
+) -> tuple[list, bool]:
+    """Fetch at most `limit` items from a source.
+
+    The source is called with `args` and a limit one above `limit`, to find out whether
+    it has more items. It may be sync or async, and return a list, any iterable or an
+    async iterable; an async generator is closed as soon as the items are read.
+
+    Args:
+        source: The source.
+        *args: The arguments of the source before the limit.
+        limit: The maximum number of items.
+
+    Returns:
+        The items, and whether they are the last items of the source.
+    """
+    result = source(*args, limit + 1)
+    if inspect.isawaitable(result):
+        result = await result
+    if isinstance(result, AsyncIterable):
+        items = []
+        try:
+            async for item in result:
+                items.append(item)
+                # stop without pulling an item past the extra one.
+                if len(items) > limit:
+                    break
+        finally:
+            # run the cleanup of the source (e.g. closing a cursor) right away.
+            if isinstance(result, AsyncGenerator):
+                await result.aclose()
+    else:
+        items = list(itertools.islice(result, limit + 1))
+    return items[:limit], len(items) <= limit
+
+
+def unique_names(prefix: str, *names: str) -> list[str]:
+    """Name the JS variables defined by the hooks of a component.
+
+    Args:
+        prefix: The prefix of the names, e.g. the kind of component.
+        *names: The names of the variables.
+
+    Returns:
+        The names, unique to this component.
+    """
+    name = f"{prefix}_{get_unique_variable_name()}"
+    return [f"{name}_{suffix}" for suffix in names]
+
+
+def next_request(ref: str) -> str:
+    """Give a new request id to a ref, as a JS statement.
+
+    Request ids start from the current time, so they keep growing when the page is
+    reloaded, and a backend handler can drop the requests older than the latest one.
+
+    Args:
+        ref: The name of the ref holding the request id.
+
+    Returns:
+        The JS statement.
+    """
+    return f"{ref}.current = Math.max({ref}.current + 1, Date.now());"
+
+
+def hook_var(var_data: VarData | None, js_expr: str, var_type: Any = object) -> Var:
+    """Refer to a JS expression using the variables defined by hooks.
+
+    Args:
+        var_data: The var data holding the hooks.
+        js_expr: The JS expression.
+        var_type: The type of the expression.
+
+    Returns:
+        The var.
+    """
+    return Var(_js_expr=js_expr, _var_type=var_type, _var_data=var_data)
@@ -1,8 +1,18 @@
 """Typography components."""
 
-from .heading import Heading
-from .highlight import Highlight
-from .span import Span
-from .text import Text
+from reflex.utils import lazy_loader
 
-__all__ = ["Heading", "Highlight", "Span", "Text"]
+_SUBMODULES: set[str] = {"heading", "highlight", "span", "text"}
+
+_SUBMOD_ATTRS: dict[str, list[str]] = {
+    "heading": ["Heading"],
+    "highlight": ["Highlight"],
+    "span": ["Span"],
+    "text": ["Text"],
+}
+
+__getattr__, __dir__, __all__ = lazy_loader.attach(
+    __name__,
+    submodules=_SUBMODULES,
+    submod_attrs=_SUBMOD_ATTRS,
+)
@@ -0,0 +1,21 @@
+"""Stub file for reflex_chakra/components/typography/__init__.py"""
+# ------------------- DO NOT EDIT ----------------------
+# This file was generated by `reflex/utils/pyi_generator.py`!
+# ------------------------------------------------------
+
+from . import heading, highlight, span, text
+from .heading import Heading
+from .highlight import Highlight
+from .span import Span
+from .text import Text
+
+__all__ = [
+    "Heading",
+    "Highlight",
+    "Span",
+    "Text",
+    "heading",
+    "highlight",
+    "span",
+    "text",
+]
@@ -15,3 +15,6 @@ class Heading(ChakraComponent):
 
     # "4xl" | "3xl" | "2xl" | "xl" | "lg" | "md" | "sm" | "xs"
     size: Var[LiteralHeadingSize]
+
+
+heading = Heading.create
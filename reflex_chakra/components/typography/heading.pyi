@@ -74,3 +74,5 @@ class Heading(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+heading = Heading.create
@@ -22,3 +22,6 @@ class Highlight(ChakraComponent):
 
     def _render(self) -> Tag:
         return super()._render().add_props(styles=self.style)
+
+
+highlight = Highlight.create
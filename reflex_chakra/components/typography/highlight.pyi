@@ -71,3 +71,5 @@ class Highlight(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+highlight = Highlight.create
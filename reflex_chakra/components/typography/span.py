@@ -14,3 +14,6 @@ class Span(ChakraComponent):
 
     # Override the tag. The default tag is `<span>`.
     as_: Var[str] = Var.create("span")
+
+
+span = Span.create
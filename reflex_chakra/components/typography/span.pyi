@@ -69,3 +69,5 @@ class Span(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+span = Span.create
@@ -17,3 +17,6 @@ class Text(ChakraComponent):
 
     # Truncate text after a specific number of lines. It will render an ellipsis when the text exceeds the width of the viewport or max_width prop.
     no_of_lines: Var[int]
+
+
+text = Text.create
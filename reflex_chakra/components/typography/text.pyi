@@ -71,3 +71,5 @@ class Text(ChakraComponent):
         Returns:
             A new Chakra component.
         """
+
+text = Text.create
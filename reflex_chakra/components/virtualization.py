@@ -0,0 +1,159 @@
+"""Client-side windowing for components that render long lists through Foreach."""
+
+from __future__ import annotations
+
+from reflex.vars.base import Var, VarData, get_unique_variable_name
+from reflex.vars.number import NumberVar
+from reflex.vars.sequence import ArrayVar
+
+
+class VirtualWindow:
+    """The visible window of a list, tracked in the browser.
+
+    The window follows the scroll position of the nearest scrollable ancestor of the
+    element holding `ref` (or the page), and only the items inside the window plus
+    `overscan` items on each side are rendered. The space of the items that are not
+    rendered is reserved with `space_before` and `space_after`, so the scrollbar
+    behaves as if every item was in the DOM.
+    """
+
+    def __init__(
+        self,
+        items: Var | list | tuple,
+        item_height: int = 40,
+        overscan: int = 10,
+        measure: bool = False,
+    ):
+        """Create a window over the items.
+
+        Args:
+            items: The items to window, either a Var or a literal list.
+            item_height: The height of an item in pixels, used as an estimate when measuring.
+            overscan: The number of items rendered above and below the visible ones.
+            measure: If true, the item height is measured from the rendered items.
+        """
+        items = Var.create(items)
+        if not isinstance(items, ArrayVar):
+            items = items.to(ArrayVar, items._var_type)
+        name = f"window_{get_unique_variable_name()}"
+        self._ref = f"{name}_ref"
+        self._start = f"{name}_start"
+        self._end = f"{name}_end"
+        self._item_height = f"{name}_item_height"
+
+        # alias the items so a literal list is only rendered once in the page.
+        items_name = f"{name}_items"
+        self._length = length = f"{items_name}.length"
+        hooks = [
+            f"const {items_name} = {items!s};"
+            if items._get_all_var_data()
+            else f"const {items_name} = useMemo(() => {items!s}, []);",
+            f"const {self._ref} = useRef(null);",
+            f"const [{self._item_height}, set_{self._item_height}] = useState({item_height});",
+            # the first render may run without a window (prerendering), so the window is
+            # sized on mount; the end is clamped like in update below, so it only changes
+            # when the window moves.
+            f"const [[{self._start}, {self._end}], set_{name}] = useState(() => [0, Math.min({length}, {overscan})]);",
+            f"""useEffect(() => {{
+    const node = {self._ref}.current;
+    if (!node) return;
+    let scroller = node.parentElement;
+    while (scroller && !/(auto|scroll)/.test(getComputedStyle(scroller).overflowY)) {{
+        scroller = scroller.parentElement;
+    }}
+    const target = scroller ?? window;
+    const update = () => {{
+        const viewport = scroller ? scroller.getBoundingClientRect() : {{ top: 0, height: window.innerHeight }};
+        const offset = viewport.top - node.getBoundingClientRect().top;
+        const start = Math.min({length}, Math.max(0, Math.floor(offset / {self._item_height}) - {overscan}));
+        const end = Math.min({length}, Math.ceil((offset + viewport.height) / {self._item_height}) + {overscan});
+        set_{name}((range) => (range[0] === start && range[1] === end ? range : [start, end]));
+    }};
+    update();
+    target.addEventListener("scroll", update, {{ passive: true }});
+    window.addEventListener("resize", update);
+    return () => {{
+        target.removeEventListener("scroll", update);
+        window.removeEventListener("resize", update);
+    }};
+}}, [{length}, {self._item_height}]);""",
+        ]
+        if measure:
+            hooks.append(
+                f"""useEffect(() => {{
+    const node = {self._ref}.current;
+    const rendered = Math.min({self._end}, {length}) - {self._start};
+    if (!node || rendered <= 0) return;
+    const measured = (node.offsetHeight - ({length} - rendered) * {self._item_height}) / rendered;
+    if (measured > 0 && Math.abs(measured - {self._item_height}) >= 1) set_{self._item_height}(measured);
+}}, [{self._start}, {self._end}, {length}]);"""
+            )
+        self._var_data = VarData.merge(
+            items._get_all_var_data(),
+            VarData(
+                imports={"react": ["useEffect", "useMemo", "useRef", "useState"]},
+                hooks=dict.fromkeys(hooks),
+            ),
+        )
+
+        self.all_items = self._var(items_name).to(ArrayVar, items._var_type)
+
+    def _var(self, js_expr: str, var_type: type = int) -> Var:
+        return Var(_js_expr=js_expr, _var_type=var_type, _var_data=self._var_data)
+
+    @property
+    def ref(self) -> Var:
+        """The ref to attach to the element wrapping the rendered items.
+
+        Returns:
+            The ref var.
+        """
+        return self._var(self._ref, object)
+
+    @property
+    def start(self) -> NumberVar:
+        """The index of the first rendered item.
+
+        Returns:
+            The start index var.
+        """
+        return self._var(self._start).to(int)
+
+    @property
+    def end(self) -> NumberVar:
+        """The index after the last rendered item.
+
+        Returns:
+            The end index var.
+        """
+        return self._var(self._end).to(int)
+
+    @property
+    def items(self) -> ArrayVar:
+        """The items to render.
+
+        Returns:
+            The slice of the items inside the window.
+        """
+        return self.all_items[self.start : self.end]
+
+    @property
+    def space_before(self) -> Var:
+        """The CSS height reserved for the items before the window.
+
+        Returns:
+            The height var.
+        """
+        return self._var(f"`${{{self._start} * {self._item_height}}}px`", str)
+
+    @property
+    def space_after(self) -> Var:
+        """The CSS height reserved for the items after the window.
+
+        Returns:
+            The height var.
+        """
+        return self._var(
+            f"`${{Math.max(0, {self._length} - {self._end}) * {self._item_height}}}px`",
+            str,
+        )